@@ -0,0 +1,75 @@
+"""
+Compare the throughput of ConcurrentHashMap with a HashMap behind a single lock
+as the number of threads grows
+
+Every thread inserts and then reads back its own range of keys in one shared map.
+Threads only run in parallel on free-threaded CPython builds (python3.13t and later),
+with the GIL both maps are limited to one core.
+
+Run from the repository root:
+    python -m benchmarks.concurrent_hashmap_benchmark [operations per thread]
+"""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.data_structures.ConcurrentHashMap import ConcurrentHashMap
+from src.data_structures.HashMap import HashMap
+
+DEFAULT_OPERATIONS = 20_000
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+class LockedHashMap:
+    """HashMap guarded by one lock, the baseline for ConcurrentHashMap"""
+
+    def __init__(self) -> None:
+        self._map = HashMap()
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._map[key] = value
+
+    def get(self, key):
+        with self._lock:
+            return self._map.get(key)
+
+
+def throughput(map_class, threads: int, operations: int) -> float:
+    hash_map = map_class()
+    barrier = threading.Barrier(threads)
+
+    def worker(thread: int) -> None:
+        keys = [f"{thread}-{i}" for i in range(operations)]
+        barrier.wait()
+        for key in keys:
+            hash_map[key] = key
+        for key in keys:
+            hash_map.get(key)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+
+    return 2 * threads * operations / elapsed
+
+
+def main(operations: int = DEFAULT_OPERATIONS) -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"{operations} inserts and {operations} lookups per thread, "
+        f"GIL {'enabled' if is_gil_enabled else 'disabled'}"
+    )
+    print(f"{'threads':<10}{'LockedHashMap (op/s)':>24}{'ConcurrentHashMap (op/s)':>28}{'x':>8}")
+
+    for threads in THREAD_COUNTS:
+        locked = throughput(LockedHashMap, threads, operations)
+        concurrent = throughput(ConcurrentHashMap, threads, operations)
+        print(f"{threads:<10}{locked:>24,.0f}{concurrent:>28,.0f}{concurrent / locked:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OPERATIONS)
@@ -0,0 +1,109 @@
+"""
+Compare the insert and lookup speed of the hash map implementations,
+on string keys and on integer keys that share their low bits, of the
+HashMap batch operations (from_pairs and get_many), and of missing-key
+lookups in a HashMap with and without its Bloom filter
+
+Run from the repository root:
+    python -m benchmarks.hashmap_benchmark [size]
+"""
+import math
+import sys
+import time
+
+from src.data_structures.CompactHashMap import CompactHashMap
+from src.data_structures.CuckooHashMap import CuckooHashMap
+from src.data_structures.HashMap import HashMap
+from src.data_structures.OpenAddressingHashMap import OpenAddressingHashMap
+
+DEFAULT_SIZE = 100_000
+REPEATS = 3
+MAP_CLASSES = (HashMap, OpenAddressingHashMap, CompactHashMap, CuckooHashMap)
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+LOAD_FACTORS = (0.7, 4.0)
+# Integer keys i << ALIGNED_SHIFT all share their low bits. HashMap puts them in
+# a handful of buckets, which is quadratic, so this run stays small
+ALIGNED_SIZE = 8000
+ALIGNED_SHIFT = 20
+
+
+def _best_of(func) -> float:
+    best = math.inf
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(map_class, keys: list) -> tuple[float, float]:
+    def insert():
+        hash_map = map_class()
+        for key in keys:
+            hash_map[key] = key
+
+    hash_map = map_class()
+    for key in keys:
+        hash_map[key] = key
+
+    def lookup():
+        for key in keys:
+            hash_map.get(key)
+
+    return _best_of(insert), _best_of(lookup)
+
+
+def benchmark_bulk(keys: list) -> tuple[float, float]:
+    pairs = [(key, key) for key in keys]
+    hash_map = HashMap.from_pairs(pairs)
+
+    return _best_of(lambda: HashMap.from_pairs(pairs)), _best_of(lambda: hash_map.get_many(keys))
+
+
+def benchmark_misses(keys: list, missing: list, load_factor: float) -> tuple[float, float]:
+    pairs = [(key, key) for key in keys]
+    plain = HashMap.from_pairs(pairs, load_factor=load_factor)
+    filtered = HashMap.from_pairs(
+        pairs, load_factor=load_factor, bloom_false_positive_rate=BLOOM_FALSE_POSITIVE_RATE)
+
+    def lookup(hash_map):
+        for key in missing:
+            hash_map.get(key)
+
+    return _best_of(lambda: lookup(plain)), _best_of(lambda: lookup(filtered))
+
+
+def print_results(results: dict[str, tuple[float, float]]) -> None:
+    baseline_insert, baseline_lookup = results["HashMap"]
+    print(f"{'map':<24}{'insert (s)':>12}{'lookup (s)':>12}{'insert x':>10}{'lookup x':>10}")
+    for name, (insert_time, lookup_time) in results.items():
+        print(
+            f"{name:<24}{insert_time:>12.3f}{lookup_time:>12.3f}"
+            f"{baseline_insert / insert_time:>10.1f}{baseline_lookup / lookup_time:>10.1f}"
+        )
+
+
+def main(size: int = DEFAULT_SIZE) -> None:
+    keys = [f"key{i}" for i in range(size)]
+    results = {cls.__name__: benchmark(cls, keys) for cls in MAP_CLASSES}
+    results["HashMap.from_pairs"] = benchmark_bulk(keys)
+    print(f"{size} string keys, best of {REPEATS}")
+    print_results(results)
+
+    aligned = [i << ALIGNED_SHIFT for i in range(min(size, ALIGNED_SIZE))]
+    print(f"\n{len(aligned)} integer keys i << {ALIGNED_SHIFT}, best of {REPEATS}")
+    print_results({cls.__name__: benchmark(cls, aligned) for cls in MAP_CLASSES})
+
+    missing = [f"missing{i}" for i in range(size)]
+    print(f"\n{size} missing-key lookups, Bloom filter at {BLOOM_FALSE_POSITIVE_RATE:.0%}")
+    print(f"{'load factor':<24}{'HashMap (s)':>12}{'filtered (s)':>14}{'x':>8}")
+    for load_factor in LOAD_FACTORS:
+        plain_time, filtered_time = benchmark_misses(keys, missing, load_factor)
+        print(
+            f"{load_factor:<24}{plain_time:>12.3f}{filtered_time:>14.3f}"
+            f"{plain_time / filtered_time:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
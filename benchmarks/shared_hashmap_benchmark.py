@@ -0,0 +1,58 @@
+"""
+Compare handing a HashMap copy to every worker of a ProcessPoolExecutor with
+attaching the workers to one SharedHashMap
+
+Every worker receives the map as a task argument and looks up a slice of its keys.
+A HashMap is pickled whole and rebuilt in every worker, a SharedHashMap only sends
+the name of its shared memory block.
+
+Run from the repository root:
+    python -m benchmarks.shared_hashmap_benchmark [size]
+"""
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.data_structures.HashMap import HashMap
+from src.data_structures.SharedHashMap import SharedHashMap
+
+DEFAULT_SIZE = 200_000
+LOOKUPS = 1_000
+
+
+def lookup(hash_map, start: int) -> int:
+    return sum(hash_map[key] for key in range(start, start + LOOKUPS))
+
+
+def run(hash_map, workers: int, size: int) -> float:
+    starts = [i * (size - LOOKUPS) // workers for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # start the workers before timing
+        list(pool.map(abs, range(workers)))
+        start = time.perf_counter()
+        list(pool.map(lookup, [hash_map] * workers, starts))
+        return time.perf_counter() - start
+
+
+def main(size: int = DEFAULT_SIZE) -> None:
+    workers = os.cpu_count() or 1
+    hash_map = HashMap(expected_size=size)
+    shared_map = SharedHashMap(expected_size=size)
+    for key in range(size):
+        hash_map[key] = key
+        shared_map[key] = key
+
+    print(f"{size} int keys, {workers} workers, {LOOKUPS} lookups per worker")
+    print(f"{'map':<16}{'pickled bytes':>16}{'time (s)':>12}")
+    for name, candidate in (("HashMap", hash_map), ("SharedHashMap", shared_map)):
+        pickled = len(pickle.dumps(candidate))
+        print(f"{name:<16}{pickled:>16,}{run(candidate, workers, size):>12.3f}")
+
+    shared_map.close()
+    shared_map.unlink()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
@@ -1,30 +1,126 @@
+import sys
+from array import array
+from operator import eq
 from typing import Generic, TypeVar
 
+from .GrowthPolicy import DEFAULT_GROWTH_POLICY, GrowthPolicy
+from .Instrumentation import Instrumented
+
 T = TypeVar("T")
 DEFAULT_CAPACITY = 4
 
 
-class ArrayList(Generic[T]):
+class ArrayListView(Generic[T]):
+    """
+    Zero-copy window over the storage of an ArrayList
+
+    The view keeps a reference to the storage the list had when the view
+    was created (a memoryview for typed lists) and a `range` of the storage
+    positions it covers, so creating, slicing and iterating it never copies
+    items. Writes through the view or in-place writes to the list are visible
+    on both sides, but a view does not follow the list if it later
+    reallocates or moves its items.
+    """
+
+    _storage: list[T] | memoryview
+    _indices: range
+
+    def __init__(self, storage: list[T] | memoryview, indices: range) -> None:
+        self._storage = storage
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index: int | slice) -> "T | ArrayListView[T]":
+        if isinstance(index, slice):
+            return ArrayListView(self._storage, self._indices[index])
+
+        try:
+            return self._storage[self._indices[index]]
+        except IndexError:
+            raise IndexError("ArrayListView index out of bounds") from None
+
+    def __setitem__(self, index: int, value: T):
+        try:
+            self._storage[self._indices[index]] = value
+        except IndexError:
+            raise IndexError("ArrayListView index out of bounds") from None
+
+    def __iter__(self):
+        return map(self._storage.__getitem__, self._indices)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.__str__()}"
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+
+class ArrayList(Instrumented, Generic[T]):
+    """
+    Dynamic array with a movable head offset
+
+    The live items occupy the contiguous region
+    `_array[head : head + length]`, so the slots before `head` act as a gap
+    that absorbs inserts and removals at the front of the list. This makes
+    `enqueue` and `deque` amortized O(1) while indexing stays O(1).
+
+    When a `typecode` is given (e.g. `ArrayList(typecode="d")`) the items are
+    stored unboxed in an `array.array` of that type instead of a Python list,
+    and the unused slots are filled with zeros instead of `None`.
+
+    How much the array grows, and when it shrinks back after removals,
+    is decided by its `growth_policy`, and every reallocation is counted
+    in `allocation_stats`.
+    """
+
     length: int
     capacity: int
-    _array: list[T]
+    head: int
+    typecode: str | None
+    _array: list[T] | array
+    _empty: T | None
+    growth_policy: GrowthPolicy
+    _shrink_below: int
+    # capacity requested by reserve(), which removals never shrink below
+    _reserved: int = 0
     counter: int
 
-    def __init__(self, item: list[T] | tuple[T] | T = None) -> None:
+    # Initializers of these types are stored as a sequence of items rather than as a single item
+    _sequence_types: tuple[type, ...] = (list, tuple, array)
+
+    def __init__(
+        self,
+        item: list[T] | tuple[T] | array | T = None,
+        typecode: str | None = None,
+        growth_policy: GrowthPolicy = DEFAULT_GROWTH_POLICY,
+    ) -> None:
+        if typecode is None and isinstance(item, array):
+            typecode = item.typecode
+
+        self.head = 0
+        self.typecode = typecode
+        self.growth_policy = growth_policy
+        self._empty = None if typecode is None else 0
+
         if item is None:
             self.capacity = DEFAULT_CAPACITY
             self.length = 0
-            self._array = [None for _ in range(self.capacity)]
+            self._array = self._allocate(self.capacity)
 
-        elif isinstance(item, (list, tuple)):
+        elif isinstance(item, self._sequence_types):
             self.capacity = len(item)
             self.length = len(item)
-            self._array = item
+            self._array = self._to_storage(item)
 
         else:
             self.capacity = DEFAULT_CAPACITY
             self.length = 1
-            self._array = [item] + [None for _ in range(self.capacity - 1)]
+            self._array = self._allocate(self.capacity)
+            self._array[0] = item
+
+        self._shrink_below = growth_policy.shrink_limit(self.capacity)
 
     def __len__(self) -> int:
         return self.length
@@ -33,13 +129,17 @@ class ArrayList(Generic[T]):
         if self.length == 0 or index > self.length - 1 or -index > self.length:
             raise IndexError("ArrayList index out of bounds")
 
-        return self._array[index]
+        if index < 0:
+            index += self.length
+        return self._array[self.head + index]
 
     def __setitem__(self, index: int, value: T):
         if self.length == 0 or index > self.length - 1 or -index > self.length:
             raise IndexError("ArrayList index out of bounds")
 
-        self._array[index] = value
+        if index < 0:
+            index += self.length
+        self._array[self.head + index] = value
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {self._array}"
@@ -55,7 +155,7 @@ class ArrayList(Generic[T]):
         if self.length == 0 or self.counter >= self.length:
             raise StopIteration
 
-        next_value = self._array[self.counter]
+        next_value = self._array[self.head + self.counter]
         self.counter += 1
         return next_value
 
@@ -63,36 +163,129 @@ class ArrayList(Generic[T]):
         if not isinstance(other, ArrayList):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} object to {type(other)}")
-        return self._get_array() == other._get_array()
-
-    def _reallocate_array(self):
-        self.capacity = self.capacity * 2
-        print(f"Reallocating array with new capacity = {self.capacity}")
+        if self.length != other.length:
+            return False
+        return all(map(eq, self.view(), other.view()))
+
+    def view(self, start: int = 0, stop: int | None = None, step: int = 1) -> ArrayListView[T]:
+        """
+        Return a zero-copy view of the items in [start, stop) with the given step
+        Runtime: O(1)
+        """
+        start, stop, step = slice(start, stop, step).indices(self.length)
+        storage = self._array if self.typecode is None else memoryview(self._array)
+        return ArrayListView(storage, range(self.head + start, self.head + stop, step))
+
+    def _allocate(self, capacity: int) -> list[T] | array:
+        if self.typecode is None:
+            return [None] * capacity
+        return array(self.typecode, [0]) * capacity
+
+    def _to_storage(self, items: list[T] | tuple[T] | array) -> list[T] | array:
+        # Untyped lists keep using the list they were given,
+        # everything else is converted to the storage type
+        if self.typecode is None:
+            return items if isinstance(items, list) else list(items)
+        if isinstance(items, array) and items.typecode == self.typecode:
+            return items
+        return array(self.typecode, items)
+
+    def _new_list(self, items: list[T] | array) -> "ArrayList[T]":
+        # Build a list of the same kind that owns the given storage
+        return ArrayList(items, typecode=self.typecode, growth_policy=self.growth_policy)
+
+    def _reallocate_array(self, capacity: int | None = None, center: bool = False):
+        if capacity is None:
+            capacity = self.growth_policy.grow(self.capacity, self.length + 1)
+
+        old_capacity = self.capacity
+        self.capacity = capacity
+        self._shrink_below = self.growth_policy.shrink_limit(capacity, self._reserved)
+
+        # When the new space is needed at the front, split it between both ends
+        head = (self.capacity - self.length + 1) // 2 if center else 0
 
         # Create new array and copy the previous values into it
-        new_array = [None] * self.capacity
-        new_array[0: self.length] = self._get_array()
+        new_array = self._allocate(self.capacity)
+        new_array[head: head + self.length] = self._array[self.head: self.head + self.length]
 
         self._array = new_array
+        self.head = head
+        self._record_resize(old_capacity, capacity, self.length, sys.getsizeof(new_array))
+
+    def _clear(self, start: int, stop: int):
+        if start < stop:
+            self._array[start: stop] = self._allocate(stop - start)
+
+    def _move_items(self, dest: int, start: int, stop: int):
+        # Copy _array[start:stop] to dest with a single slice move. Empty ranges are skipped:
+        # even an empty slice assignment raises BufferError while a typed view() is alive
+        if start < stop:
+            self._array[dest: dest + stop - start] = self._array[start: stop]
+
+    def _move_head(self, head: int):
+        # Relocate the live region inside the current array with a single slice move
+        old_head = self.head
+        if head == old_head:
+            return
+
+        end = old_head + self.length
+        self._move_items(head, old_head, end)
+        self.head = head
+
+        # Clear the slots that are no longer covered by the live region
+        if head < old_head:
+            self._clear(max(head + self.length, old_head), end)
+        else:
+            self._clear(old_head, min(head, end))
+
+    def _make_room_at_front(self):
+        # Recenter the live region so that the gap is split between both ends.
+        # If the array is more than half full, grow it instead, unless the
+        # items still fit in the capacity promised by reserve()
+        if 2 * (self.length + 1) > self.capacity and self.length + 1 > self._reserved:
+            self._reallocate_array(center=True)
+        else:
+            self._move_head((self.capacity - self.length + 1) // 2)
+
+    def _make_room_at_back(self, count: int = 1):
+        # Reuse the gap at the front only when at least half of the array is free,
+        # so the cost of the move is paid for by the removals that created the gap,
+        # or when the items still fit in the capacity promised by reserve()
+        if 2 * (self.length + count) > self.capacity and self.length + count > self._reserved:
+            self._reallocate_array(self.growth_policy.grow(self.capacity, self.length + count))
+        else:
+            self._move_head(0)
 
     def shift_forward(self, idx):
-        for i in reversed(range(idx, self.length)):
-            self._array[i] = self._array[i - 1]
+        self._move_items(self.head + idx + 1, self.head + idx, self.head + self.length - 1)
 
     def shift_backward(self, idx):
-        for i in range(idx, self.length - 1):
-            self._array[i] = self._array[i + 1]
+        self._move_items(self.head + idx, self.head + idx + 1, self.head + self.length)
 
-    def _get_array(self):
-        return self._array[0: self.length]
+    def _get_array(self) -> list[T]:
+        items = self._array[self.head: self.head + self.length]
+        return items if self.typecode is None else items.tolist()
 
     def put(self, idx: int, item: T):
-        if self.length + 1 > self.capacity:
-            self._reallocate_array()
+        # In the front half of the list the preceding items are shifted into the head gap,
+        # otherwise the following items are shifted towards the end of the array
+        if idx < self.length // 2 or idx == 0 < self.length:
+            if self.head == 0:
+                self._make_room_at_front()
+
+            self.head -= 1
+            self.length += 1
+            head = self.head
+            self._move_items(head, head + 1, head + idx + 1)
+        else:
+            if self.head + self.length + 1 > self.capacity:
+                self._make_room_at_back()
+
+            self.length += 1
+            self.shift_forward(idx)
 
-        self.length += 1
-        self.shift_forward(idx)
-        self._array[idx] = item
+        self._array[self.head + idx] = item
 
     def push(self, item) -> None:
         self.put(self.length, item)
@@ -107,15 +300,24 @@ class ArrayList(Generic[T]):
         if idx > self.length - 1:
             raise IndexError("ArrayList index out of range")
 
-        item = self._array[idx]
-        self._array[idx] = None
+        item = self._array[self.head + idx]
 
-        # In case an item is removed from the middle of the list,
-        if idx < self.length - 1:
+        # Close the hole from whichever side has fewer items to move,
+        # the vacated slot is cleared once head and length no longer cover it
+        head = self.head
+        if idx < self.length // 2:
+            self._move_items(head + 1, head, head + idx)
+            self.head += 1
+            self.length -= 1
+            self._clear(head, head + 1)
+        else:
             self.shift_backward(idx)
-            self._array[self.length - 1] = None
+            self.length -= 1
+            self._clear(head + self.length, head + self.length + 1)
+
+        if self.length < self._shrink_below:
+            self._reallocate_array(self.growth_policy.shrink(self.length, self._reserved))
 
-        self.length -= 1
         return item
 
     def pop(self) -> T:
@@ -123,3 +325,82 @@ class ArrayList(Generic[T]):
 
     def deque(self) -> T:
         return self.remove(0)
+
+    def insert_many(self, idx: int, items) -> None:
+        """
+        Insert all the items of an iterable before position idx
+        Runtime: O(n + k), with a single slice move for the tail
+        """
+        if idx < 0 or idx > self.length:
+            raise IndexError("ArrayList index out of range")
+
+        if not isinstance(items, self._sequence_types):
+            items = list(items)
+
+        count = len(items)
+        if count == 0:
+            return
+
+        # Presize once so the whole batch fits behind the live region
+        if self.head + self.length + count > self.capacity:
+            self._make_room_at_back(count)
+
+        start = self.head + idx
+        end = self.head + self.length
+        self._move_items(start + count, start, end)
+        self._array[start: start + count] = self._to_storage(items)
+        self.length += count
+
+    def extend(self, items) -> None:
+        self.insert_many(self.length, items)
+
+    def remove_range(self, start: int, stop: int) -> "ArrayList[T]":
+        """
+        Remove the items in positions [start, stop) and return them as a new ArrayList
+        Runtime: O(n), with a single slice move for the shorter side
+        """
+        if start < 0 or stop > self.length or start > stop:
+            raise IndexError("ArrayList index out of range")
+
+        count = stop - start
+        head = self.head
+        end = head + self.length
+        removed = self._new_list(self._array[head + start: head + stop])
+        if count == 0:
+            return removed
+
+        # Close the hole from whichever side has fewer items to move,
+        # the vacated slots are cleared once head and length no longer cover them
+        from_front = start < self.length - stop
+        self.length -= count
+        if from_front:
+            self._move_items(head + count, head, head + start)
+            self.head += count
+            self._clear(head, head + count)
+        else:
+            self._move_items(head + start, head + stop, end)
+            self._clear(end - count, end)
+
+        if self.length < self._shrink_below:
+            self._reallocate_array(self.growth_policy.shrink(self.length, self._reserved))
+
+        return removed
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Make room for at least `capacity` items without further reallocations,
+        removals no longer shrink the capacity below it until shrink_to_fit()
+        """
+        self._reserved = max(self._reserved, capacity)
+        if capacity > self.capacity:
+            self._reallocate_array(capacity)
+        else:
+            self._shrink_below = self.growth_policy.shrink_limit(self.capacity, self._reserved)
+
+    def shrink_to_fit(self) -> None:
+        """Release all the unused slots so that the capacity equals the length"""
+        self._reserved = 0
+        if self.capacity != self.length:
+            self._reallocate_array(self.length)
+        else:
+            self._shrink_below = self.growth_policy.shrink_limit(self.capacity)
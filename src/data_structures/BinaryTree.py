@@ -80,9 +80,9 @@ class BinaryTree(Generic[T]):
             out.push(curr.data)
 
             if curr.left is not None:
-                queue.enqueue(curr.left)
+                queue.push(curr.left)
             if curr.right is not None:
-                queue.enqueue(curr.right)
+                queue.push(curr.right)
 
         return out
 
@@ -95,9 +95,9 @@ class BinaryTree(Generic[T]):
                 return True
 
             if curr.left is not None:
-                queue.enqueue(curr.left)
+                queue.push(curr.left)
             if curr.right is not None:
-                queue.enqueue(curr.right)
+                queue.push(curr.right)
 
         return False
 
@@ -0,0 +1,201 @@
+from itertools import chain
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from .ArrayList import ArrayList
+from .GrowthPolicy import GrowthPolicy
+
+T = TypeVar("T")
+DEFAULT_BLOCK_SIZE = 512
+
+# Blocks are reserved at their maximum size up front, so they never grow or shrink
+BLOCK_GROWTH_POLICY = GrowthPolicy(shrink_threshold=None)
+
+
+class BlockedList(Generic[T]):
+    """
+    Sequence split into a list of bounded ArrayList blocks
+
+    Every block holds between `block_size / 2` and `2 * block_size` items
+    (except when the whole list is smaller). The lengths of the blocks are
+    kept in a Fenwick tree, the prefix-length index, so finding the block
+    that holds a position takes O(log(n / B)) and inserting or removing an
+    item only shifts the items of one block.
+
+    Blocks are split when they overflow and merged with their neighbour when
+    they underflow, and only then is the index rebuilt, in O(n / B).
+    With B around sqrt(n) positional inserts and removals cost O(sqrt(n)).
+    """
+
+    length: int
+    block_size: int
+    typecode: str | None
+    _blocks: list[ArrayList[T]]
+    _index: list[int]
+    _top: int
+
+    def __init__(
+        self,
+        items: Iterable[T] | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        typecode: str | None = None,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1")
+
+        self.block_size = block_size
+        self.typecode = typecode
+        self._blocks = []
+
+        items = list(items) if items is not None else []
+        for start in range(0, len(items), block_size):
+            self._blocks.append(self._new_block(items[start: start + block_size]))
+
+        self.length = len(items)
+        self._rebuild_index()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> T:
+        block_idx, offset = self._locate(self._check_index(index))
+        return self._blocks[block_idx][offset]
+
+    def __setitem__(self, index: int, value: T):
+        block_idx, offset = self._locate(self._check_index(index))
+        self._blocks[block_idx][offset] = value
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(block.view() for block in self._blocks)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {[block._get_array() for block in self._blocks]}"
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BlockedList):
+            raise TypeError(
+                f"Cannot compare {self.__class__.__name__} object to {type(other)}")
+        return self.length == other.length and all(a == b for a, b in zip(self, other))
+
+    def _new_block(self, items: Iterable[T] | None = None) -> ArrayList[T]:
+        block = ArrayList(typecode=self.typecode, growth_policy=BLOCK_GROWTH_POLICY)
+        block.reserve(2 * self.block_size + 1)
+        if items is not None:
+            block.extend(items)
+        return block
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("BlockedList index out of bounds")
+        return index
+
+    def _rebuild_index(self):
+        # Fenwick tree over the block lengths, 1-indexed
+        count = len(self._blocks)
+        index = [0] * (count + 1)
+        for i, block in enumerate(self._blocks, 1):
+            index[i] += len(block)
+            parent = i + (i & -i)
+            if parent <= count:
+                index[parent] += index[i]
+
+        self._index = index
+        self._top = 1 << (count.bit_length() - 1) if count else 0
+
+    def _update_index(self, block_idx: int, delta: int):
+        i = block_idx + 1
+        while i < len(self._index):
+            self._index[i] += delta
+            i += i & -i
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        # Descend the Fenwick tree to find the block holding the item at index,
+        # and the offset of the item inside that block
+        pos = 0
+        step = self._top
+        while step:
+            nxt = pos + step
+            if nxt < len(self._index) and self._index[nxt] <= index:
+                pos = nxt
+                index -= self._index[nxt]
+            step >>= 1
+
+        return pos, index
+
+    def put(self, idx: int, item: T):
+        """
+        Insert item before position idx
+        Runtime: O(log(n / B) + B), amortized
+        """
+        if idx < 0 or idx > self.length:
+            raise IndexError("BlockedList index out of range")
+
+        if not self._blocks:
+            self._blocks.append(self._new_block())
+            self._rebuild_index()
+
+        if idx == self.length:
+            block_idx = len(self._blocks) - 1
+            offset = len(self._blocks[block_idx])
+        else:
+            block_idx, offset = self._locate(idx)
+
+        block = self._blocks[block_idx]
+        block.put(offset, item)
+        self.length += 1
+
+        if len(block) > 2 * self.block_size:
+            # Split the overflowing block in two halves
+            half = block.remove_range(self.block_size, len(block))
+            self._blocks.insert(block_idx + 1, self._new_block(half.view()))
+            self._rebuild_index()
+        else:
+            self._update_index(block_idx, 1)
+
+    def push(self, item: T) -> None:
+        self.put(self.length, item)
+
+    def enqueue(self, item: T) -> None:
+        self.put(0, item)
+
+    def remove(self, idx: int) -> T:
+        """
+        Remove and return the item at position idx
+        Runtime: O(log(n / B) + B), amortized
+        """
+        if self.length == 0:
+            raise IndexError("Cannot remove item from empty list")
+
+        if idx < 0 or idx >= self.length:
+            raise IndexError("BlockedList index out of range")
+
+        block_idx, offset = self._locate(idx)
+        block = self._blocks[block_idx]
+        item = block.remove(offset)
+        self.length -= 1
+
+        if len(block) == 0:
+            del self._blocks[block_idx]
+            self._rebuild_index()
+        elif len(block) < self.block_size // 2 and block_idx + 1 < len(self._blocks):
+            # Merge the underflowing block with the next one, splitting again if needed
+            following = self._blocks.pop(block_idx + 1)
+            block.extend(following.view())
+            if len(block) > 2 * self.block_size:
+                half = block.remove_range(len(block) // 2, len(block))
+                self._blocks.insert(block_idx + 1, self._new_block(half.view()))
+            self._rebuild_index()
+        else:
+            self._update_index(block_idx, -1)
+
+        return item
+
+    def pop(self) -> T:
+        return self.remove(self.length - 1)
+
+    def deque(self) -> T:
+        return self.remove(0)
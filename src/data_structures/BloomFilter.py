@@ -0,0 +1,141 @@
+import math
+from typing import Generic, Iterator, TypeVar
+
+from .Hashing import fibonacci_mix
+
+K = TypeVar("K")
+DEFAULT_EXPECTED_SIZE = 1000
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+# Counters stop at COUNTER_MAX and are never decremented again, so that an
+# overflow can only cause false positives, never false negatives
+COUNTER_MAX = 255
+
+# The k positions of a key are h1 + i * h2 (Kirsch-Mitzenmacher double hashing),
+# with h1 and h2 the two halves of fibonacci_mix(hash(key))
+
+
+class BloomFilter(Generic[K]):
+    """
+    Probabilistic set answering "definitely absent" or "possibly present"
+
+    `size` bits and `hash_count` positions per key are derived from the
+    expected number of keys and the target false positive rate. All the
+    positions of a key come from its `hash()`, so callers that already
+    hold the hash (HashMap caches it in every entry) use the `*_hash`
+    methods and never hash the key twice.
+
+    With `counting=True` every position is an 8-bit counter instead of a
+    bit, which makes `remove` possible at the cost of 8 times the memory.
+    Removing a key that was never added corrupts the filter.
+    """
+
+    size: int
+    hash_count: int
+    expected_size: int
+    false_positive_rate: float
+    counting: bool
+    length: int
+    _cells: bytearray
+
+    def __init__(
+        self,
+        expected_size: int = DEFAULT_EXPECTED_SIZE,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        counting: bool = False,
+    ) -> None:
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1")
+        if expected_size < 0:
+            raise ValueError("Expected size cannot be negative")
+
+        expected_size = max(1, expected_size)
+        self.expected_size = expected_size
+        self.false_positive_rate = false_positive_rate
+        # optimal number of bits m = -n ln(p) / ln(2)^2 and of hashes k = m / n ln(2)
+        bits = -expected_size * math.log(false_positive_rate) / math.log(2) ** 2
+        self.size = max(8, math.ceil(bits))
+        self.hash_count = max(1, round(self.size / expected_size * math.log(2)))
+        self.counting = counting
+        self.length = 0
+        self._cells = bytearray(self.size if counting else (self.size + 7) // 8)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(size={self.size}, hash_count={self.hash_count}, "
+            f"length={self.length}, counting={self.counting})"
+        )
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, key: K) -> bool:
+        return self.contains_hash(hash(key))
+
+    def _probe(self, key_hash: int) -> tuple[int, int]:
+        """Return the first position of key_hash and the step to its next ones"""
+        mixed = fibonacci_mix(key_hash)
+        return (mixed & 0xFFFFFFFF) % self.size, (mixed >> 32) | 1
+
+    def _positions(self, key_hash: int) -> Iterator[int]:
+        pos, step = self._probe(key_hash)
+        size = self.size
+        for _ in range(self.hash_count):
+            yield pos
+            pos = (pos + step) % size
+
+    def add(self, key: K) -> None:
+        self.add_hash(hash(key))
+
+    def remove(self, key: K) -> None:
+        """Remove a key added before, only for counting filters"""
+        self.remove_hash(hash(key))
+
+    def add_hash(self, key_hash: int) -> None:
+        cells = self._cells
+        if self.counting:
+            for pos in self._positions(key_hash):
+                if cells[pos] < COUNTER_MAX:
+                    cells[pos] += 1
+        else:
+            for pos in self._positions(key_hash):
+                cells[pos >> 3] |= 1 << (pos & 7)
+        self.length += 1
+
+    def remove_hash(self, key_hash: int) -> None:
+        if not self.counting:
+            raise ValueError("Only a counting BloomFilter supports removals")
+
+        cells = self._cells
+        for pos in self._positions(key_hash):
+            if 0 < cells[pos] < COUNTER_MAX:
+                cells[pos] -= 1
+        self.length -= 1
+
+    def contains_hash(self, key_hash: int) -> bool:
+        """
+        Return False if no key with this hash was added, True if one possibly was
+        Runtime: O(k), stopping at the first empty position
+        """
+        # walks the positions inline, the generator would double the cost of a miss
+        pos, step = self._probe(key_hash)
+        size = self.size
+        cells = self._cells
+        if self.counting:
+            for _ in range(self.hash_count):
+                if not cells[pos]:
+                    return False
+                pos = (pos + step) % size
+        else:
+            for _ in range(self.hash_count):
+                if not cells[pos >> 3] >> (pos & 7) & 1:
+                    return False
+                pos = (pos + step) % size
+        return True
+
+    def clear(self) -> None:
+        self._cells = bytearray(len(self._cells))
+        self.length = 0
+
+    def estimated_false_positive_rate(self) -> float:
+        """Estimated probability that a key never added is reported as present"""
+        return (1 - math.exp(-self.hash_count * self.length / self.size)) ** self.hash_count
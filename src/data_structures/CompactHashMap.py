@@ -0,0 +1,236 @@
+import sys
+from array import array
+from typing import Generic, Iterator, TypeVar
+
+from .Hashing import fibonacci_slot, rebuilt_capacity
+from .HashMap import _MISSING, KeyValuePair
+from .Instrumentation import Instrumented
+
+K = TypeVar("K")
+V = TypeVar("V")
+DEFAULT_CAPACITY = 8
+DEFAULT_LOAD_FACTOR = 0.7
+
+# Values of the index slots that do not point into the entries
+_EMPTY = -1
+_DUMMY = -2
+
+# Marker for the entries whose key was removed
+_DELETED = object()
+
+
+def _index_typecode(capacity: int) -> str:
+    # Smallest signed array type that can hold every entry number of the table
+    if capacity <= 1 << 7:
+        return "b"
+    if capacity <= 1 << 15:
+        return "h"
+    if capacity <= 1 << 31:
+        return "i"
+    return "q"
+
+
+class CompactHashMap(Instrumented, Generic[K, V]):
+    """
+    Insertion-ordered hash map with a sparse index over dense entries
+
+    Modelled on the CPython dict layout: the entries (hash, key, value) are
+    appended to three dense parallel lists in insertion order, and the hash
+    table itself is a compact `array` of entry numbers, using 1, 2, 4 or 8
+    bytes per slot depending on its capacity. The index is probed linearly
+    from the Fibonacci hash slot of the key, like OpenAddressingHashMap: the
+    high bits of the mixed hash play the part of CPython's perturbation, so
+    keys whose hashes share their low bits do not pile up in one chain.
+
+    Iteration is a scan of the dense lists, so it follows insertion order.
+    Removing a key leaves a hole in the entries and a dummy in the index,
+    both dropped by the next resize.
+
+    Same API as HashMap: `put`, `get`, `update`, `remove`, `pop`, `[]`,
+    `keys`, `values` and `items`.
+    """
+
+    capacity: int
+    length: int
+    _bits: int
+    _index: array
+    _hashes: list[int]
+    _keys: list[K]
+    _values: list[V]
+
+    def __init__(self) -> None:
+        self.capacity = DEFAULT_CAPACITY
+        self.length = 0
+        self._bits = self.capacity.bit_length() - 1
+        self._index = array(_index_typecode(self.capacity), [_EMPTY]) * self.capacity
+        self._hashes = []
+        self._keys = []
+        self._values = []
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(str(KeyValuePair(key, value)) for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        output = ""
+        for i in range(self.capacity):
+            entry = self._index[i]
+            if entry == _EMPTY:
+                slot = ""
+            elif entry == _DUMMY:
+                slot = "<deleted>"
+            else:
+                slot = f"#{entry} {KeyValuePair(self._keys[entry], self._values[entry])}"
+            output += f"{str(i).zfill(3)} -> {slot}\n"
+        return output
+
+    def __getitem__(self, key: K):
+        entry = self._lookup(key, hash(key))[1]
+        if entry < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        return self._values[entry]
+
+    def __setitem__(self, key: K, value: V):
+        key_hash = hash(key)
+        slot, entry = self._lookup(key, key_hash)
+        if entry >= 0:
+            self._values[entry] = value
+        else:
+            self._insert(slot, key, key_hash, value)
+
+    def __contains__(self, key: K) -> bool:
+        return self._lookup(key, hash(key))[1] >= 0
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def keys(self) -> Iterator[K]:
+        return (self._keys[entry] for entry in self._live_entries())
+
+    def values(self) -> Iterator[V]:
+        return (self._values[entry] for entry in self._live_entries())
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        return ((self._keys[entry], self._values[entry]) for entry in self._live_entries())
+
+    def _live_entries(self) -> Iterator[int]:
+        # Scan the dense entries in insertion order, skipping the holes left by removals
+        length = self.length
+        keys = self._keys
+        for entry in range(len(keys)):
+            if keys[entry] is not _DELETED:
+                yield entry
+                if self.length != length or self._keys is not keys:
+                    raise RuntimeError(f"{self.__class__.__name__} changed size during iteration")
+
+    def _lookup(self, key: K, key_hash: int) -> tuple[int, int]:
+        # Return the index slot of key and its entry number, or the empty slot
+        # that ended the probe sequence and -1 when the key is missing
+        index = self._index
+        hashes = self._hashes
+        keys = self._keys
+        mask = self.capacity - 1
+        slot = fibonacci_slot(key_hash, self._bits)
+
+        while True:
+            entry = index[slot]
+            if entry == _EMPTY:
+                return slot, -1
+            if entry >= 0 and hashes[entry] == key_hash:
+                entry_key = keys[entry]
+                if entry_key is key or entry_key == key:
+                    return slot, entry
+            slot = (slot + 1) & mask
+
+    def _insert(self, slot: int, key: K, key_hash: int, value: V) -> None:
+        self._index[slot] = len(self._keys)
+        self._hashes.append(key_hash)
+        self._keys.append(key)
+        self._values.append(value)
+        self.length += 1
+
+        # Every entry, live or removed, holds one index slot until the next resize
+        if len(self._keys) / self.capacity > DEFAULT_LOAD_FACTOR:
+            self._reallocate_container()
+
+    def put(self, key: K, value: V) -> None:
+        key_hash = hash(key)
+        slot, entry = self._lookup(key, key_hash)
+        if entry >= 0:
+            raise KeyError(f"Key: {key} already exists!")
+
+        self._insert(slot, key, key_hash, value)
+
+    def update(self, key: K, value: V):
+        entry = self._lookup(key, hash(key))[1]
+        if entry < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        self._values[entry] = value
+
+    def get(self, key: K):
+        entry = self._lookup(key, hash(key))[1]
+        if entry < 0:
+            return None
+
+        return self._values[entry]
+
+    def _delete(self, slot: int, entry: int) -> KeyValuePair[K, V]:
+        kv_pair = KeyValuePair(self._keys[entry], self._values[entry], self._hashes[entry])
+        self._index[slot] = _DUMMY
+        self._keys[entry] = _DELETED
+        self._values[entry] = None
+        self.length -= 1
+        return kv_pair
+
+    def remove(self, key: K):
+        slot, entry = self._lookup(key, hash(key))
+        if entry < 0:
+            return None
+
+        return self._delete(slot, entry)
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove key and return its value, or default if given and the key is missing"""
+        slot, entry = self._lookup(key, hash(key))
+        if entry < 0:
+            if default is _MISSING:
+                raise KeyError(f"Key: {key} does not exist!")
+            return default
+
+        return self._delete(slot, entry).value
+
+    def _reallocate_container(self):
+        old_capacity = self.capacity
+
+        self.capacity = rebuilt_capacity(self.length, self.capacity, DEFAULT_LOAD_FACTOR)
+        self._bits = bits = self.capacity.bit_length() - 1
+
+        # Drop the holes from the entries, keeping the insertion order
+        live = [entry for entry, key in enumerate(self._keys) if key is not _DELETED]
+        if len(live) < len(self._keys):
+            self._hashes = [self._hashes[entry] for entry in live]
+            self._keys = [self._keys[entry] for entry in live]
+            self._values = [self._values[entry] for entry in live]
+
+        index = array(_index_typecode(self.capacity), [_EMPTY]) * self.capacity
+        mask = self.capacity - 1
+        for entry, key_hash in enumerate(self._hashes):
+            slot = fibonacci_slot(key_hash, bits)
+            while index[slot] != _EMPTY:
+                slot = (slot + 1) & mask
+            index[slot] = entry
+
+        self._index = index
+        self._record_resize(
+            old_capacity,
+            self.capacity,
+            self.length,
+            sys.getsizeof(index)
+            + sys.getsizeof(self._hashes)
+            + sys.getsizeof(self._keys)
+            + sys.getsizeof(self._values),
+        )
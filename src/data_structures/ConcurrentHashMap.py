@@ -0,0 +1,167 @@
+import math
+import threading
+from typing import Callable, Generic, Iterator, TypeVar
+
+from .Hashing import fibonacci_mix
+from .HashMap import (_MISSING, DEFAULT_LOAD_FACTOR, HashMap, KeyValuePair,
+                      _pop_removed)
+
+K = TypeVar("K")
+V = TypeVar("V")
+DEFAULT_SEGMENTS = 16
+
+
+class ConcurrentHashMap(Generic[K, V]):
+    """
+    Thread-safe hash map made of independently locked HashMap segments
+
+    Every key belongs to one of `segments` HashMaps, each guarded by its
+    own lock, so threads working on different segments never wait for
+    each other and a segment resizes without blocking the others. The key
+    is hashed once and the hash is handed to the segment.
+
+    Iteration is weakly consistent: each segment is copied under its lock
+    in turn, so concurrent updates to other segments may or may not be
+    seen. `len()` adds up the segment lengths without locking.
+
+    The factory of `compute_if_absent` runs while the segment lock is
+    held, so it must not access the map itself.
+    """
+
+    segments: int
+    _segments: list[HashMap[K, V]]
+    _locks: list[threading.Lock]
+
+    def __init__(
+        self,
+        segments: int = DEFAULT_SEGMENTS,
+        expected_size: int = 0,
+        load_factor: float = DEFAULT_LOAD_FACTOR,
+    ) -> None:
+        if segments < 1:
+            raise ValueError("Number of segments must be at least 1")
+
+        self.segments = segments
+        segment_size = math.ceil(expected_size / segments)
+        self._segments = [
+            HashMap(expected_size=segment_size, load_factor=load_factor) for _ in range(segments)
+        ]
+        self._locks = [threading.Lock() for _ in range(segments)]
+
+    def __len__(self) -> int:
+        return sum(segment.length for segment in self._segments)
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(str(KeyValuePair(key, value)) for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.__str__()}"
+
+    def _segment_of(self, key_hash: int) -> int:
+        # The high bits of the mix do not correlate with the bucket chosen
+        # inside the segment from the low bits of the hash
+        return (fibonacci_mix(key_hash) >> 32) % self.segments
+
+    def __getitem__(self, key: K) -> V:
+        key_hash = hash(key)
+        idx = self._segment_of(key_hash)
+        with self._locks[idx]:
+            bucket, pos = self._segments[idx]._find(key, key_hash)
+            if pos < 0:
+                raise KeyError(f"Key: {key} does not exist!")
+            return bucket[pos].value
+
+    def __setitem__(self, key: K, value: V):
+        key_hash = hash(key)
+        idx = self._segment_of(key_hash)
+        with self._locks[idx]:
+            segment = self._segments[idx]
+            bucket, pos = segment._find(key, key_hash)
+            if pos < 0:
+                segment._insert(key, key_hash, value)
+            else:
+                bucket[pos].value = value
+
+    def __contains__(self, key: K) -> bool:
+        key_hash = hash(key)
+        idx = self._segment_of(key_hash)
+        with self._locks[idx]:
+            return self._segments[idx]._find(key, key_hash)[1] >= 0
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def keys(self) -> Iterator[K]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[V]:
+        return (value for _, value in self.items())
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        for idx, segment in enumerate(self._segments):
+            with self._locks[idx]:
+                snapshot = list(segment.items())
+            yield from snapshot
+
+    def put(self, key: K, value: V) -> None:
+        key_hash = hash(key)
+        idx = self._segment_of(key_hash)
+        with self._locks[idx]:
+            segment = self._segments[idx]
+            if segment._find(key, key_hash)[1] >= 0:
+                raise KeyError(f"Key: {key} already exists!")
+            segment._insert(key, key_hash, value)
+
+    def update(self, key: K, value: V):
+        key_hash = hash(key)
+        idx = self._segment_of(key_hash)
+        with self._locks[idx]:
+            bucket, pos = self._segments[idx]._find(key, key_hash)
+            if pos < 0:
+                raise KeyError(f"Key: {key} does not exist!")
+            bucket[pos].value = value
+
+    def get(self, key: K, default: V = None) -> V:
+        key_hash = hash(key)
+        idx = self._segment_of(key_hash)
+        with self._locks[idx]:
+            bucket, pos = self._segments[idx]._find(key, key_hash)
+            return default if pos < 0 else bucket[pos].value
+
+    def compute_if_absent(self, key: K, factory: Callable[[K], V]) -> V:
+        """
+        Return the value of key, atomically inserting factory(key) first if the key is missing
+
+        The factory is called at most once per missing key, even when several
+        threads ask for the same key at the same time.
+        """
+        key_hash = hash(key)
+        idx = self._segment_of(key_hash)
+        with self._locks[idx]:
+            segment = self._segments[idx]
+            bucket, pos = segment._find(key, key_hash)
+            if pos >= 0:
+                return bucket[pos].value
+
+            value = factory(key)
+            segment._insert(key, key_hash, value)
+            return value
+
+    def setdefault(self, key: K, default: V = None) -> V:
+        """Return the value of key, atomically inserting default first if the key is missing"""
+        return self.compute_if_absent(key, lambda _: default)
+
+    def remove(self, key: K):
+        key_hash = hash(key)
+        idx = self._segment_of(key_hash)
+        with self._locks[idx]:
+            segment = self._segments[idx]
+            bucket, pos = segment._find(key, key_hash)
+            if pos < 0:
+                return None
+
+            return segment._remove_entry(bucket, pos)
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove key and return its value, or default if given and the key is missing"""
+        return _pop_removed(self.remove(key), key, default)
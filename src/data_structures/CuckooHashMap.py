@@ -0,0 +1,299 @@
+import random
+import sys
+from typing import Generic, Iterator, TypeVar
+
+from .Hashing import fibonacci_slot
+from .HashMap import _MISSING, KeyValuePair, _pop_removed
+from .Instrumentation import Instrumented
+
+K = TypeVar("K")
+V = TypeVar("V")
+DEFAULT_BUCKETS = 4
+BUCKET_SLOTS = 4
+STASH_SIZE = 4
+MAX_KICKS = 64
+DEFAULT_LOAD_FACTOR = 0.9
+
+# Marker for the free slots
+_EMPTY = object()
+
+
+class CuckooHashMap(Instrumented, Generic[K, V]):
+    """
+    Hash map using bucketized cuckoo hashing with a stash
+
+    Each key has one candidate bucket of BUCKET_SLOTS slots in each of two
+    tables, and always lives in one of those two buckets or in a small
+    stash of at most STASH_SIZE entries. A lookup therefore checks at most
+    2 * BUCKET_SLOTS + STASH_SIZE slots, whatever the keys are.
+
+    An insert into two full buckets evicts a random entry to its other
+    bucket, which may evict another one, and so on for at most MAX_KICKS
+    moves. The entry left without a slot goes to the stash, and when the
+    stash overflows the tables are doubled and rebuilt.
+
+    Keys whose hashes are fully identical share both buckets, so beyond
+    2 * BUCKET_SLOTS of them no table size can separate them. The stash
+    limit is then doubled after each rebuild instead of growing the tables
+    again, and only the lookups of those keys scan the longer stash.
+
+    Same API as HashMap: `put`, `get`, `update`, `remove`, `pop`, `[]`,
+    `keys`, `values` and `items`.
+    """
+
+    capacity: int
+    length: int
+    _buckets: int
+    _bits: int
+    _hashes: list[int]
+    _keys: list[K]
+    _values: list[V]
+    _stash: list[KeyValuePair[K, V]]
+    _stash_limit: int
+
+    def __init__(self) -> None:
+        self.length = 0
+        self._stash = []
+        self._stash_limit = STASH_SIZE
+        self._allocate(DEFAULT_BUCKETS)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(str(KeyValuePair(key, value)) for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        output = ""
+        for table in range(2):
+            for bucket in range(self._buckets):
+                base = self._base(table, bucket)
+                slots = [
+                    str(KeyValuePair(self._keys[i], self._values[i]))
+                    for i in range(base, base + BUCKET_SLOTS)
+                    if self._keys[i] is not _EMPTY
+                ]
+                output += f"{table}:{str(bucket).zfill(3)} -> {slots}\n"
+        output += f"stash -> {self._stash}\n"
+        return output
+
+    def __getitem__(self, key: K):
+        slot = self._find(key, hash(key))
+        if slot is None:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        return self._value_at(slot)
+
+    def __setitem__(self, key: K, value: V):
+        key_hash = hash(key)
+        slot = self._find(key, key_hash)
+        if slot is None:
+            self._insert(key, key_hash, value)
+        else:
+            self._set_value_at(slot, value)
+
+    def __contains__(self, key: K) -> bool:
+        return self._find(key, hash(key)) is not None
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def keys(self) -> Iterator[K]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[V]:
+        return (value for _, value in self.items())
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        length = self.length
+        keys = self._keys
+        for i in range(len(keys)):
+            if keys[i] is not _EMPTY:
+                yield keys[i], self._values[i]
+                self._check_unchanged(length, keys)
+
+        for kv_pair in list(self._stash):
+            yield kv_pair.key, kv_pair.value
+            self._check_unchanged(length, keys)
+
+    def _check_unchanged(self, length: int, keys: list[K]) -> None:
+        if self.length != length or self._keys is not keys:
+            raise RuntimeError(f"{self.__class__.__name__} changed size during iteration")
+
+    def _allocate(self, buckets: int) -> None:
+        self._buckets = buckets
+        self._bits = buckets.bit_length() - 1
+        self.capacity = 2 * buckets * BUCKET_SLOTS
+        self._hashes = [0] * self.capacity
+        self._keys = [_EMPTY] * self.capacity
+        self._values = [None] * self.capacity
+
+    def _base(self, table: int, bucket: int) -> int:
+        # First slot of a bucket, the tables are stored one after the other
+        return (table * self._buckets + bucket) * BUCKET_SLOTS
+
+    def _bucket_of(self, table: int, key_hash: int) -> int:
+        if table == 0:
+            return key_hash & (self._buckets - 1)
+        # The high bits of the mix, so that the second bucket does not follow the first one
+        return fibonacci_slot(key_hash, self._bits)
+
+    def _find(self, key: K, key_hash: int) -> int | KeyValuePair[K, V] | None:
+        # Return the slot holding key, the stash entry of key, or None
+        hashes = self._hashes
+        keys = self._keys
+        first = (key_hash & (self._buckets - 1)) * BUCKET_SLOTS
+        second = self._base(1, self._bucket_of(1, key_hash))
+        for i in (*range(first, first + BUCKET_SLOTS), *range(second, second + BUCKET_SLOTS)):
+            if hashes[i] == key_hash:
+                slot_key = keys[i]
+                if slot_key is key or (slot_key is not _EMPTY and slot_key == key):
+                    return i
+
+        for kv_pair in self._stash:
+            if kv_pair.hash == key_hash and (kv_pair.key is key or kv_pair.key == key):
+                return kv_pair
+
+        return None
+
+    def _value_at(self, slot: int | KeyValuePair[K, V]) -> V:
+        if isinstance(slot, KeyValuePair):
+            return slot.value
+        return self._values[slot]
+
+    def _set_value_at(self, slot: int | KeyValuePair[K, V], value: V) -> None:
+        if isinstance(slot, KeyValuePair):
+            slot.value = value
+        else:
+            self._values[slot] = value
+
+    def _free_slot(self, key_hash: int) -> int:
+        # First free slot in either bucket of the hash, or -1
+        keys = self._keys
+        for table in range(2):
+            base = self._base(table, self._bucket_of(table, key_hash))
+            for i in range(base, base + BUCKET_SLOTS):
+                if keys[i] is _EMPTY:
+                    return i
+        return -1
+
+    def _place(self, key_hash: int, key: K, value: V) -> KeyValuePair[K, V] | None:
+        # Store the entry in the tables, evicting other entries to their other
+        # bucket when both buckets are full. Return the entry left homeless
+        # after MAX_KICKS evictions, or None.
+        slot = self._free_slot(key_hash)
+        if slot >= 0:
+            self._hashes[slot] = key_hash
+            self._keys[slot] = key
+            self._values[slot] = value
+            return None
+
+        table = 0
+        for _ in range(MAX_KICKS):
+            base = self._base(table, self._bucket_of(table, key_hash))
+            victim = base + random.randrange(BUCKET_SLOTS)
+            key_hash, self._hashes[victim] = self._hashes[victim], key_hash
+            key, self._keys[victim] = self._keys[victim], key
+            value, self._values[victim] = self._values[victim], value
+
+            # the evicted entry moves to its bucket in the other table
+            table ^= 1
+            base = self._base(table, self._bucket_of(table, key_hash))
+            for i in range(base, base + BUCKET_SLOTS):
+                if self._keys[i] is _EMPTY:
+                    self._hashes[i] = key_hash
+                    self._keys[i] = key
+                    self._values[i] = value
+                    return None
+
+        return KeyValuePair(key, value, key_hash)
+
+    def _insert(self, key: K, key_hash: int, value: V) -> None:
+        self.length += 1
+        if self.length / self.capacity > DEFAULT_LOAD_FACTOR:
+            self._reallocate_container()
+
+        homeless = self._place(key_hash, key, value)
+        if homeless is not None:
+            self._stash.append(homeless)
+            if len(self._stash) > self._stash_limit:
+                self._reallocate_container()
+
+    def put(self, key: K, value: V) -> None:
+        key_hash = hash(key)
+        if self._find(key, key_hash) is not None:
+            raise KeyError(f"Key: {key} already exists!")
+
+        self._insert(key, key_hash, value)
+
+    def update(self, key: K, value: V):
+        slot = self._find(key, hash(key))
+        if slot is None:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        self._set_value_at(slot, value)
+
+    def get(self, key: K):
+        slot = self._find(key, hash(key))
+        if slot is None:
+            return None
+
+        return self._value_at(slot)
+
+    def remove(self, key: K):
+        slot = self._find(key, hash(key))
+        if slot is None:
+            return None
+
+        self.length -= 1
+        if isinstance(slot, KeyValuePair):
+            self._stash.remove(slot)
+            return slot
+
+        kv_pair = KeyValuePair(self._keys[slot], self._values[slot], self._hashes[slot])
+        self._hashes[slot] = 0
+        self._keys[slot] = _EMPTY
+        self._values[slot] = None
+
+        # the freed slot may take back a stashed entry
+        for stashed in self._stash:
+            free = self._free_slot(stashed.hash)
+            if free >= 0:
+                self._hashes[free] = stashed.hash
+                self._keys[free] = stashed.key
+                self._values[free] = stashed.value
+                self._stash.remove(stashed)
+                break
+
+        return kv_pair
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove key and return its value, or default if given and the key is missing"""
+        return _pop_removed(self.remove(key), key, default)
+
+    def _reallocate_container(self):
+        old_capacity = self.capacity
+        entries = [
+            (key_hash, key, value)
+            for key_hash, key, value in zip(self._hashes, self._keys, self._values)
+            if key is not _EMPTY
+        ]
+        entries.extend((kv_pair.hash, kv_pair.key, kv_pair.value) for kv_pair in self._stash)
+
+        # Double the tables and place the entries again, using the cached hashes
+        self._allocate(self._buckets * 2)
+        self._stash = []
+        for key_hash, key, value in entries:
+            homeless = self._place(key_hash, key, value)
+            if homeless is not None:
+                self._stash.append(homeless)
+
+        # Entries still homeless after doubling share their hashes with too many others
+        self._stash_limit = max(STASH_SIZE, 2 * len(self._stash))
+
+        self._record_resize(
+            old_capacity,
+            self.capacity,
+            len(entries),
+            sys.getsizeof(self._hashes) + sys.getsizeof(self._keys) + sys.getsizeof(self._values),
+        )
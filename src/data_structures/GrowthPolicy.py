@@ -0,0 +1,82 @@
+"""Capacity growth and shrink rules shared by the dynamic array structures."""
+
+DEFAULT_GROWTH_FACTOR = 2
+DEFAULT_MIN_STEP = 1
+DEFAULT_SHRINK_THRESHOLD = 0.25
+DEFAULT_MIN_CAPACITY = 64
+
+
+class GrowthPolicy:
+    """
+    Decides the new capacity of ArrayList and RingBuffer when they grow or shrink
+
+    Growing multiplies the capacity by `factor`, adds at least `min_step` slots
+    and, when `max_headroom` is set, never leaves more than `max_headroom`
+    free slots after the requested size.
+
+    Shrinking happens once the length drops below `shrink_threshold * capacity`
+    and reallocates to `factor * length`. Because `factor * shrink_threshold < 1`,
+    the new capacity sits well between the grow and shrink points (hysteresis),
+    so alternating push/pop around a boundary does not reallocate every time.
+    Structures never shrink below `min_capacity`, nor below the capacity
+    passed to their `reserve()`, and `shrink_threshold=None` disables
+    shrinking altogether.
+    """
+
+    factor: float
+    min_step: int
+    max_headroom: int | None
+    shrink_threshold: float | None
+    min_capacity: int
+
+    def __init__(
+        self,
+        factor: float = DEFAULT_GROWTH_FACTOR,
+        min_step: int = DEFAULT_MIN_STEP,
+        max_headroom: int | None = None,
+        shrink_threshold: float | None = DEFAULT_SHRINK_THRESHOLD,
+        min_capacity: int = DEFAULT_MIN_CAPACITY,
+    ) -> None:
+        if factor <= 1:
+            raise ValueError("Growth factor must be greater than 1")
+
+        if min_step < 1:
+            raise ValueError("Minimum growth step must be at least 1")
+
+        if shrink_threshold is not None and not 0 < shrink_threshold * factor < 1:
+            raise ValueError("Shrink threshold multiplied by the growth factor must be below 1")
+
+        self.factor = factor
+        self.min_step = min_step
+        self.max_headroom = max_headroom
+        self.shrink_threshold = shrink_threshold
+        self.min_capacity = min_capacity
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(factor={self.factor}, min_step={self.min_step}, "
+            f"max_headroom={self.max_headroom}, shrink_threshold={self.shrink_threshold}, "
+            f"min_capacity={self.min_capacity})"
+        )
+
+    def grow(self, capacity: int, required: int) -> int:
+        """Return the capacity to grow to so that at least `required` items fit"""
+        new_capacity = max(int(capacity * self.factor), capacity + self.min_step)
+        if self.max_headroom is not None:
+            new_capacity = min(new_capacity, required + self.max_headroom)
+
+        return max(new_capacity, required)
+
+    def shrink_limit(self, capacity: int, reserved: int = 0) -> int:
+        """Return the length below which a structure of this capacity should shrink"""
+        if self.shrink_threshold is None or capacity <= max(self.min_capacity, reserved):
+            return 0
+
+        return int(capacity * self.shrink_threshold)
+
+    def shrink(self, length: int, reserved: int = 0) -> int:
+        """Return the capacity to shrink to for the given length"""
+        return max(int(length * self.factor), self.min_capacity, reserved)
+
+
+DEFAULT_GROWTH_POLICY = GrowthPolicy()
@@ -1,17 +1,47 @@
-from typing import Generic, TypeVar
+import math
+import sys
+import time
+from collections import Counter
+from collections.abc import Mapping, Sized
+from itertools import chain
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
 
 from .ArrayList import ArrayList
+from .BloomFilter import BloomFilter
+from .Instrumentation import Instrumented
 
 K = TypeVar("K")
 V = TypeVar("V")
 DEFAULT_CAPACITY = 10
 DEFAULT_LOAD_FACTOR = 0.7
+# The table is halved when the load drops below load_factor / SHRINK_RATIO
+SHRINK_RATIO = 4
+# Number of old buckets moved to the new table by each operation during an incremental resize
+REHASH_STEP = 4
+
+# Marks a missing default argument, since None is a valid value
+_MISSING = object()
+
+
+def _pop_removed(kv_pair: "KeyValuePair | None", key, default):
+    # pop() of the maps whose remove() returns the removed pair, or None if key is missing
+    if kv_pair is None:
+        if default is _MISSING:
+            raise KeyError(f"Key: {key} does not exist!")
+        return default
+
+    return kv_pair.value
 
 
 class KeyValuePair(Generic[K, V]):
-    def __init__(self, key: K, value: V) -> None:
+    # The hash of the key is cached so that resizes never call __hash__ again
+    # and lookups can compare hashes before calling __eq__
+    __slots__ = ("key", "value", "hash")
+
+    def __init__(self, key: K, value: V, key_hash: int | None = None) -> None:
         self.key = key
         self.value = value
+        self.hash = hash(key) if key_hash is None else key_hash
 
     def __str__(self) -> str:
         if isinstance(self.key, str):
@@ -28,107 +58,487 @@ class KeyValuePair(Generic[K, V]):
         return self.__str__()
 
 
-class HashMap(Generic[K, V]):
-    capacity: int
+class HashMapStats:
+    """Snapshot of the bucket distribution and resize history of a HashMap"""
+
     length: int
-    _data_container: ArrayList[ArrayList[KeyValuePair[K, V]]]
+    capacity: int
+    load_factor: float
+    bucket_histogram: dict[int, int]
+    max_chain: int
+    mean_chain: float
+    resizes: int
+    resize_seconds: float
+
+    def __init__(
+        self,
+        length: int,
+        capacity: int,
+        bucket_histogram: dict[int, int],
+        resizes: int,
+        resize_seconds: float,
+    ) -> None:
+        self.length = length
+        self.capacity = capacity
+        self.load_factor = length / capacity
+        # number of buckets holding each chain length, including the empty buckets
+        self.bucket_histogram = bucket_histogram
+        self.max_chain = max(bucket_histogram, default=0)
+        # mean length of the non-empty chains
+        non_empty = capacity - bucket_histogram.get(0, 0)
+        self.mean_chain = length / non_empty if non_empty else 0.0
+        self.resizes = resizes
+        self.resize_seconds = resize_seconds
 
-    def __init__(self) -> None:
-        self.capacity = DEFAULT_CAPACITY
-        self.length = 0
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(length={self.length}, capacity={self.capacity}, "
+            f"load_factor={self.load_factor:.3f}, max_chain={self.max_chain}, "
+            f"mean_chain={self.mean_chain:.3f}, bucket_histogram={self.bucket_histogram}, "
+            f"resizes={self.resizes}, resize_seconds={self.resize_seconds:.6f})"
+        )
+
+
+class HashMap(Instrumented, Generic[K, V]):
+    """
+    Hash map using separate chaining with ArrayList buckets
+
+    The table doubles when the load (length / capacity) would exceed
+    `load_factor` and halves, down to its initial capacity, when removals
+    drop it below `load_factor / SHRINK_RATIO`. Passing `expected_size`
+    sizes the table up front so that inserting that many keys never
+    resizes, even after removals.
+
+    With `incremental_resize=True` a resize only allocates the new table:
+    the old table stays alive and every following operation moves
+    REHASH_STEP of its buckets to the new one, so no single operation pays
+    for rehashing the whole map. The step grows when the load is close to
+    the next resize threshold, as after a shrink, so that a migration
+    always ends before the next resize starts. Until the migration completes, lookups
+    check the bucket of the key in both tables and new keys always go to
+    the new table. Buckets are only created on their first insert, so
+    allocating a table costs a single flat list of empty slots.
+
+    With `bloom_false_positive_rate` set, a counting BloomFilter of the key
+    hashes is consulted before probing, so most lookups of missing keys
+    return without touching a bucket. The filter is rebuilt from the cached
+    hashes when the table outgrows it, sized for one more doubling. With
+    `incremental_resize=True` it is never rebuilt, so `expected_size`
+    should cover the final size.
+    """
 
-        self._data_container = ArrayList()
-        for _ in range(self.capacity):
-            self._data_container.push(ArrayList())
+    capacity: int
+    length: int
+    load_factor: float
+    incremental_resize: bool
+    min_capacity: int
+    bloom_filter: BloomFilter[K] | None
+    _data_container: ArrayList[ArrayList[KeyValuePair[K, V]] | None]
+    _old_container: ArrayList[ArrayList[KeyValuePair[K, V]] | None] | None
+    _rehash_idx: int
+    _rehash_buckets: int
+
+    def __init__(
+        self,
+        expected_size: int = 0,
+        load_factor: float = DEFAULT_LOAD_FACTOR,
+        incremental_resize: bool = False,
+        bloom_false_positive_rate: float | None = None,
+    ) -> None:
+        if load_factor <= 0:
+            raise ValueError("Load factor must be greater than 0")
+        if expected_size < 0:
+            raise ValueError("Expected size cannot be negative")
+
+        self.capacity = max(DEFAULT_CAPACITY, math.ceil(expected_size / load_factor))
+        # the table never shrinks below its presized capacity
+        self.min_capacity = self.capacity
+        self.length = 0
+        self.load_factor = load_factor
+        self.incremental_resize = incremental_resize
+        self._old_container = None
+        self._rehash_idx = 0
+        self._rehash_buckets = REHASH_STEP
+
+        self._data_container = self._new_container(self.capacity)
+        self.bloom_filter = None
+        if bloom_false_positive_rate is not None:
+            self.bloom_filter = BloomFilter(
+                math.floor(self.capacity * load_factor), bloom_false_positive_rate, counting=True)
 
     def __str__(self) -> str:
-        output = "{"
-        for sub_array in self._data_container:
-            for kv_pair in sub_array:
-                output += f", {kv_pair}"
-        output = output.replace(", ", "", 1)
-        output += "}"
-        return output
+        pairs = (str(kv_pair) for bucket in self._buckets() for kv_pair in bucket.view())
+        return "{" + ", ".join(pairs) + "}"
 
     def __repr__(self) -> str:
         output = ""
         for i in range(self.capacity):
-            output += f"{str(i).zfill(3)} -> {self._data_container[i]}\n"
+            bucket = self._data_container[i]
+            output += f"{str(i).zfill(3)} -> {'[]' if bucket is None else bucket}\n"
         return output
 
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, key: K) -> bool:
+        return self._find(key, hash(key))[1] >= 0
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def keys(self) -> Iterator[K]:
+        return (kv_pair.key for kv_pair in self._entries())
+
+    def values(self) -> Iterator[V]:
+        return (kv_pair.value for kv_pair in self._entries())
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        return ((kv_pair.key, kv_pair.value) for kv_pair in self._entries())
+
+    def _entries(self) -> Iterator[KeyValuePair[K, V]]:
+        # Stream the entries straight from the buckets. Any insert or removal
+        # during the iteration changes the length or replaces the table and is
+        # reported instead of silently skipping or repeating entries.
+        if self._old_container is not None:
+            # lookups in the loop body must not move entries between the tables
+            self._finish_rehash()
+
+        length = self.length
+        container = self._data_container
+        for bucket in filter(None, container.view()):
+            for kv_pair in bucket.view():
+                yield kv_pair
+                if self.length != length or self._data_container is not container:
+                    raise RuntimeError(f"{self.__class__.__name__} changed size during iteration")
+
     def __getitem__(self, key: K):
-        if not self._is_key_in_container(key):
+        bucket, pos = self._find(key, hash(key))
+        if pos < 0:
             raise KeyError(f"Key: {key} does not exist!")
 
-        return self.get(key)
+        return bucket[pos].value
 
     def __setitem__(self, key: K, value: V):
-        if self._is_key_in_container(key):
-            self.update(key, value)
+        key_hash = hash(key)
+        bucket, pos = self._find(key, key_hash)
+        if pos < 0:
+            self._insert(key, key_hash, value)
         else:
-            self.put(key, value)
+            bucket[pos].value = value
+
+    def _find(self, key: K, key_hash: int) -> tuple[ArrayList[KeyValuePair[K, V]] | None, int]:
+        # Single probe shared by all the public operations:
+        # return the bucket of the key and the position of the key in it, or -1
+        # (the bucket may then be None if it was never created)
+        if self._old_container is not None:
+            self._rehash_step(self._rehash_buckets)
+
+        if self.bloom_filter is not None and not self.bloom_filter.contains_hash(key_hash):
+            return None, -1
+
+        if self._old_container is not None:
+            # buckets before _rehash_idx have already been moved to the new table
+            old_idx = key_hash % len(self._old_container)
+            old_bucket = self._old_container[old_idx]
+            if old_idx >= self._rehash_idx and old_bucket is not None:
+                for pos in range(len(old_bucket)):
+                    entry = old_bucket[pos]
+                    if entry.hash == key_hash and (entry.key is key or entry.key == key):
+                        return old_bucket, pos
+
+        bucket = self._data_container[key_hash % self.capacity]
+        if bucket is not None:
+            for pos in range(len(bucket)):
+                entry = bucket[pos]
+                if entry.hash == key_hash and (entry.key is key or entry.key == key):
+                    return bucket, pos
+
+        return bucket, -1
+
+    def _reserve(self, count: int) -> None:
+        # Grow the table once so that count more keys fit under the load factor
+        required = self.length + count
+        if required / self.capacity > self.load_factor:
+            if self._old_container is not None:
+                self._finish_rehash()
+            self._reallocate_container(
+                max(self.capacity * 2, math.ceil(required / self.load_factor)))
+
+    def _insert(self, key: K, key_hash: int, value: V) -> None:
+        # The key is known to be missing, so after a resize it is placed without another scan
+        self._reserve(1)
+        self._add_entry(KeyValuePair(key, value, key_hash))
+
+    def _add_entry(self, kv_pair: KeyValuePair[K, V]) -> None:
+        self._push_entry(kv_pair)
+        self.length += 1
+        if self.bloom_filter is not None:
+            self.bloom_filter.add_hash(kv_pair.hash)
+
+    def _remove_entry(self, bucket: ArrayList[KeyValuePair[K, V]], pos: int) -> KeyValuePair[K, V]:
+        self.length -= 1
+        kv_pair = bucket.remove(pos)
+        if self.bloom_filter is not None:
+            self.bloom_filter.remove_hash(kv_pair.hash)
+        self._shrink_if_sparse()
+        return kv_pair
+
+    def _push_entry(self, kv_pair: KeyValuePair[K, V]) -> None:
+        idx = kv_pair.hash % self.capacity
+        bucket = self._data_container[idx]
+        if bucket is None:
+            bucket = self._data_container[idx] = ArrayList()
+        bucket.push(kv_pair)
 
     def _is_key_in_container(self, key: K):
-        idx = hash(key) % self.capacity
-        return any(key == kv_pair.key for kv_pair in self._data_container[idx])
+        return key in self
 
     def put(self, key: K, value: V) -> None:
-        if self._is_key_in_container(key):
+        key_hash = hash(key)
+        if self._find(key, key_hash)[1] >= 0:
             raise KeyError(f"Key: {key} already exists!")
 
-        if (self.length + 1) / self.capacity > DEFAULT_LOAD_FACTOR:
-            self._reallocate_container()
-
-        idx = hash(key) % self.capacity
-
-        self._data_container[idx].push(KeyValuePair(key, value))
-        self.length += 1
+        self._insert(key, key_hash, value)
 
     def update(self, key: K, value: V):
-        if not self._is_key_in_container(key):
+        bucket, pos = self._find(key, hash(key))
+        if pos < 0:
             raise KeyError(f"Key: {key} does not exist!")
 
-        idx = hash(key) % self.capacity
-        for kv_pair in self._data_container[idx]:
-            if key == kv_pair.key:
-                kv_pair.value = value
+        bucket[pos].value = value
 
     def get(self, key: K):
-        idx = hash(key) % self.capacity
-        for kv_pair in self._data_container[idx]:
-            if key == kv_pair.key:
-                return kv_pair.value
-
-        return None
-
-    def remove(self, key: K):
-        idx = hash(key) % self.capacity
-        sub_array = self._data_container[idx]
+        bucket, pos = self._find(key, hash(key))
+        if pos < 0:
+            return None
 
-        for idx, kv_pair in enumerate(sub_array):
-            if key == kv_pair.key:
-                self.length -= 1
-                return sub_array.remove(idx)
+        return bucket[pos].value
 
-        return None
+    def setdefault(self, key: K, default: V = None) -> V:
+        """Return the value of key, inserting default first if the key is missing"""
+        key_hash = hash(key)
+        bucket, pos = self._find(key, key_hash)
+        if pos >= 0:
+            return bucket[pos].value
 
-    def _reallocate_container(self):
-        print(
-            f"Load factor {DEFAULT_LOAD_FACTOR} reached. Reallocating data container.")
-        self.capacity = self.capacity * 2
+        self._insert(key, key_hash, default)
+        return default
 
-        new_data_container: ArrayList[ArrayList[KeyValuePair]] = ArrayList()
-        for _ in range(self.capacity):
-            new_data_container.push(ArrayList())
+    def get_or_insert(self, key: K, factory: Callable[[], V]) -> V:
+        """Return the value of key, inserting factory() first if the key is missing"""
+        key_hash = hash(key)
+        bucket, pos = self._find(key, key_hash)
+        if pos >= 0:
+            return bucket[pos].value
 
-        # rehash keys and add them to the new container
-        for item in self._data_container:
-            if len(item) == 0:
-                continue
+        value = factory()
+        self._insert(key, key_hash, value)
+        return value
 
-            for kv_pair in item:
-                idx = hash(kv_pair.key) % self.capacity
-                new_data_container[idx].push(
-                    KeyValuePair(kv_pair.key, kv_pair.value))
-
-        self._data_container = new_data_container
+    def remove(self, key: K):
+        bucket, pos = self._find(key, hash(key))
+        if pos < 0:
+            return None
+
+        return self._remove_entry(bucket, pos)
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove key and return its value, or default if given and the key is missing"""
+        bucket, pos = self._find(key, hash(key))
+        if pos < 0:
+            if default is _MISSING:
+                raise KeyError(f"Key: {key} does not exist!")
+            return default
+
+        return self._remove_entry(bucket, pos).value
+
+    def stats(self) -> HashMapStats:
+        """
+        Return the load, chain lengths and resize history of the map
+        Runtime: O(capacity), counting the bucket lengths without touching the entries
+        """
+        capacity = self.capacity
+        if self._old_container is not None:
+            capacity += len(self._old_container) - self._rehash_idx
+
+        histogram = Counter(map(len, self._buckets()))
+        histogram[0] += capacity - sum(histogram.values())
+
+        allocation_stats = self._allocation_stats
+        return HashMapStats(
+            self.length,
+            capacity,
+            dict(sorted(histogram.items())),
+            allocation_stats.resizes if allocation_stats else 0,
+            allocation_stats.resize_seconds if allocation_stats else 0.0,
+        )
+
+    @classmethod
+    def from_pairs(
+        cls,
+        pairs: Iterable[tuple[K, V]],
+        load_factor: float = DEFAULT_LOAD_FACTOR,
+        incremental_resize: bool = False,
+        bloom_false_positive_rate: float | None = None,
+    ) -> "HashMap[K, V]":
+        """
+        Build a map from (key, value) pairs, later pairs overwriting earlier ones
+        Runtime: O(n), the table is sized once for all the pairs
+        """
+        if not isinstance(pairs, Sized):
+            pairs = list(pairs)
+
+        hash_map = cls(
+            expected_size=len(pairs),
+            load_factor=load_factor,
+            incremental_resize=incremental_resize,
+            bloom_false_positive_rate=bloom_false_positive_rate,
+        )
+        entries = ((key, hash(key), value) for key, value in pairs)
+        hash_map._put_hashed(entries, overwrite=True)
+        return hash_map
+
+    def merge(self, other: "HashMap[K, V] | Mapping[K, V] | Iterable[tuple[K, V]]") -> None:
+        """
+        Insert or overwrite every key of another HashMap, a mapping or (key, value) pairs
+        Runtime: O(k), the table is resized at most once
+        """
+        if other is self:
+            return
+
+        if isinstance(other, HashMap):
+            # the entries of another HashMap carry their hash already
+            self._reserve(other.length)
+            entries = (
+                (kv_pair.key, kv_pair.hash, kv_pair.value)
+                for bucket in other._buckets() for kv_pair in bucket.view()
+            )
+        else:
+            pairs = other.items() if isinstance(other, Mapping) else other
+            if not isinstance(pairs, Sized):
+                pairs = list(pairs)
+            self._reserve(len(pairs))
+            entries = ((key, hash(key), value) for key, value in pairs)
+
+        self._put_hashed(entries, overwrite=True)
+
+    def put_many(self, pairs: Iterable[tuple[K, V]]) -> None:
+        """
+        Insert (key, value) pairs like put, raising KeyError on the first existing key
+        Runtime: O(k), the table is resized at most once
+        """
+        if not isinstance(pairs, Sized):
+            pairs = list(pairs)
+
+        self._reserve(len(pairs))
+        self._put_hashed(((key, hash(key), value) for key, value in pairs), overwrite=False)
+
+    def get_many(self, keys: Iterable[K], default: V = None) -> list[V]:
+        """Return the values of keys, default for the missing ones"""
+        values = []
+        for key in keys:
+            bucket, pos = self._find(key, hash(key))
+            values.append(default if pos < 0 else bucket[pos].value)
+
+        return values
+
+    def _put_hashed(self, entries: Iterable[tuple[K, int, V]], overwrite: bool) -> None:
+        # The table has been reserved for all the entries, so there is no load check per key
+        for key, key_hash, value in entries:
+            bucket, pos = self._find(key, key_hash)
+            if pos < 0:
+                self._add_entry(KeyValuePair(key, value, key_hash))
+            elif overwrite:
+                bucket[pos].value = value
+            else:
+                raise KeyError(f"Key: {key} already exists!")
+
+    @staticmethod
+    def _new_container(capacity: int) -> ArrayList[ArrayList[KeyValuePair[K, V]] | None]:
+        return ArrayList([None] * capacity)
+
+    def _buckets(self) -> Iterator[ArrayList[KeyValuePair[K, V]]]:
+        # Existing buckets of both tables while an incremental resize is in progress
+        buckets = self._data_container.view()
+        if self._old_container is not None:
+            buckets = chain(self._old_container.view(self._rehash_idx), buckets)
+        return filter(None, buckets)
+
+    def _rehash_step(self, buckets: int = REHASH_STEP) -> None:
+        # Move the next old buckets to the new table, using the cached hashes
+        start = time.perf_counter()
+        old_container = self._old_container
+        stop = min(self._rehash_idx + buckets, len(old_container))
+        for idx in range(self._rehash_idx, stop):
+            old_bucket = old_container[idx]
+            if old_bucket is not None:
+                for pos in range(len(old_bucket)):
+                    self._push_entry(old_bucket[pos])
+                old_container[idx] = None
+
+        self._rehash_idx = stop
+        if stop == len(old_container):
+            self._old_container = None
+            self._rehash_idx = 0
+
+        self.allocation_stats.resize_seconds += time.perf_counter() - start
+
+    def _finish_rehash(self) -> None:
+        self._rehash_step(len(self._old_container))
+
+    def _shrink_if_sparse(self) -> None:
+        # A shrink never finishes a running migration, which would stall this removal
+        # for the whole old table; _rehash_buckets makes it end before the threshold
+        if (
+            self._old_container is None
+            and self.capacity > self.min_capacity
+            and self.length / self.capacity < self.load_factor / SHRINK_RATIO
+        ):
+            self._reallocate_container(max(self.min_capacity, self.capacity // 2))
+
+    def _reallocate_container(self, capacity: int):
+        start = time.perf_counter()
+        old_capacity = self.capacity
+        self.capacity = capacity
+
+        new_data_container = self._new_container(self.capacity)
+        allocated = sys.getsizeof(new_data_container._array)
+
+        if self.incremental_resize:
+            # the entries are moved by the following operations, see _rehash_step
+            self._old_container = self._data_container
+            self._rehash_idx = 0
+            self._data_container = new_data_container
+            copied = 0
+
+            # operations left before the load crosses the grow or the shrink threshold,
+            # each of them must move enough old buckets to end the migration in time
+            headroom = min(
+                capacity * self.load_factor - self.length,
+                self.length - capacity * self.load_factor / SHRINK_RATIO,
+            )
+            self._rehash_buckets = max(REHASH_STEP, math.ceil(old_capacity / max(1, headroom)))
+        else:
+            # move the existing entries to the new container using their cached hashes
+            old_container = self._data_container
+            self._data_container = new_data_container
+            for item in filter(None, old_container.view()):
+                for kv_pair in item:
+                    self._push_entry(kv_pair)
+            copied = self.length
+
+            expected_size = math.floor(capacity * self.load_factor)
+            if self.bloom_filter is not None and expected_size > self.bloom_filter.expected_size:
+                # a filter sized for the old table would fill up and answer "possibly present",
+                # the new one also covers the next doubling so that only every other resize
+                # rebuilds it
+                bloom_filter = BloomFilter(
+                    2 * expected_size, self.bloom_filter.false_positive_rate, counting=True)
+                for kv_pair in self._entries():
+                    bloom_filter.add_hash(kv_pair.hash)
+                self.bloom_filter = bloom_filter
+
+        seconds = time.perf_counter() - start
+        if not self.incremental_resize:
+            allocated += sum(sys.getsizeof(bucket._array) for bucket in self._buckets())
+        self._record_resize(old_capacity, self.capacity, copied, allocated, seconds)
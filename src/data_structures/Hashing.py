@@ -0,0 +1,25 @@
+# Fibonacci hashing: hash * 2**64 / golden ratio (mod 2**64) spreads every bit of the
+# hash into the high bits, so these bits pick a slot that does not follow the low bits
+FIBONACCI = 0x9E3779B97F4A7C15
+MASK_64 = (1 << 64) - 1
+
+
+def fibonacci_mix(key_hash: int) -> int:
+    """Return key_hash * FIBONACCI (mod 2**64), also for negative hashes"""
+    return ((key_hash & MASK_64) * FIBONACCI) & MASK_64
+
+
+def fibonacci_slot(key_hash: int, bits: int) -> int:
+    """Return the slot of key_hash in a table of 2**bits slots, from the high bits of the mix"""
+    return fibonacci_mix(key_hash) >> (64 - bits)
+
+
+def rebuilt_capacity(length: int, capacity: int, load_factor: float) -> int:
+    """
+    Capacity of an open-addressing table rebuilt to drop its tombstones
+    Doubles only if the live keys alone exceed half of the load factor,
+    otherwise rebuilding at the same capacity is enough
+    """
+    if length / capacity > load_factor / 2:
+        return capacity * 2
+    return capacity
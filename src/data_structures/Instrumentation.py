@@ -0,0 +1,85 @@
+"""Allocation counters and hooks for the resize paths of the dynamic data structures."""
+from typing import Callable
+
+# hook(owner, old_capacity, new_capacity, elements_copied, bytes_allocated)
+ResizeHook = Callable[[object, int, int, int, int], None]
+
+_hooks: list[ResizeHook] = []
+
+
+class AllocationStats:
+    """Counters of the reallocations performed by one data structure"""
+
+    resizes: int
+    elements_copied: int
+    bytes_allocated: int
+    peak_capacity: int
+    resize_seconds: float
+
+    def __init__(self) -> None:
+        self.resizes = 0
+        self.elements_copied = 0
+        self.bytes_allocated = 0
+        self.peak_capacity = 0
+        self.resize_seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(resizes={self.resizes}, "
+            f"elements_copied={self.elements_copied}, bytes_allocated={self.bytes_allocated}, "
+            f"peak_capacity={self.peak_capacity}, resize_seconds={self.resize_seconds:.6f})"
+        )
+
+    def record(
+        self, new_capacity: int, elements_copied: int, bytes_allocated: int, seconds: float = 0.0
+    ) -> None:
+        self.resizes += 1
+        self.elements_copied += elements_copied
+        self.bytes_allocated += bytes_allocated
+        self.peak_capacity = max(self.peak_capacity, new_capacity)
+        self.resize_seconds += seconds
+
+
+class Instrumented:
+    """
+    Mixin that records the reallocations of a data structure
+
+    The per-instance AllocationStats object is only created on the first
+    resize, so structures that never resize carry no extra state, and the
+    registered hooks are only consulted when there is at least one.
+    """
+
+    _allocation_stats: AllocationStats | None = None
+
+    @property
+    def allocation_stats(self) -> AllocationStats:
+        if self._allocation_stats is None:
+            self._allocation_stats = AllocationStats()
+        return self._allocation_stats
+
+    def _record_resize(
+        self,
+        old_capacity: int,
+        new_capacity: int,
+        elements_copied: int,
+        bytes_allocated: int,
+        seconds: float = 0.0,
+    ) -> None:
+        self.allocation_stats.record(new_capacity, elements_copied, bytes_allocated, seconds)
+
+        for hook in _hooks:
+            hook(self, old_capacity, new_capacity, elements_copied, bytes_allocated)
+
+
+def register_hook(hook: ResizeHook) -> None:
+    """
+    Call hook(owner, old_capacity, new_capacity, elements_copied, bytes_allocated)
+    after every resize of any instrumented data structure
+    """
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def unregister_hook(hook: ResizeHook) -> None:
+    if hook in _hooks:
+        _hooks.remove(hook)
@@ -0,0 +1,284 @@
+import operator
+import sys
+from typing import Iterator
+
+import numpy as np
+
+from .Hashing import FIBONACCI, fibonacci_slot
+from .HashMap import _MISSING, KeyValuePair, _pop_removed
+from .Instrumentation import Instrumented
+
+DEFAULT_CAPACITY = 16
+DEFAULT_LOAD_FACTOR = 0.5
+DEFAULT_DTYPE = "int64"
+
+# Slot states
+_EMPTY = 0
+_FULL = 1
+_DELETED = 2
+
+
+class IntHashMap(Instrumented):
+    """
+    Hash map from int64 keys to numeric values, stored in NumPy arrays
+
+    Keys, values and slot states live in three flat NumPy arrays of
+    `capacity` slots (a power of two), probed linearly like
+    OpenAddressingHashMap. On top of the scalar HashMap API, `get_many`,
+    `contains_many` and `put_many` take whole arrays of keys and run the
+    hashing and the probing as vectorized NumPy passes, one pass per probe
+    step instead of one Python iteration per key.
+
+    The load factor is kept at 0.5 so that probe sequences, and therefore
+    the number of vectorized passes, stay short.
+    """
+
+    capacity: int
+    length: int
+    dtype: np.dtype
+    _used: int
+    _bits: int
+    _states: np.ndarray
+    _keys: np.ndarray
+    _values: np.ndarray
+
+    def __init__(self, dtype: np.dtype | str = DEFAULT_DTYPE) -> None:
+        self.dtype = np.dtype(dtype)
+        self.length = 0
+        self._allocate(DEFAULT_CAPACITY)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(str(KeyValuePair(key, value)) for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.__str__()}"
+
+    def __getitem__(self, key: int):
+        slot = self._find_slot(operator.index(key))
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        return self._values[slot].item()
+
+    def __setitem__(self, key: int, value):
+        key = operator.index(key)
+        slot = self._find_slot(key)
+        if slot >= 0:
+            self._values[slot] = value
+        else:
+            self._insert(key, value)
+
+    def __contains__(self, key: int) -> bool:
+        return self._find_slot(operator.index(key)) >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.keys().tolist())
+
+    def keys(self) -> np.ndarray:
+        """Return a copy of the keys as a NumPy array, in slot order"""
+        return self._keys[self._states == _FULL]
+
+    def values(self) -> np.ndarray:
+        """Return a copy of the values as a NumPy array, in the same order as keys()"""
+        return self._values[self._states == _FULL]
+
+    def items(self) -> Iterator[tuple[int, object]]:
+        full = self._states == _FULL
+        return zip(self._keys[full].tolist(), self._values[full].tolist())
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._bits = capacity.bit_length() - 1
+        self._used = 0
+        self._states = np.zeros(capacity, dtype=np.int8)
+        self._keys = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros(capacity, dtype=self.dtype)
+
+    def _slot_of(self, key: int) -> int:
+        return fibonacci_slot(key, self._bits)
+
+    def _slots_of(self, keys: np.ndarray) -> np.ndarray:
+        # uint64 arithmetic wraps around, which is the mod 2**64 of fibonacci_slot
+        hashed = keys.astype(np.uint64) * np.uint64(FIBONACCI)
+        return (hashed >> np.uint64(64 - self._bits)).astype(np.int64)
+
+    def _find_slot(self, key: int) -> int:
+        # Return the slot holding key, or -1
+        states = self._states
+        keys = self._keys
+        mask = self.capacity - 1
+        slot = self._slot_of(key)
+
+        while True:
+            state = states[slot]
+            if state == _EMPTY:
+                return -1
+            if state == _FULL and keys[slot] == key:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _find_slots(self, keys: np.ndarray) -> np.ndarray:
+        # Vectorized _find_slot: every pass advances the keys still probing by one slot
+        mask = self.capacity - 1
+        slots = self._slots_of(keys)
+        found = np.full(len(keys), -1, dtype=np.int64)
+        pending = np.arange(len(keys))
+
+        while pending.size:
+            current = slots[pending]
+            states = self._states[current]
+            hit = (states == _FULL) & (self._keys[current] == keys[pending])
+            found[pending[hit]] = current[hit]
+
+            probing = ~hit & (states != _EMPTY)
+            pending = pending[probing]
+            slots[pending] = (current[probing] + 1) & mask
+
+        return found
+
+    def _insert(self, key: int, value) -> None:
+        # The key is known to be missing
+        self._reserve(1)
+        mask = self.capacity - 1
+        slot = self._slot_of(key)
+        while self._states[slot] == _FULL:
+            slot = (slot + 1) & mask
+
+        if self._states[slot] == _EMPTY:
+            self._used += 1
+        self._states[slot] = _FULL
+        self._keys[slot] = key
+        self._values[slot] = value
+        self.length += 1
+
+    def _insert_many(self, keys: np.ndarray, values: np.ndarray) -> None:
+        # Vectorized _insert for keys known to be missing and distinct. In every
+        # pass, the first key aiming at each free slot claims it and all the
+        # other keys move on to their next slot.
+        mask = self.capacity - 1
+        slots = self._slots_of(keys)
+        pending = np.arange(len(keys))
+        claimed = np.zeros(len(keys), dtype=bool)
+
+        while pending.size:
+            current = slots[pending]
+            free = self._states[current] != _FULL
+            targets, first = np.unique(current[free], return_index=True)
+            winners = pending[free][first]
+
+            self._used += int(np.count_nonzero(self._states[targets] == _EMPTY))
+            self._states[targets] = _FULL
+            self._keys[targets] = keys[winners]
+            self._values[targets] = values[winners]
+            claimed[winners] = True
+
+            pending = pending[~claimed[pending]]
+            slots[pending] = (slots[pending] + 1) & mask
+
+        self.length += len(keys)
+
+    def _reserve(self, count: int) -> None:
+        if (self._used + count) / self.capacity > DEFAULT_LOAD_FACTOR:
+            self._reallocate_container(self.length + count)
+
+    def put(self, key: int, value) -> None:
+        key = operator.index(key)
+        if self._find_slot(key) >= 0:
+            raise KeyError(f"Key: {key} already exists!")
+
+        self._insert(key, value)
+
+    def update(self, key: int, value):
+        slot = self._find_slot(operator.index(key))
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        self._values[slot] = value
+
+    def get(self, key: int):
+        slot = self._find_slot(operator.index(key))
+        if slot < 0:
+            return None
+
+        return self._values[slot].item()
+
+    def remove(self, key: int):
+        slot = self._find_slot(operator.index(key))
+        if slot < 0:
+            return None
+
+        kv_pair = KeyValuePair(self._keys[slot].item(), self._values[slot].item())
+        self._states[slot] = _DELETED
+        self.length -= 1
+        return kv_pair
+
+    def pop(self, key: int, default=_MISSING):
+        """Remove key and return its value, or default if given and the key is missing"""
+        return _pop_removed(self.remove(key), key, default)
+
+    def get_many(self, keys: np.ndarray, default=0) -> np.ndarray:
+        """
+        Return the values of an array of keys, default for the missing ones
+        Runtime: O(k) vectorized, in as many passes as the longest probe sequence
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        slots = self._find_slots(keys)
+        found = slots >= 0
+
+        values = np.full(len(keys), default, dtype=self.dtype)
+        values[found] = self._values[slots[found]]
+        return values
+
+    def contains_many(self, keys: np.ndarray) -> np.ndarray:
+        """Return a boolean array telling which keys are in the map"""
+        return self._find_slots(np.asarray(keys, dtype=np.int64)) >= 0
+
+    def put_many(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """
+        Insert arrays of keys and values like put, raising KeyError before inserting
+        anything if a key already exists or is repeated
+        Runtime: O(k) vectorized, the table is resized at most once
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        values = np.asarray(values, dtype=self.dtype)
+        if keys.shape != values.shape or keys.ndim != 1:
+            raise ValueError("Keys and values must be one-dimensional arrays of the same length")
+
+        unique, counts = np.unique(keys, return_counts=True)
+        if unique.size < keys.size:
+            raise KeyError(f"Key: {unique[counts > 1][0]} is repeated!")
+
+        existing = self._find_slots(keys) >= 0
+        if existing.any():
+            raise KeyError(f"Key: {keys[existing][0]} already exists!")
+
+        self._reserve(len(keys))
+        self._insert_many(keys, values)
+
+    def _reallocate_container(self, required: int | None = None):
+        old_capacity = self.capacity
+        required = self.length if required is None else required
+
+        # Double until the live keys fill at most half of the load factor,
+        # the rebuild drops the tombstones
+        capacity = self.capacity
+        while required / capacity > DEFAULT_LOAD_FACTOR / 2:
+            capacity *= 2
+
+        full = self._states == _FULL
+        keys = self._keys[full]
+        values = self._values[full]
+
+        self._allocate(capacity)
+        self.length = 0
+        self._insert_many(keys, values)
+
+        self._record_resize(
+            old_capacity,
+            self.capacity,
+            len(keys),
+            self._states.nbytes + self._keys.nbytes + self._values.nbytes,
+        )
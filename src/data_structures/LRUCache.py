@@ -17,13 +17,20 @@ class LRUCache(Generic[K, V]):
     lookup: HashMap[K, DoublyLinkedNode[V]]
     reverse_lookup: HashMap[DoublyLinkedNode[V], K]
 
-    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        bloom_false_positive_rate: float | None = None,
+    ) -> None:
         self.capacity = capacity
         self.length = 0
         self.head = None
         self.tail = None
-        self.lookup = HashMap()
-        self.reverse_lookup = HashMap()
+        # the cache briefly holds one item over capacity before evicting;
+        # misses are answered by the Bloom filter of the key lookup when enabled
+        self.lookup = HashMap(
+            expected_size=capacity + 1, bloom_false_positive_rate=bloom_false_positive_rate)
+        self.reverse_lookup = HashMap(expected_size=capacity + 1)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}"
@@ -0,0 +1,193 @@
+import mmap
+import os
+import struct
+from array import array
+from typing import BinaryIO
+
+from .ArrayList import ArrayList
+from .GrowthPolicy import DEFAULT_GROWTH_POLICY, GrowthPolicy
+
+DEFAULT_CAPACITY = 4
+DEFAULT_TYPECODE = "d"
+
+# magic, typecode, length, head
+HEADER_FORMAT = "<4sc3xQQ"
+HEADER_SIZE = 64
+MAGIC = b"MAL1"
+# length and head, rewritten together at the end of every mutation
+STATE_FORMAT = "<QQ"
+STATE_OFFSET = struct.calcsize("<4sc3x")
+
+
+class MappedArrayList(ArrayList):
+    """
+    Persistent ArrayList of fixed-size numeric records stored in a memory-mapped file
+
+    The file starts with a small header (magic, typecode, length and head)
+    followed by `capacity` records of the `typecode` item size. The storage
+    is a memoryview cast over the mapping, so the items never live in the
+    Python heap and opening an existing file only maps it, without reading
+    or deserializing anything. Growing and shrinking resize the file
+    following the same growth policy as ArrayList.
+
+    The length and head are written into the mapped header at the end of
+    every operation, after the records they cover, and before the slots
+    they no longer cover are cleared. A process that dies without
+    `close()` during a push, pop, enqueue or deque therefore leaves the
+    list as of its last completed operation. Inserts and removals in the
+    middle and reallocations move records in place and are not atomic.
+    `flush()` only forces the mapped pages to disk, to survive a crash of
+    the machine itself.
+    A mapping cannot be resized while its buffer is exported, so growing or
+    closing the list raises BufferError while a `view()` is alive, and
+    shrinking waits until the views are released.
+    """
+
+    path: str
+    _file: BinaryIO
+    _mmap: mmap.mmap | None
+    _array: memoryview
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        typecode: str | None = None,
+        growth_policy: GrowthPolicy = DEFAULT_GROWTH_POLICY,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.growth_policy = growth_policy
+        self._empty = 0
+        self._mmap = None
+
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        # the file stays open for the lifetime of the list and is closed by close()
+        self._file = open(  # pylint: disable=consider-using-with
+            self.path, "r+b" if exists else "w+b")
+
+        if exists:
+            header = self._file.read(HEADER_SIZE)
+            magic, stored_typecode, length, head = struct.unpack_from(HEADER_FORMAT, header)
+            if magic != MAGIC:
+                self._file.close()
+                raise ValueError(f"{self.path} is not a {self.__class__.__name__} file")
+
+            stored_typecode = stored_typecode.decode()
+            if typecode is not None and typecode != stored_typecode:
+                self._file.close()
+                raise ValueError(
+                    f"{self.path} stores typecode '{stored_typecode}', not '{typecode}'")
+
+            self.typecode = stored_typecode
+            self.length = length
+            self.head = head
+            self._map()
+        else:
+            self.typecode = typecode or DEFAULT_TYPECODE
+            self._file.truncate(HEADER_SIZE + DEFAULT_CAPACITY * self._itemsize())
+            self.length = 0
+            self.head = 0
+            self._map()
+            struct.pack_into(HEADER_FORMAT, self._mmap, 0, MAGIC, self.typecode.encode(), 0, 0)
+
+        self._shrink_below = growth_policy.shrink_limit(self.capacity)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.path} ({self.length}/{self.capacity})"
+
+    def __enter__(self) -> "MappedArrayList":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _itemsize(self) -> int:
+        return array(self.typecode).itemsize
+
+    def _write_state(self) -> None:
+        # Publish the length and head with a single write, never one without the other
+        struct.pack_into(STATE_FORMAT, self._mmap, STATE_OFFSET, self.length, self.head)
+
+    def _clear(self, start: int, stop: int):
+        # The cleared slots are no longer covered by the published head and length
+        self._write_state()
+        super()._clear(start, stop)
+
+    def put(self, idx: int, item) -> None:
+        super().put(idx, item)
+        self._write_state()
+
+    def remove(self, idx: int):
+        item = super().remove(idx)
+        self._write_state()
+        return item
+
+    def insert_many(self, idx: int, items) -> None:
+        super().insert_many(idx, items)
+        self._write_state()
+
+    def remove_range(self, start: int, stop: int) -> ArrayList:
+        removed = super().remove_range(start, stop)
+        self._write_state()
+        return removed
+
+    def _map(self) -> None:
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._array = memoryview(self._mmap)[HEADER_SIZE:].cast(self.typecode)
+        self.capacity = len(self._array)
+
+    def _unmap(self) -> None:
+        self._array.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A view() still exports the mapping: keep it mapped and usable
+            self._array = memoryview(self._mmap)[HEADER_SIZE:].cast(self.typecode)
+            raise BufferError(
+                f"Cannot resize or close {self.path} while views of the list are alive"
+            ) from None
+        self._mmap = None
+
+    def _resize_file(self, capacity: int) -> None:
+        self._unmap()
+        self._file.truncate(HEADER_SIZE + capacity * self._itemsize())
+        self._map()
+
+    def _reallocate_array(self, capacity: int | None = None, center: bool = False):
+        if capacity is None:
+            capacity = self.growth_policy.grow(self.capacity, self.length + 1)
+
+        old_capacity = self.capacity
+        head = (capacity - self.length + 1) // 2 if center else 0
+
+        # The items are moved inside the mapping, after extending the file when growing
+        # and before truncating it when shrinking
+        if capacity >= self.capacity:
+            self._resize_file(capacity)
+            self._move_head(head)
+        else:
+            self._move_head(head)
+            try:
+                self._resize_file(capacity)
+            except BufferError:
+                # A live view only delays the shrink, the removal itself is already done
+                return
+
+        self._shrink_below = self.growth_policy.shrink_limit(self.capacity, self._reserved)
+        self._record_resize(
+            old_capacity, capacity, self.length, max(capacity - old_capacity, 0) * self._itemsize())
+
+    def _new_list(self, items: memoryview) -> ArrayList:
+        # Removed items are copied out of the file into an in-memory typed list
+        return ArrayList(array(self.typecode, items.tobytes()), growth_policy=self.growth_policy)
+
+    def flush(self) -> None:
+        """Flush the mapped header and records to disk"""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+
+        self.flush()
+        self._unmap()
+        self._file.close()
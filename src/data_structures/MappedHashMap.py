@@ -0,0 +1,379 @@
+import hashlib
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterator
+
+from .Hashing import rebuilt_capacity
+from .HashMap import _MISSING, KeyValuePair, _pop_removed
+from .Instrumentation import Instrumented
+
+DEFAULT_CAPACITY = 64
+DEFAULT_LOAD_FACTOR = 0.7
+DEFAULT_HEAP_SIZE = 4096
+HEAP_SUFFIX = ".heap"
+
+# magic, capacity, length, used slots
+INDEX_HEADER = struct.Struct("<4sQQQ")
+# magic, end of the last record
+HEAP_HEADER = struct.Struct("<4sQ")
+HEADER_SIZE = 64
+INDEX_MAGIC = b"MHM1"
+HEAP_MAGIC = b"MHH1"
+
+# hash, key offset, value offset
+SLOT = struct.Struct("<QQQ")
+# type tag, length
+RECORD = struct.Struct("<BI")
+
+# Key offsets of the free slots and of the slots whose key was removed (tombstones),
+# real records always start after the heap header
+_EMPTY = 0
+_DELETED = 1
+
+_BYTES = 0
+_STR = 1
+
+
+class MappedHashMap(Instrumented):
+    """
+    Persistent hash map of str or bytes keys and values stored in memory-mapped files
+
+    The table file (`path`) holds a small header followed by `capacity`
+    fixed-width slots of (hash, key offset, value offset), probed linearly
+    like OpenAddressingHashMap. The keys and values themselves are records
+    appended to a second file, the heap (`path + ".heap"`). Both files are
+    only mapped when opened, so opening a map of any size takes O(1) and
+    the operating system pages in the slots and records actually used.
+
+    The hash is a BLAKE2b digest of the key, since the built-in `hash()`
+    of str and bytes changes between processes. Updating a value appends a
+    new record, the heap is never compacted.
+
+    Any number of processes may open the same files with `readonly=True`
+    while one process writes. Readers see the slots and records written so
+    far, and the lengths and a resized table after calling `refresh()`.
+
+    The headers (length, used slots and end of the heap) are written into
+    the shared mappings by every insert and removal, after the slots and
+    records they describe, so a process that dies without `close()` leaves
+    files that reopen consistently. `flush()` only forces the mapped pages
+    to disk, to survive a crash of the machine itself.
+    """
+
+    path: str
+    readonly: bool
+    capacity: int
+    length: int
+    _used: int
+    _heap_end: int
+    _index_file: BinaryIO
+    _heap_file: BinaryIO
+    _index: mmap.mmap | None
+    _heap: mmap.mmap | None
+
+    def __init__(self, path: str | os.PathLike, readonly: bool = False) -> None:
+        self.path = os.fspath(path)
+        self.readonly = readonly
+        self._index = None
+        self._heap = None
+
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        if not exists:
+            if readonly:
+                raise FileNotFoundError(f"{self.path} does not exist")
+            self._create()
+
+        self._open()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.path} ({self.length}/{self.capacity})"
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(str(KeyValuePair(key, value)) for key, value in self.items()) + "}"
+
+    def __enter__(self) -> "MappedHashMap":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _create(self) -> None:
+        with open(self.path, "w+b") as index_file:
+            index_file.truncate(HEADER_SIZE + DEFAULT_CAPACITY * SLOT.size)
+            index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, DEFAULT_CAPACITY, 0, 0))
+
+        with open(self.path + HEAP_SUFFIX, "w+b") as heap_file:
+            heap_file.truncate(DEFAULT_HEAP_SIZE)
+            heap_file.write(HEAP_HEADER.pack(HEAP_MAGIC, HEADER_SIZE))
+
+    def _open(self) -> None:
+        # the files stay open for the lifetime of the map and are closed by close()
+        mode = "rb" if self.readonly else "r+b"
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._index_file = open(self.path, mode)  # pylint: disable=consider-using-with
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=access)
+        self._map_heap()
+
+        magic, self.capacity, self.length, self._used = INDEX_HEADER.unpack_from(self._index, 0)
+        heap_magic, self._heap_end = HEAP_HEADER.unpack_from(self._heap, 0)
+        if magic != INDEX_MAGIC or heap_magic != HEAP_MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a {self.__class__.__name__} file")
+
+    def _map_heap(self) -> None:
+        mode = "rb" if self.readonly else "r+b"
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._heap_file = open(  # pylint: disable=consider-using-with
+            self.path + HEAP_SUFFIX, mode)
+        self._heap = mmap.mmap(self._heap_file.fileno(), 0, access=access)
+
+    def _remap_heap(self) -> None:
+        # A reader whose mapping predates the growth of the heap by the writer
+        self._heap.close()
+        self._heap_file.close()
+        self._map_heap()
+
+    def _unmap(self) -> None:
+        self._index.close()
+        self._heap.close()
+        self._index_file.close()
+        self._heap_file.close()
+        self._index = None
+        self._heap = None
+
+    def refresh(self) -> None:
+        """Map the files again, to see the resizes and lengths written by the writer"""
+        self._unmap()
+        self._open()
+
+    def flush(self) -> None:
+        """Flush the mapped headers, slots and records to disk"""
+        self._check_writable()
+        self._index.flush()
+        self._heap.flush()
+
+    def close(self) -> None:
+        if self._index is None:
+            return
+
+        if not self.readonly:
+            self.flush()
+        self._unmap()
+
+    def _write_index_header(self) -> None:
+        INDEX_HEADER.pack_into(
+            self._index, 0, INDEX_MAGIC, self.capacity, self.length, self._used)
+
+    def _check_writable(self) -> None:
+        if self.readonly:
+            raise PermissionError(f"{self.path} is opened read-only")
+
+    @staticmethod
+    def _encode(item: str | bytes) -> tuple[int, bytes]:
+        if isinstance(item, bytes):
+            return _BYTES, item
+        if isinstance(item, str):
+            return _STR, item.encode()
+        raise TypeError(f"Keys and values must be str or bytes, not {type(item)}")
+
+    @staticmethod
+    def _hash(tag: int, data: bytes) -> int:
+        digest = hashlib.blake2b(data, digest_size=8, salt=bytes([tag]) * 16).digest()
+        return int.from_bytes(digest, "little")
+
+    def _read_record(self, offset: int) -> str | bytes:
+        tag, size = self._record_header(offset)
+        start = offset + RECORD.size
+        data = self._heap[start: start + size]
+        return data.decode() if tag == _STR else data
+
+    def _record_equals(self, offset: int, tag: int, data: bytes) -> bool:
+        record_tag, size = self._record_header(offset)
+        start = offset + RECORD.size
+        return record_tag == tag and size == len(data) and self._heap[start: start + size] == data
+
+    def _record_header(self, offset: int) -> tuple[int, int]:
+        if offset + RECORD.size > len(self._heap):
+            self._remap_heap()
+
+        tag, size = RECORD.unpack_from(self._heap, offset)
+        if offset + RECORD.size + size > len(self._heap):
+            self._remap_heap()
+        return tag, size
+
+    def _append_record(self, tag: int, data: bytes) -> int:
+        offset = self._heap_end
+        end = offset + RECORD.size + len(data)
+        if end > len(self._heap):
+            # grow the heap file geometrically
+            self._heap.flush()
+            self._heap.resize(max(2 * len(self._heap), end))
+
+        RECORD.pack_into(self._heap, offset, tag, len(data))
+        self._heap[offset + RECORD.size: end] = data
+        self._heap_end = end
+        HEAP_HEADER.pack_into(self._heap, 0, HEAP_MAGIC, end)
+        return offset
+
+    def _find_slot(self, tag: int, data: bytes, key_hash: int) -> int:
+        # Return the slot holding the key, or ~slot of the slot where it should be inserted
+        # (the first tombstone on the probe sequence, or else the empty slot that ended it)
+        index = self._index
+        mask = self.capacity - 1
+        slot = key_hash & mask
+        tombstone = -1
+
+        while True:
+            slot_hash, key_offset, _ = SLOT.unpack_from(index, HEADER_SIZE + slot * SLOT.size)
+            if key_offset == _EMPTY:
+                return ~(slot if tombstone < 0 else tombstone)
+            if key_offset == _DELETED:
+                if tombstone < 0:
+                    tombstone = slot
+            elif slot_hash == key_hash and self._record_equals(key_offset, tag, data):
+                return slot
+            slot = (slot + 1) & mask
+
+    def _lookup(self, key: str | bytes) -> tuple[int, tuple[int, bytes, int]]:
+        # Return the result of _find_slot and the encoded key with its hash
+        tag, data = self._encode(key)
+        key_hash = self._hash(tag, data)
+        return self._find_slot(tag, data, key_hash), (tag, data, key_hash)
+
+    def _slot_value(self, slot: int) -> str | bytes:
+        _, _, value_offset = SLOT.unpack_from(self._index, HEADER_SIZE + slot * SLOT.size)
+        return self._read_record(value_offset)
+
+    def _set_slot_value(self, slot: int, value: str | bytes) -> None:
+        self._check_writable()
+        value_offset = self._append_record(*self._encode(value))
+        struct.pack_into("<Q", self._index, HEADER_SIZE + slot * SLOT.size + 16, value_offset)
+
+    def _insert(self, slot: int, encoded_key: tuple[int, bytes, int], value: str | bytes) -> None:
+        self._check_writable()
+        tag, data, key_hash = encoded_key
+        reuses_tombstone = SLOT.unpack_from(self._index, HEADER_SIZE + slot * SLOT.size)[1] != 0
+
+        # the records are written before the slot points to them
+        key_offset = self._append_record(tag, data)
+        value_offset = self._append_record(*self._encode(value))
+        SLOT.pack_into(
+            self._index, HEADER_SIZE + slot * SLOT.size, key_hash, key_offset, value_offset)
+        self.length += 1
+        if not reuses_tombstone:
+            self._used += 1
+        self._write_index_header()
+
+        if self._used / self.capacity > DEFAULT_LOAD_FACTOR:
+            self._reallocate_container()
+
+    def __getitem__(self, key: str | bytes):
+        slot = self._lookup(key)[0]
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        return self._slot_value(slot)
+
+    def __setitem__(self, key: str | bytes, value: str | bytes):
+        slot, encoded_key = self._lookup(key)
+        if slot >= 0:
+            self._set_slot_value(slot, value)
+        else:
+            self._insert(~slot, encoded_key, value)
+
+    def __contains__(self, key: str | bytes) -> bool:
+        return self._lookup(key)[0] >= 0
+
+    def __iter__(self) -> Iterator[str | bytes]:
+        return self.keys()
+
+    def keys(self) -> Iterator[str | bytes]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[str | bytes]:
+        return (value for _, value in self.items())
+
+    def items(self) -> Iterator[tuple[str | bytes, str | bytes]]:
+        length = self.length
+        capacity = self.capacity
+        for slot in range(capacity):
+            _, key_offset, value_offset = SLOT.unpack_from(
+                self._index, HEADER_SIZE + slot * SLOT.size)
+            if key_offset > _DELETED:
+                yield self._read_record(key_offset), self._read_record(value_offset)
+                if self.length != length or self.capacity != capacity:
+                    raise RuntimeError(f"{self.__class__.__name__} changed size during iteration")
+
+    def put(self, key: str | bytes, value: str | bytes) -> None:
+        slot, encoded_key = self._lookup(key)
+        if slot >= 0:
+            raise KeyError(f"Key: {key} already exists!")
+
+        self._insert(~slot, encoded_key, value)
+
+    def update(self, key: str | bytes, value: str | bytes):
+        slot = self._lookup(key)[0]
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        self._set_slot_value(slot, value)
+
+    def get(self, key: str | bytes):
+        slot = self._lookup(key)[0]
+        if slot < 0:
+            return None
+
+        return self._slot_value(slot)
+
+    def remove(self, key: str | bytes):
+        slot = self._lookup(key)[0]
+        if slot < 0:
+            return None
+
+        self._check_writable()
+        kv_pair = KeyValuePair(key, self._slot_value(slot))
+        struct.pack_into("<Q", self._index, HEADER_SIZE + slot * SLOT.size + 8, _DELETED)
+        self.length -= 1
+        self._write_index_header()
+        return kv_pair
+
+    def pop(self, key: str | bytes, default=_MISSING):
+        """Remove key and return its value, or default if given and the key is missing"""
+        return _pop_removed(self.remove(key), key, default)
+
+    def _reallocate_container(self):
+        old_capacity = self.capacity
+
+        capacity = rebuilt_capacity(self.length, self.capacity, DEFAULT_LOAD_FACTOR)
+
+        # Build the new table next to the old one from the cached hashes, without
+        # reading the heap, then swap the files so that readers never see a partial table
+        resized_path = self.path + ".resize"
+        with open(resized_path, "w+b") as resized_file:
+            resized_file.truncate(HEADER_SIZE + capacity * SLOT.size)
+            with mmap.mmap(resized_file.fileno(), 0) as resized:
+                mask = capacity - 1
+                for old_slot in range(self.capacity):
+                    entry = SLOT.unpack_from(self._index, HEADER_SIZE + old_slot * SLOT.size)
+                    if entry[1] <= _DELETED:
+                        continue
+
+                    slot = entry[0] & mask
+                    while SLOT.unpack_from(resized, HEADER_SIZE + slot * SLOT.size)[1] != _EMPTY:
+                        slot = (slot + 1) & mask
+                    SLOT.pack_into(resized, HEADER_SIZE + slot * SLOT.size, *entry)
+
+                INDEX_HEADER.pack_into(resized, 0, INDEX_MAGIC, capacity, self.length, self.length)
+                resized.flush()
+
+        self._heap.flush()
+        self._unmap()
+        os.replace(resized_path, self.path)
+        self._open()
+
+        self._record_resize(
+            old_capacity, self.capacity, self.length, HEADER_SIZE + self.capacity * SLOT.size)
@@ -0,0 +1,123 @@
+from typing import Callable
+
+import numpy as np
+
+from .ArrayList import ArrayList
+from .GrowthPolicy import DEFAULT_GROWTH_POLICY, GrowthPolicy
+
+DEFAULT_DTYPE = "float64"
+
+
+class NumpyArrayList(ArrayList):
+    """
+    ArrayList whose storage is a NumPy array
+
+    Growth, the head gap and all the positional operations are inherited
+    from ArrayList, only the storage is a NumPy array of `dtype`. On top of
+    the ArrayList API, bulk operations (`map`, `filter`, `sum`, `argmax`,
+    `searchsorted` and elementwise arithmetic) run as vectorized NumPy
+    kernels over `values()`, a zero-copy view of the live items.
+    """
+
+    dtype: np.dtype
+    _array: np.ndarray
+
+    _sequence_types = (list, tuple, np.ndarray)
+
+    def __init__(
+        self,
+        item: list | tuple | np.ndarray | int | float = None,
+        dtype: np.dtype | str | None = None,
+        growth_policy: GrowthPolicy = DEFAULT_GROWTH_POLICY,
+    ) -> None:
+        if dtype is None:
+            dtype = item.dtype if isinstance(item, np.ndarray) else DEFAULT_DTYPE
+        self.dtype = np.dtype(dtype)
+
+        super().__init__(item, growth_policy=growth_policy)
+        self._empty = 0
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        return np.zeros(capacity, dtype=self.dtype)
+
+    def _to_storage(self, items: list | tuple | np.ndarray) -> np.ndarray:
+        # Unlike plain lists, NumPy arrays are never aliased since they may be views
+        return np.array(items, dtype=self.dtype)
+
+    def _new_list(self, items: np.ndarray) -> "NumpyArrayList":
+        return NumpyArrayList(items, dtype=items.dtype, growth_policy=self.growth_policy)
+
+    def _clear(self, start: int, stop: int):
+        self._array[start: stop] = 0
+
+    def _get_array(self) -> list:
+        return self.values().tolist()
+
+    def values(self) -> np.ndarray:
+        """Return a zero-copy NumPy view of the live items"""
+        return self._array[self.head: self.head + self.length]
+
+    def map(self, func: Callable[[np.ndarray], np.ndarray]) -> "NumpyArrayList":
+        """
+        Apply a vectorized function (e.g. a ufunc) to all the items at once
+        Runtime: O(n) in a single kernel call
+        """
+        return self._new_list(np.asarray(func(self.values())))
+
+    def filter(self, predicate: Callable[[np.ndarray], np.ndarray]) -> "NumpyArrayList":
+        """
+        Keep the items for which a vectorized predicate returns True
+        Runtime: O(n) in a single kernel call
+        """
+        values = self.values()
+        return self._new_list(values[np.asarray(predicate(values), dtype=bool)])
+
+    def sum(self):
+        return self.values().sum()
+
+    def argmax(self) -> int:
+        if self.length == 0:
+            raise ValueError("Cannot find the maximum of an empty list")
+
+        return int(self.values().argmax())
+
+    def searchsorted(self, value, side: str = "left"):
+        """
+        Return the index where value would be inserted to keep a sorted list sorted
+        Runtime: O(log n)
+        """
+        return self.values().searchsorted(value, side=side)
+
+    def _elementwise(self, other, op: Callable) -> "NumpyArrayList":
+        if isinstance(other, NumpyArrayList):
+            if other.length != self.length:
+                raise ValueError(
+                    f"Cannot combine lists of length {self.length} and {other.length}")
+            other = other.values()
+
+        return self._new_list(op(self.values(), other))
+
+    def __add__(self, other) -> "NumpyArrayList":
+        return self._elementwise(other, np.add)
+
+    def __radd__(self, other) -> "NumpyArrayList":
+        return self._elementwise(other, np.add)
+
+    def __sub__(self, other) -> "NumpyArrayList":
+        return self._elementwise(other, np.subtract)
+
+    def __rsub__(self, other) -> "NumpyArrayList":
+        return self._elementwise(other, lambda values, other: np.subtract(other, values))
+
+    def __mul__(self, other) -> "NumpyArrayList":
+        return self._elementwise(other, np.multiply)
+
+    def __rmul__(self, other) -> "NumpyArrayList":
+        return self._elementwise(other, np.multiply)
+
+    def __truediv__(self, other) -> "NumpyArrayList":
+        return self._elementwise(other, np.true_divide)
+
+    def __neg__(self) -> "NumpyArrayList":
+        return self._new_list(-self.values())
+
@@ -0,0 +1,192 @@
+import sys
+from typing import Generic, TypeVar
+
+from .Hashing import fibonacci_slot, rebuilt_capacity
+from .HashMap import KeyValuePair
+from .Instrumentation import Instrumented
+
+K = TypeVar("K")
+V = TypeVar("V")
+DEFAULT_CAPACITY = 16
+DEFAULT_LOAD_FACTOR = 0.7
+
+# Markers for slots that never held a key and for slots whose key was removed (tombstones)
+_EMPTY = object()
+_DELETED = object()
+
+
+class OpenAddressingHashMap(Instrumented, Generic[K, V]):
+    """
+    Hash map using open addressing with linear probing
+
+    Hashes, keys and values are stored in three flat parallel arrays of
+    `capacity` slots (a power of two), so a lookup walks consecutive slots
+    starting at the Fibonacci hash slot of `hash(key)` and compares the
+    cached hash before the key, without any per-entry object. The home slot
+    comes from the high bits of the mixed hash, so keys whose hashes share
+    their low bits (aligned integers) do not pile up in one probe chain.
+    Removed keys leave a tombstone that keeps probe sequences intact until
+    the next resize.
+
+    Same API as HashMap: `put`, `get`, `update`, `remove`, `[]`.
+    """
+
+    capacity: int
+    length: int
+    _used: int
+    _bits: int
+    _hashes: list[int]
+    _keys: list[K]
+    _values: list[V]
+
+    def __init__(self) -> None:
+        self.capacity = DEFAULT_CAPACITY
+        self.length = 0
+        self._used = 0
+        self._bits = self.capacity.bit_length() - 1
+        self._hashes = [0] * self.capacity
+        self._keys = [_EMPTY] * self.capacity
+        self._values = [None] * self.capacity
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        pairs = (
+            str(KeyValuePair(key, value, key_hash))
+            for key_hash, key, value in zip(self._hashes, self._keys, self._values)
+            if key is not _EMPTY and key is not _DELETED
+        )
+        return "{" + ", ".join(pairs) + "}"
+
+    def __repr__(self) -> str:
+        output = ""
+        for i in range(self.capacity):
+            key = self._keys[i]
+            if key is _EMPTY:
+                slot = ""
+            elif key is _DELETED:
+                slot = "<deleted>"
+            else:
+                slot = str(KeyValuePair(key, self._values[i], self._hashes[i]))
+            output += f"{str(i).zfill(3)} -> {slot}\n"
+        return output
+
+    def __getitem__(self, key: K):
+        slot = self._find_slot(key, hash(key))
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        return self._values[slot]
+
+    def __setitem__(self, key: K, value: V):
+        key_hash = hash(key)
+        slot = self._find_slot(key, key_hash)
+        if slot >= 0:
+            self._values[slot] = value
+        else:
+            self._insert(~slot, key, key_hash, value)
+
+    def __contains__(self, key: K) -> bool:
+        return self._find_slot(key, hash(key)) >= 0
+
+    def _find_slot(self, key: K, key_hash: int) -> int:
+        # Return the slot holding key, or ~slot of the slot where key should be inserted
+        # (the first tombstone on the probe sequence, or else the empty slot that ended it)
+        keys = self._keys
+        hashes = self._hashes
+        mask = self.capacity - 1
+        idx = fibonacci_slot(key_hash, self._bits)
+        tombstone = -1
+
+        while True:
+            slot_key = keys[idx]
+            if slot_key is _EMPTY:
+                return ~(idx if tombstone < 0 else tombstone)
+            if slot_key is _DELETED:
+                if tombstone < 0:
+                    tombstone = idx
+            elif hashes[idx] == key_hash and (slot_key is key or slot_key == key):
+                return idx
+            idx = (idx + 1) & mask
+
+    def _insert(self, slot: int, key: K, key_hash: int, value: V) -> None:
+        reuses_tombstone = self._keys[slot] is _DELETED
+        self._hashes[slot] = key_hash
+        self._keys[slot] = key
+        self._values[slot] = value
+        self.length += 1
+
+        if not reuses_tombstone:
+            self._used += 1
+            # Keep enough empty slots so that every probe sequence terminates quickly
+            if self._used / self.capacity > DEFAULT_LOAD_FACTOR:
+                self._reallocate_container()
+
+    def put(self, key: K, value: V) -> None:
+        key_hash = hash(key)
+        slot = self._find_slot(key, key_hash)
+        if slot >= 0:
+            raise KeyError(f"Key: {key} already exists!")
+
+        self._insert(~slot, key, key_hash, value)
+
+    def update(self, key: K, value: V):
+        slot = self._find_slot(key, hash(key))
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        self._values[slot] = value
+
+    def get(self, key: K):
+        slot = self._find_slot(key, hash(key))
+        if slot < 0:
+            return None
+
+        return self._values[slot]
+
+    def remove(self, key: K):
+        slot = self._find_slot(key, hash(key))
+        if slot < 0:
+            return None
+
+        kv_pair = KeyValuePair(self._keys[slot], self._values[slot], self._hashes[slot])
+        self._keys[slot] = _DELETED
+        self._values[slot] = None
+        self.length -= 1
+        return kv_pair
+
+    def _reallocate_container(self):
+        old_capacity = self.capacity
+
+        self.capacity = rebuilt_capacity(self.length, self.capacity, DEFAULT_LOAD_FACTOR)
+        self._bits = bits = self.capacity.bit_length() - 1
+
+        old_hashes = self._hashes
+        old_keys = self._keys
+        old_values = self._values
+        self._hashes = hashes = [0] * self.capacity
+        self._keys = keys = [_EMPTY] * self.capacity
+        self._values = values = [None] * self.capacity
+        mask = self.capacity - 1
+
+        # Reinsert the live entries using their cached hashes, the new table has no tombstones
+        for key_hash, key, value in zip(old_hashes, old_keys, old_values):
+            if key is _EMPTY or key is _DELETED:
+                continue
+
+            idx = fibonacci_slot(key_hash, bits)
+            while keys[idx] is not _EMPTY:
+                idx = (idx + 1) & mask
+
+            hashes[idx] = key_hash
+            keys[idx] = key
+            values[idx] = value
+
+        self._used = self.length
+        self._record_resize(
+            old_capacity,
+            self.capacity,
+            self.length,
+            sys.getsizeof(hashes) + sys.getsizeof(keys) + sys.getsizeof(values),
+        )
@@ -1,17 +1,31 @@
+import sys
 from typing import Generic, TypeVar
 
+from .GrowthPolicy import DEFAULT_GROWTH_POLICY, GrowthPolicy
+from .Instrumentation import Instrumented
+
 T = TypeVar("T")
 DEFAULT_CAPACITY = 4
 
 
-class RingBuffer(Generic[T]):
+class RingBuffer(Instrumented, Generic[T]):
     length: int
     capacity: int
     _array: list[T]
     head: int = 0
     tail: int
+    growth_policy: GrowthPolicy
+    _shrink_below: int
+    # capacity requested by reserve(), which removals never shrink below
+    _reserved: int = 0
+
+    def __init__(
+        self,
+        item: list[T] | tuple[T] | T = None,
+        growth_policy: GrowthPolicy = DEFAULT_GROWTH_POLICY,
+    ) -> None:
+        self.growth_policy = growth_policy
 
-    def __init__(self, item: list[T] | tuple[T] | T = None) -> None:
         if item is None:
             self.capacity = DEFAULT_CAPACITY
             self.length = 0
@@ -33,6 +47,8 @@ class RingBuffer(Generic[T]):
             self._array = [item] + [None for _ in range(self.capacity - 1)]
             self.tail = 0
 
+        self._shrink_below = growth_policy.shrink_limit(self.capacity)
+
     def __len__(self) -> int:
         return self.length
 
@@ -55,17 +71,25 @@ class RingBuffer(Generic[T]):
     def __str__(self) -> str:
         return str(self.get_array())
 
-    def _reallocate_array(self):
-        self.capacity = self.capacity * 2
-        print(f"Reallocating array with new capacity = {self.capacity}")
+    def _reallocate_array(self, capacity: int | None = None):
+        if capacity is None:
+            capacity = self.growth_policy.grow(self.capacity, self.length + 1)
+
+        # Read the items before the capacity changes, since unwrapping them depends on it
+        items = self.get_array()
+
+        old_capacity = self.capacity
+        self.capacity = capacity
+        self._shrink_below = self.growth_policy.shrink_limit(capacity, self._reserved)
 
         # Create new array and copy the previous values into it
         new_array = [None] * self.capacity
-        new_array[0 : self.length] = self.get_array()
+        new_array[0 : self.length] = items
 
         self._array = new_array
         self.head = 0
         self.tail = self.length - 1
+        self._record_resize(old_capacity, capacity, self.length, sys.getsizeof(new_array))
 
     def get_array(self):
         if self.length != 0:
@@ -99,6 +123,8 @@ class RingBuffer(Generic[T]):
         self._array[self.tail] = None
         self.tail = (self.tail - 1) % self.capacity
         self.length -= 1
+        if self.length < self._shrink_below:
+            self._reallocate_array(self.growth_policy.shrink(self.length, self._reserved))
 
         return item
 
@@ -119,5 +145,26 @@ class RingBuffer(Generic[T]):
         self._array[self.head] = None
         self.head = (self.head + 1) % self.capacity
         self.length -= 1
+        if self.length < self._shrink_below:
+            self._reallocate_array(self.growth_policy.shrink(self.length, self._reserved))
 
         return item
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Make room for at least `capacity` items without further reallocations,
+        removals no longer shrink the capacity below it until shrink_to_fit()
+        """
+        self._reserved = max(self._reserved, capacity)
+        if capacity > self.capacity:
+            self._reallocate_array(capacity)
+        else:
+            self._shrink_below = self.growth_policy.shrink_limit(self.capacity, self._reserved)
+
+    def shrink_to_fit(self) -> None:
+        """Release all the unused slots so that the capacity equals the length"""
+        self._reserved = 0
+        if self.capacity != self.length:
+            self._reallocate_array(self.length)
+        else:
+            self._shrink_below = self.growth_policy.shrink_limit(self.capacity)
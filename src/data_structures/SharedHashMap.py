@@ -0,0 +1,387 @@
+import hashlib
+import struct
+import sys
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator
+
+from .Hashing import fibonacci_slot, rebuilt_capacity
+from .HashMap import _MISSING, KeyValuePair, _pop_removed
+from .Instrumentation import Instrumented
+
+DEFAULT_CAPACITY = 16
+DEFAULT_LOAD_FACTOR = 0.5
+DEFAULT_KEY_SIZE = 8
+DEFAULT_VALUE_SIZE = 8
+
+# magic, capacity, length, used slots, key size, value size
+HEADER = struct.Struct("<4sQQQII")
+HEADER_SIZE = 64
+MAGIC = b"SHM1"
+
+# hash, key tag, key length, followed by the key bytes
+SLOT_KEY = struct.Struct("<QBH")
+# value tag, value length, followed by the value bytes
+SLOT_VALUE = struct.Struct("<BH")
+
+# Key tags, the first two mark the free slots and the slots whose key was removed
+_EMPTY = 0
+_DELETED = 1
+_INT = 2
+_BYTES = 3
+
+
+class SharedHashMap(Instrumented):
+    """
+    Hash map of int or bytes keys and values laid out in a shared memory block
+
+    The block holds a small header followed by `capacity` fixed-width
+    slots of (hash, key, value), probed linearly like
+    OpenAddressingHashMap. Ints are stored as 8-byte signed integers and
+    bytes up to `key_size` or `value_size` bytes, so every slot takes
+    SLOT_KEY.size + key_size + SLOT_VALUE.size + value_size bytes.
+
+    One process builds the map, then other processes attach to the block
+    by name with `SharedHashMap.attach(name)` and read the slots in place,
+    without copying the entries. Pickling a SharedHashMap, as
+    ProcessPoolExecutor does with the arguments of a task, only sends the
+    name, and the worker attaches read-only.
+
+    The hash of bytes is a BLAKE2b digest, since the built-in `hash()`
+    changes between processes. A resize moves the map to a new block
+    with a new `name`, so workers should attach once the map is built;
+    readers already attached keep seeing the old block. Writes are not
+    locked: the map is meant to be written by its owner only.
+    """
+
+    name: str
+    owner: bool
+    readonly: bool
+    capacity: int
+    key_size: int
+    value_size: int
+    slot_size: int
+    _used: int
+    _bits: int
+    _block: shared_memory.SharedMemory
+
+    def __init__(
+        self,
+        expected_size: int = 0,
+        key_size: int = DEFAULT_KEY_SIZE,
+        value_size: int = DEFAULT_VALUE_SIZE,
+    ) -> None:
+        if expected_size < 0:
+            raise ValueError("Expected size must be non-negative")
+        if key_size < 8 or value_size < 8:
+            raise ValueError("Key and value sizes must be at least 8 bytes")
+
+        self.owner = True
+        self.readonly = False
+        self._set_sizes(key_size, value_size)
+
+        capacity = DEFAULT_CAPACITY
+        while capacity * DEFAULT_LOAD_FACTOR < expected_size:
+            capacity *= 2
+        self._create(capacity)
+
+    @classmethod
+    def attach(cls, name: str, readonly: bool = True) -> "SharedHashMap":
+        """
+        Attach to the block of a map built by another process, without copying it
+        Runtime: O(1)
+        """
+        hash_map = cls.__new__(cls)
+        hash_map.owner = False
+        hash_map.readonly = readonly
+        if sys.version_info >= (3, 13):
+            # the block belongs to its owner, which unlinks it
+            hash_map._block = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            hash_map._block = shared_memory.SharedMemory(name=name)
+        hash_map.name = name
+
+        magic, hash_map.capacity, _, hash_map._used, key_size, value_size = HEADER.unpack_from(
+            hash_map._block.buf, 0)
+        if magic != MAGIC:
+            hash_map.close()
+            raise ValueError(f"{name} is not a {cls.__name__} block")
+
+        hash_map._set_sizes(key_size, value_size)
+        hash_map._bits = hash_map.capacity.bit_length() - 1
+        return hash_map
+
+    @classmethod
+    def from_pairs(
+        cls,
+        pairs: Iterable[tuple[int | bytes, int | bytes]],
+        key_size: int = DEFAULT_KEY_SIZE,
+        value_size: int = DEFAULT_VALUE_SIZE,
+    ) -> "SharedHashMap":
+        """
+        Build a map from (key, value) pairs, the last value wins for repeated keys
+        Runtime: O(n), sized once for the number of pairs
+        """
+        pairs = list(pairs)
+        hash_map = cls(len(pairs), key_size, value_size)
+        for key, value in pairs:
+            hash_map[key] = value
+        return hash_map
+
+    def __reduce__(self):
+        return self.__class__.attach, (self.name,)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.name} ({self.length}/{self.capacity})"
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(str(KeyValuePair(key, value)) for key, value in self.items()) + "}"
+
+    def __enter__(self) -> "SharedHashMap":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def length(self) -> int:
+        # read from the header so that attached processes see the owner's inserts
+        return HEADER.unpack_from(self._block.buf, 0)[2]
+
+    def _set_sizes(self, key_size: int, value_size: int) -> None:
+        self.key_size = key_size
+        self.value_size = value_size
+        self.slot_size = SLOT_KEY.size + key_size + SLOT_VALUE.size + value_size
+
+    def _create(self, capacity: int) -> None:
+        # new blocks are zero-filled, so every slot starts _EMPTY
+        self._block = shared_memory.SharedMemory(
+            create=True, size=HEADER_SIZE + capacity * self.slot_size)
+        self.name = self._block.name
+        self.capacity = capacity
+        self._bits = capacity.bit_length() - 1
+        self._used = 0
+        self._write_header(0)
+
+    def _write_header(self, length: int) -> None:
+        HEADER.pack_into(
+            self._block.buf, 0, MAGIC, self.capacity, length, self._used,
+            self.key_size, self.value_size)
+
+    def close(self) -> None:
+        """Detach from the block, the other processes keep their own mapping"""
+        self._block.close()
+
+    def unlink(self) -> None:
+        """Free the block once every process has closed it, only the owner may do this"""
+        if not self.owner:
+            raise PermissionError(f"{self.name} is owned by another process")
+
+        self._block.unlink()
+
+    def _check_writable(self) -> None:
+        if self.readonly:
+            raise PermissionError(f"{self.name} is attached read-only")
+
+    @staticmethod
+    def _encode(item: int | bytes, size: int) -> tuple[int, bytes]:
+        if isinstance(item, bytes):
+            if len(item) > size:
+                raise ValueError(f"{item!r} is longer than {size} bytes")
+            return _BYTES, item
+        if isinstance(item, int):
+            return _INT, item.to_bytes(8, "little", signed=True)
+        raise TypeError(f"Keys and values must be int or bytes, not {type(item)}")
+
+    @staticmethod
+    def _decode(tag: int, data: bytes) -> int | bytes:
+        return int.from_bytes(data, "little", signed=True) if tag == _INT else data
+
+    @staticmethod
+    def _hash(tag: int, data: bytes) -> int:
+        if tag == _INT:
+            return int.from_bytes(data, "little")
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    def _slot_of(self, key_hash: int) -> int:
+        return fibonacci_slot(key_hash, self._bits)
+
+    def _find_slot(self, tag: int, data: bytes, key_hash: int) -> int:
+        # Return the slot holding the key, or ~slot of the slot where it should be inserted
+        # (the first tombstone on the probe sequence, or else the empty slot that ended it)
+        buf = self._block.buf
+        slot_size = self.slot_size
+        mask = self.capacity - 1
+        slot = self._slot_of(key_hash)
+        tombstone = -1
+
+        while True:
+            offset = HEADER_SIZE + slot * slot_size
+            slot_hash, slot_tag, size = SLOT_KEY.unpack_from(buf, offset)
+            if slot_tag == _EMPTY:
+                return ~(slot if tombstone < 0 else tombstone)
+            if slot_tag == _DELETED:
+                if tombstone < 0:
+                    tombstone = slot
+            elif slot_hash == key_hash and slot_tag == tag and size == len(data):
+                start = offset + SLOT_KEY.size
+                if buf[start: start + size] == data:
+                    return slot
+            slot = (slot + 1) & mask
+
+    def _lookup(self, key: int | bytes) -> tuple[int, tuple[int, bytes, int]]:
+        # Return the result of _find_slot and the encoded key with its hash
+        tag, data = self._encode(key, self.key_size)
+        key_hash = self._hash(tag, data)
+        return self._find_slot(tag, data, key_hash), (tag, data, key_hash)
+
+    def _slot_value(self, slot: int) -> int | bytes:
+        offset = HEADER_SIZE + slot * self.slot_size + SLOT_KEY.size + self.key_size
+        tag, size = SLOT_VALUE.unpack_from(self._block.buf, offset)
+        start = offset + SLOT_VALUE.size
+        return self._decode(tag, bytes(self._block.buf[start: start + size]))
+
+    def _slot_key(self, slot: int) -> int | bytes:
+        offset = HEADER_SIZE + slot * self.slot_size
+        _, tag, size = SLOT_KEY.unpack_from(self._block.buf, offset)
+        start = offset + SLOT_KEY.size
+        return self._decode(tag, bytes(self._block.buf[start: start + size]))
+
+    def _set_slot_value(self, slot: int, value: int | bytes) -> None:
+        self._check_writable()
+        tag, data = self._encode(value, self.value_size)
+        offset = HEADER_SIZE + slot * self.slot_size + SLOT_KEY.size + self.key_size
+        SLOT_VALUE.pack_into(self._block.buf, offset, tag, len(data))
+        start = offset + SLOT_VALUE.size
+        self._block.buf[start: start + len(data)] = data
+
+    def _insert(self, slot: int, encoded_key: tuple[int, bytes, int], value: int | bytes) -> None:
+        self._check_writable()
+        tag, data, key_hash = encoded_key
+        offset = HEADER_SIZE + slot * self.slot_size
+        reuses_tombstone = SLOT_KEY.unpack_from(self._block.buf, offset)[1] == _DELETED
+
+        # the value and the key bytes are written before the tag marks the slot as used
+        self._set_slot_value(slot, value)
+        start = offset + SLOT_KEY.size
+        self._block.buf[start: start + len(data)] = data
+        SLOT_KEY.pack_into(self._block.buf, offset, key_hash, tag, len(data))
+
+        if not reuses_tombstone:
+            self._used += 1
+        self._write_header(self.length + 1)
+
+        if self._used / self.capacity > DEFAULT_LOAD_FACTOR:
+            self._reallocate_container()
+
+    def __getitem__(self, key: int | bytes):
+        slot = self._lookup(key)[0]
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        return self._slot_value(slot)
+
+    def __setitem__(self, key: int | bytes, value: int | bytes):
+        slot, encoded_key = self._lookup(key)
+        if slot >= 0:
+            self._set_slot_value(slot, value)
+        else:
+            self._insert(~slot, encoded_key, value)
+
+    def __contains__(self, key: int | bytes) -> bool:
+        return self._lookup(key)[0] >= 0
+
+    def __iter__(self) -> Iterator[int | bytes]:
+        return self.keys()
+
+    def keys(self) -> Iterator[int | bytes]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[int | bytes]:
+        return (value for _, value in self.items())
+
+    def items(self) -> Iterator[tuple[int | bytes, int | bytes]]:
+        length = self.length
+        block = self._block
+        for slot in range(self.capacity):
+            tag = block.buf[HEADER_SIZE + slot * self.slot_size + 8]
+            if tag > _DELETED:
+                yield self._slot_key(slot), self._slot_value(slot)
+                if self.length != length or self._block is not block:
+                    raise RuntimeError(f"{self.__class__.__name__} changed size during iteration")
+
+    def put(self, key: int | bytes, value: int | bytes) -> None:
+        slot, encoded_key = self._lookup(key)
+        if slot >= 0:
+            raise KeyError(f"Key: {key} already exists!")
+
+        self._insert(~slot, encoded_key, value)
+
+    def update(self, key: int | bytes, value: int | bytes):
+        slot = self._lookup(key)[0]
+        if slot < 0:
+            raise KeyError(f"Key: {key} does not exist!")
+
+        self._set_slot_value(slot, value)
+
+    def get(self, key: int | bytes):
+        slot = self._lookup(key)[0]
+        if slot < 0:
+            return None
+
+        return self._slot_value(slot)
+
+    def remove(self, key: int | bytes):
+        slot = self._lookup(key)[0]
+        if slot < 0:
+            return None
+
+        self._check_writable()
+        kv_pair = KeyValuePair(key, self._slot_value(slot))
+        # the tag byte follows the 8-byte hash
+        self._block.buf[HEADER_SIZE + slot * self.slot_size + 8] = _DELETED
+        self._write_header(self.length - 1)
+        return kv_pair
+
+    def pop(self, key: int | bytes, default=_MISSING):
+        """Remove key and return its value, or default if given and the key is missing"""
+        return _pop_removed(self.remove(key), key, default)
+
+    def _reallocate_container(self):
+        old_capacity = self.capacity
+        old_block = self._block
+        length = self.length
+
+        capacity = rebuilt_capacity(length, self.capacity, DEFAULT_LOAD_FACTOR)
+
+        # Copy the slots as they are into a new block, probing with the stored hashes
+        self._create(capacity)
+        old_buf = old_block.buf
+        new_buf = self._block.buf
+        slot_size = self.slot_size
+        mask = capacity - 1
+        for old_slot in range(old_capacity):
+            old_offset = HEADER_SIZE + old_slot * slot_size
+            key_hash, tag, _ = SLOT_KEY.unpack_from(old_buf, old_offset)
+            if tag <= _DELETED:
+                continue
+
+            slot = self._slot_of(key_hash)
+            while new_buf[HEADER_SIZE + slot * slot_size + 8] != _EMPTY:
+                slot = (slot + 1) & mask
+            offset = HEADER_SIZE + slot * slot_size
+            new_buf[offset: offset + slot_size] = old_buf[old_offset: old_offset + slot_size]
+
+        self._used = length
+        self._write_header(length)
+
+        # processes attached to the old block keep their mapping until they close it
+        old_block.close()
+        old_block.unlink()
+
+        self._record_resize(old_capacity, self.capacity, length, self._block.size)
@@ -0,0 +1,135 @@
+from bisect import bisect_left, bisect_right
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from .ArrayList import ArrayList
+
+T = TypeVar("T")
+
+
+class SortedArrayList(Generic[T]):
+    """
+    Sequence that keeps its items in ascending order
+
+    SortedArrayList is implemented using an ArrayList. Lookups are binary
+    searches over the contiguous live region of the ArrayList storage, and
+    inserts and removals shift the shorter side of the list with a single
+    slice move.
+    """
+
+    _data: ArrayList[T]
+
+    def __init__(self, items: Iterable[T] | None = None, typecode: str | None = None) -> None:
+        self._data = ArrayList(sorted(items) if items is not None else None, typecode=typecode)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int) -> T:
+        return self._data[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._data.view())
+
+    def __contains__(self, item: T) -> bool:
+        idx = self.bisect_left(item)
+        return idx < len(self._data) and self._data[idx] == item
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {self.__str__()}"
+
+    def __str__(self) -> str:
+        return str(self._data)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SortedArrayList):
+            raise TypeError(
+                f"Cannot compare {self.__class__.__name__} object to {type(other)}")
+        return self._data == other._data
+
+    def bisect_left(self, item: T) -> int:
+        """
+        Return the first index where item could be inserted keeping the list sorted
+        Runtime: O(log n)
+        """
+        # Search the storage of the ArrayList directly so that the comparisons run in C
+        head = self._data.head
+        return bisect_left(self._data._array, item, head, head + len(self._data)) - head
+
+    def bisect_right(self, item: T) -> int:
+        """
+        Return the last index where item could be inserted keeping the list sorted
+        Runtime: O(log n)
+        """
+        head = self._data.head
+        return bisect_right(self._data._array, item, head, head + len(self._data)) - head
+
+    def add(self, item: T) -> None:
+        """
+        Insert item after any equal items
+        Runtime: O(log n) search + O(n) slice move
+        """
+        self._data.put(self.bisect_right(item), item)
+
+    def update(self, items: Iterable[T]) -> None:
+        """
+        Insert many items at once
+        Runtime: O((n + k) log(n + k)), with a single rebuild of the storage
+        """
+        merged = self._data._get_array()
+        merged.extend(items)
+        merged.sort()
+
+        self._data = ArrayList(merged, typecode=self._data.typecode)
+
+    def index_of(self, item: T) -> int:
+        """
+        Return the index of the first occurrence of item
+        Runtime: O(log n)
+        """
+        idx = self.bisect_left(item)
+        if idx == len(self._data) or self._data[idx] != item:
+            raise ValueError(f"{item} is not in {self.__class__.__name__}")
+
+        return idx
+
+    def count(self, item: T) -> int:
+        """
+        Return the number of occurrences of item
+        Runtime: O(log n)
+        """
+        return self.bisect_right(item) - self.bisect_left(item)
+
+    def remove(self, item: T) -> T:
+        """
+        Remove the first occurrence of item
+        Runtime: O(log n) search + O(n) slice move
+        """
+        return self._data.remove(self.index_of(item))
+
+    def pop(self, index: int = -1) -> T:
+        if len(self._data) == 0:
+            raise IndexError("Cannot remove item from empty list")
+
+        if index < 0:
+            index += len(self._data)
+        if index < 0:
+            raise IndexError("SortedArrayList index out of range")
+
+        return self._data.remove(index)
+
+    def irange(
+        self, lo: T | None = None, hi: T | None = None, inclusive: tuple[bool, bool] = (True, True)
+    ) -> Iterator[T]:
+        """
+        Iterate over the items between lo and hi, None meaning unbounded
+        Runtime: O(log n + k)
+        """
+        start = 0
+        stop = len(self._data)
+
+        if lo is not None:
+            start = self.bisect_left(lo) if inclusive[0] else self.bisect_right(lo)
+        if hi is not None:
+            stop = self.bisect_right(hi) if inclusive[1] else self.bisect_left(hi)
+
+        return iter(self._data.view(start, max(start, stop)))
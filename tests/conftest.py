@@ -0,0 +1,14 @@
+class CollidingKey:
+    """Key whose hash is constant, to force every key onto the same slots"""
+
+    def __init__(self, name) -> None:
+        self.name = name
+
+    def __hash__(self) -> int:
+        return 7
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CollidingKey) and self.name == other.name
+
+    def __repr__(self) -> str:
+        return str(self.name)
@@ -1,6 +1,9 @@
+from array import array
+
 import pytest
 
 from src.data_structures.ArrayList import ArrayList
+from src.data_structures.GrowthPolicy import GrowthPolicy
 
 
 class TestArrayList:
@@ -195,3 +198,368 @@ class TestArrayList:
         item = array_list.deque()
         assert item == expected_returned_item
         assert array_list._get_array() == expected_array
+
+    @pytest.mark.parametrize(
+        "array_list_init, items_to_enqueue, expected_array",
+        [
+            (None, [1], [1]),
+            (None, list(range(5)), list(reversed(range(5)))),
+            ([7, 8], list(range(3)), [2, 1, 0, 7, 8]),
+            (5, list(range(20)), list(reversed(range(20))) + [5]),
+        ],
+    )
+    def test_enqueue(self, array_list_init, items_to_enqueue, expected_array):
+        array_list = ArrayList(array_list_init)
+        for item in items_to_enqueue:
+            array_list.enqueue(item)
+
+        assert array_list._get_array() == expected_array
+        assert array_list[0] == expected_array[0]
+        assert array_list[-1] == expected_array[-1]
+
+    def test_deque_moves_head(self):
+        array_list = ArrayList(list(range(8)))
+        array_list.deque()
+        array_list.deque()
+
+        assert array_list.head == 2
+        assert array_list.capacity == 8
+        assert array_list[0] == 2
+
+    def test_push_after_deque_reuses_front_gap(self):
+        array_list = ArrayList(list(range(8)))
+        for _ in range(5):
+            array_list.deque()
+        for item in range(8, 12):
+            array_list.push(item)
+
+        assert array_list.capacity == 8
+        assert array_list._get_array() == list(range(5, 12))
+
+    def test_fifo_queue(self):
+        array_list = ArrayList()
+        out = []
+        for item in range(50):
+            array_list.push(item)
+            if item % 3 == 0:
+                out.append(array_list.deque())
+        while len(array_list):
+            out.append(array_list.deque())
+
+        assert out == list(range(50))
+
+    @pytest.mark.parametrize(
+        "array_list_init, index, value, expected_array",
+        [
+            ([0, 1, 2, 3, 4, 5], 1, 9, [0, 9, 1, 2, 3, 4, 5]),
+            ([0, 1, 2, 3, 4, 5], 5, 9, [0, 1, 2, 3, 4, 9, 5]),
+            ([0, 1, 2, 3, 4, 5], 6, 9, [0, 1, 2, 3, 4, 5, 9]),
+            (None, 0, 9, [9]),
+        ],
+    )
+    def test_put(self, array_list_init, index, value, expected_array):
+        array_list = ArrayList(array_list_init)
+        array_list.put(index, value)
+        assert array_list._get_array() == expected_array
+
+    def test_negative_index_after_push(self):
+        array_list = ArrayList()
+        for item in range(5):
+            array_list.push(item)
+
+        assert array_list[-1] == 4
+        assert array_list[-5] == 0
+
+    @pytest.mark.parametrize(
+        "array_list_init, items, expected_array, expected_capacity",
+        [
+            (None, [], [], 4),
+            (None, range(3), [0, 1, 2], 4),
+            (None, range(10), list(range(10)), 10),
+            ([0, 1], (2, 3), [0, 1, 2, 3], 4),
+            ([0, 1], iter(range(2, 7)), list(range(7)), 7),
+        ],
+    )
+    def test_extend(self, array_list_init, items, expected_array, expected_capacity):
+        array_list = ArrayList(array_list_init)
+        array_list.extend(items)
+        assert array_list._get_array() == expected_array
+        assert array_list.capacity == expected_capacity
+
+    @pytest.mark.parametrize(
+        "array_list_init, index, items, expected_array",
+        [
+            ([0, 1, 2], 0, [7, 8], [7, 8, 0, 1, 2]),
+            ([0, 1, 2], 1, [7, 8], [0, 7, 8, 1, 2]),
+            ([0, 1, 2], 3, [7, 8], [0, 1, 2, 7, 8]),
+            ([0, 1, 2], 2, [], [0, 1, 2]),
+            (None, 0, range(5), [0, 1, 2, 3, 4]),
+        ],
+    )
+    def test_insert_many(self, array_list_init, index, items, expected_array):
+        array_list = ArrayList(array_list_init)
+        array_list.insert_many(index, items)
+        assert array_list._get_array() == expected_array
+        assert len(array_list) == len(expected_array)
+
+    @pytest.mark.parametrize("index", [-1, 4])
+    def test_insert_many_index_error(self, index):
+        array_list = ArrayList([0, 1, 2])
+        with pytest.raises(IndexError):
+            array_list.insert_many(index, [5])
+
+    @pytest.mark.parametrize(
+        "array_list_init, start, stop, expected_array, expected_removed",
+        [
+            (list(range(6)), 0, 2, [2, 3, 4, 5], [0, 1]),
+            (list(range(6)), 1, 3, [0, 3, 4, 5], [1, 2]),
+            (list(range(6)), 3, 6, [0, 1, 2], [3, 4, 5]),
+            (list(range(6)), 0, 6, [], list(range(6))),
+            (list(range(6)), 2, 2, list(range(6)), []),
+        ],
+    )
+    def test_remove_range(self, array_list_init, start, stop, expected_array, expected_removed):
+        array_list = ArrayList(array_list_init)
+        removed = array_list.remove_range(start, stop)
+        assert removed._get_array() == expected_removed
+        assert array_list._get_array() == expected_array
+        assert array_list._array.count(None) == array_list.capacity - array_list.length
+
+    @pytest.mark.parametrize("start, stop", [(-1, 2), (2, 7), (4, 3)])
+    def test_remove_range_index_error(self, start, stop):
+        array_list = ArrayList(list(range(6)))
+        with pytest.raises(IndexError):
+            array_list.remove_range(start, stop)
+    def test_growth_policy(self):
+        array_list = ArrayList(growth_policy=GrowthPolicy(factor=1.5, min_step=2))
+        capacities = []
+        for item in range(20):
+            array_list.push(item)
+            capacities.append(array_list.capacity)
+
+        assert sorted(set(capacities)) == [4, 6, 9, 13, 19, 28]
+        assert array_list._get_array() == list(range(20))
+
+    def test_shrink_on_remove(self):
+        array_list = ArrayList(growth_policy=GrowthPolicy(min_capacity=4))
+        array_list.extend(range(64))
+        while len(array_list) > 15:
+            array_list.pop()
+
+        assert array_list.capacity == 30
+        assert array_list._get_array() == list(range(15))
+
+        # hysteresis: pushing one item back does not grow the array again
+        array_list.push(15)
+        assert array_list.capacity == 30
+
+    def test_no_shrink_below_min_capacity(self):
+        array_list = ArrayList(list(range(64)))
+        while len(array_list):
+            array_list.deque()
+
+        assert array_list.capacity == 64
+
+    def test_reserve(self):
+        array_list = ArrayList([1, 2])
+        array_list.reserve(100)
+        assert array_list.capacity == 100
+
+        array_list.extend(range(98))
+        assert array_list.capacity == 100
+
+        array_list.reserve(10)
+        assert array_list.capacity == 100
+
+    def test_reserve_survives_removals(self):
+        array_list = ArrayList(typecode="q")
+        array_list.reserve(10_000)
+        array_list.extend(range(100))
+        array_list.pop()
+        array_list.remove_range(0, 50)
+        assert array_list.capacity == 10_000
+
+        resizes = array_list.allocation_stats.resizes
+        for i in range(9_000):
+            array_list.push(i)
+        assert array_list.allocation_stats.resizes == resizes
+
+        array_list.remove_range(0, array_list.length)
+        array_list.shrink_to_fit()
+        array_list.extend(range(100))
+        array_list.remove_range(0, 100)
+        assert array_list.capacity < 10_000
+
+    @pytest.mark.parametrize("typecode", [None, "q"])
+    def test_reserve_never_reallocates(self, typecode):
+        array_list = ArrayList(typecode=typecode)
+        array_list.reserve(100)
+        resizes = array_list.allocation_stats.resizes
+
+        for i in range(60):
+            array_list.push(i)
+        array_list.enqueue(-1)
+        while len(array_list) < 100:
+            array_list.push(len(array_list))
+        array_list.deque()
+        array_list.push(100)
+        array_list.pop()
+        array_list.enqueue(-2)
+
+        assert array_list.allocation_stats.resizes == resizes
+        assert array_list.capacity == 100
+        assert array_list._get_array() == [-2] + list(range(60)) + list(range(61, 100))
+
+    @pytest.mark.parametrize(
+        "array_list_init, items_to_push, expected_capacity",
+        [
+            (None, [], 0),
+            (None, range(5), 5),
+            (list(range(3)), [], 3),
+        ],
+    )
+    def test_shrink_to_fit(self, array_list_init, items_to_push, expected_capacity):
+        array_list = ArrayList(array_list_init)
+        array_list.extend(items_to_push)
+        array_list.shrink_to_fit()
+        assert array_list.capacity == expected_capacity
+
+        array_list.push(9)
+        assert array_list[-1] == 9
+
+    @pytest.mark.parametrize(
+        "start, stop, step, expected_items",
+        [
+            (0, None, 1, list(range(10))),
+            (2, 5, 1, [2, 3, 4]),
+            (-3, None, 1, [7, 8, 9]),
+            (0, None, 3, [0, 3, 6, 9]),
+            (None, None, -1, list(reversed(range(10)))),
+            (5, 20, 1, [5, 6, 7, 8, 9]),
+            (5, 2, 1, []),
+        ],
+    )
+    def test_view(self, start, stop, step, expected_items):
+        array_list = ArrayList(list(range(10)))
+        view = array_list.view(start, stop, step)
+        assert list(view) == expected_items
+        assert len(view) == len(expected_items)
+
+    def test_view_after_deque(self):
+        array_list = ArrayList(list(range(10)))
+        array_list.deque()
+        array_list.deque()
+        view = array_list.view(1, 4)
+
+        assert list(view) == [3, 4, 5]
+        assert view[0] == 3
+        assert view[-1] == 5
+        assert list(view[1:]) == [4, 5]
+
+    def test_view_shares_storage(self):
+        array_list = ArrayList(list(range(5)))
+        view = array_list.view(1, 4)
+        view[0] = 10
+        array_list[2] = 20
+
+        assert array_list._get_array() == [0, 10, 20, 3, 4]
+        assert list(view) == [10, 20, 3]
+
+    @pytest.mark.parametrize("index", [3, -4])
+    def test_view_index_error(self, index):
+        view = ArrayList(list(range(5))).view(1, 4)
+        with pytest.raises(IndexError):
+            _ = view[index]
+
+    def test_view_step_zero(self):
+        with pytest.raises(ValueError):
+            ArrayList(list(range(5))).view(0, 5, 0)
+
+
+class TestTypedArrayList:
+    @pytest.mark.parametrize(
+        "array_list_init, typecode, expected_length, expected_capacity",
+        [
+            (None, "d", 0, 4),
+            (1.5, "d", 1, 4),
+            ([1, 2, 3], "q", 3, 3),
+            (array("i", range(5)), None, 5, 5),
+        ],
+    )
+    def test_init(self, array_list_init, typecode, expected_length, expected_capacity):
+        array_list = ArrayList(array_list_init, typecode=typecode)
+        assert isinstance(array_list._array, array)
+        assert array_list.length == expected_length
+        assert array_list.capacity == expected_capacity
+
+    def test_push_pop_grow(self):
+        array_list = ArrayList(typecode="d")
+        for item in range(9):
+            array_list.push(item / 2)
+
+        assert array_list.capacity == 16
+        assert array_list._array.typecode == "d"
+        assert array_list.pop() == 4.0
+        assert array_list._get_array() == [item / 2 for item in range(8)]
+
+    def test_put_remove(self):
+        array_list = ArrayList([0, 1, 2, 3, 4], typecode="i")
+        array_list.put(2, 9)
+        array_list.enqueue(-1)
+
+        assert array_list.remove(3) == 9
+        assert array_list.deque() == -1
+        assert array_list._get_array() == [0, 1, 2, 3, 4]
+        assert array_list[-1] == 4
+
+    def test_cleared_slots_are_zero(self):
+        array_list = ArrayList([5, 6, 7], typecode="i")
+        array_list.pop()
+        assert array_list._array[2] == 0
+
+    def test_equal_untyped(self):
+        assert ArrayList([1, 2, 3], typecode="i") == ArrayList([1, 2, 3])
+        assert str(ArrayList([1, 2, 3], typecode="i")) == "[1, 2, 3]"
+
+    def test_wrong_item_type(self):
+        array_list = ArrayList(typecode="i")
+        with pytest.raises(TypeError):
+            array_list.push("a")
+
+    def test_bulk_operations(self):
+        array_list = ArrayList(typecode="q")
+        array_list.extend(range(10))
+        array_list.insert_many(5, [100, 101])
+        removed = array_list.remove_range(0, 3)
+
+        assert removed._array.typecode == "q"
+        assert removed._get_array() == [0, 1, 2]
+        assert array_list._get_array() == [3, 4, 100, 101, 5, 6, 7, 8, 9]
+
+    def test_view_memoryview(self):
+        array_list = ArrayList(list(range(6)), typecode="d")
+        view = array_list.view(0, 6, 2)
+        view[1] = 9.5
+
+        assert isinstance(view._storage, memoryview)
+        assert list(view) == [0.0, 9.5, 4.0]
+        assert array_list[2] == 9.5
+
+    def test_operations_with_live_view(self):
+        array_list = ArrayList(list(range(10)), typecode="q")
+        array_list.reserve(64)
+        array_list.deque()
+        view = array_list.view(2, 5)
+
+        array_list.push(10)
+        array_list.pop()
+        array_list.pop()
+        array_list.deque()
+        array_list.enqueue(0)
+        array_list.extend([20, 21])
+        array_list.remove_range(7, 10)
+
+        assert array_list._get_array() == [0, 2, 3, 4, 5, 6, 7]
+        assert list(view) == [3, 4, 5]
+        array_list[2] = 30
+        assert list(view) == [30, 4, 5]
@@ -0,0 +1,41 @@
+import pytest
+
+from src.data_structures.BinaryTree import BinaryTree
+from src.data_structures.Node import BinaryNode
+
+
+@pytest.fixture
+def tree():
+    """
+            1
+          /   \\
+         2     3
+        / \\     \\
+       4   5     6
+      /
+     7
+    """
+    return BinaryTree(
+        BinaryNode(
+            1,
+            BinaryNode(2, BinaryNode(4, BinaryNode(7)), BinaryNode(5)),
+            BinaryNode(3, None, BinaryNode(6)),
+        )
+    )
+
+
+class TestBinaryTree:
+    """Test cases for the breadth-first traversal and search of BinaryTree."""
+
+    def test_breadth_first_traversal_order(self, tree):
+        """Test that nodes come out level by level, left to right."""
+        assert tree.breadth_first_traversal()._get_array() == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_breadth_first_traversal_single_node(self):
+        """Test the traversal of a tree with only a root."""
+        assert BinaryTree(BinaryNode(1)).breadth_first_traversal()._get_array() == [1]
+
+    @pytest.mark.parametrize("needle, expected", [(1, True), (6, True), (7, True), (8, False)])
+    def test_bfs(self, tree, needle, expected):
+        """Test bfs on nodes at every depth and on a missing value."""
+        assert tree.bfs(needle) is expected
@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+from src.data_structures.BlockedList import BlockedList
+
+
+class TestBlockedList:
+    @pytest.mark.parametrize(
+        "items, block_size, expected_blocks",
+        [
+            (None, 4, 0),
+            (range(4), 4, 1),
+            (range(10), 4, 3),
+            (range(10), 1, 10),
+        ],
+    )
+    def test_init(self, items, block_size, expected_blocks):
+        blocked_list = BlockedList(items, block_size=block_size)
+        assert len(blocked_list._blocks) == expected_blocks
+        assert list(blocked_list) == list(items or [])
+
+    def test_init_invalid_block_size(self):
+        with pytest.raises(ValueError):
+            BlockedList(block_size=0)
+
+    @pytest.mark.parametrize("index", [0, 3, 4, 9, -1, -10])
+    def test_getitem(self, index):
+        blocked_list = BlockedList(range(10), block_size=4)
+        assert blocked_list[index] == list(range(10))[index]
+
+    @pytest.mark.parametrize("index", [10, -11])
+    def test_getitem_index_error(self, index):
+        blocked_list = BlockedList(range(10), block_size=4)
+        with pytest.raises(IndexError):
+            _ = blocked_list[index]
+
+    def test_setitem(self):
+        blocked_list = BlockedList(range(10), block_size=4)
+        blocked_list[5] = 50
+        blocked_list[-1] = 90
+        assert list(blocked_list) == [0, 1, 2, 3, 4, 50, 6, 7, 8, 90]
+
+    @pytest.mark.parametrize(
+        "index, item, expected_items",
+        [
+            (0, 9, [9, 0, 1, 2, 3, 4, 5]),
+            (4, 9, [0, 1, 2, 3, 9, 4, 5]),
+            (6, 9, [0, 1, 2, 3, 4, 5, 9]),
+        ],
+    )
+    def test_put(self, index, item, expected_items):
+        blocked_list = BlockedList(range(6), block_size=4)
+        blocked_list.put(index, item)
+        assert list(blocked_list) == expected_items
+        assert len(blocked_list) == 7
+
+    @pytest.mark.parametrize("index", [-1, 7])
+    def test_put_index_error(self, index):
+        blocked_list = BlockedList(range(6), block_size=4)
+        with pytest.raises(IndexError):
+            blocked_list.put(index, 0)
+
+    def test_split_overflowing_block(self):
+        blocked_list = BlockedList(block_size=2)
+        for item in range(5):
+            blocked_list.enqueue(item)
+
+        assert list(blocked_list) == [4, 3, 2, 1, 0]
+        assert all(len(block) <= 4 for block in blocked_list._blocks)
+        assert len(blocked_list._blocks) == 2
+
+    @pytest.mark.parametrize(
+        "index, expected_item, expected_items",
+        [
+            (0, 0, list(range(1, 10))),
+            (5, 5, [0, 1, 2, 3, 4, 6, 7, 8, 9]),
+            (9, 9, list(range(9))),
+        ],
+    )
+    def test_remove(self, index, expected_item, expected_items):
+        blocked_list = BlockedList(range(10), block_size=4)
+        assert blocked_list.remove(index) == expected_item
+        assert list(blocked_list) == expected_items
+
+    @pytest.mark.parametrize("items, index", [(None, 0), (range(3), 3), (range(3), -1)])
+    def test_remove_index_error(self, items, index):
+        blocked_list = BlockedList(items, block_size=4)
+        with pytest.raises(IndexError):
+            blocked_list.remove(index)
+
+    def test_merge_underflowing_block(self):
+        blocked_list = BlockedList(range(12), block_size=4)
+        for _ in range(3):
+            blocked_list.remove(0)
+
+        assert list(blocked_list) == list(range(3, 12))
+        assert len(blocked_list._blocks) == 2
+
+    def test_drain(self):
+        blocked_list = BlockedList(range(20), block_size=3)
+        out = [blocked_list.deque() for _ in range(10)]
+        out += [blocked_list.pop() for _ in range(10)]
+
+        assert out == list(range(10)) + list(reversed(range(10, 20)))
+        assert len(blocked_list) == 0
+        assert not blocked_list._blocks
+
+        blocked_list.push(1)
+        assert list(blocked_list) == [1]
+
+    def test_middle_inserts(self):
+        blocked_list = BlockedList(block_size=4)
+        expected = []
+        for item in range(100):
+            blocked_list.put(len(blocked_list) // 2, item)
+            expected.insert(len(expected) // 2, item)
+
+        assert list(blocked_list) == expected
+        assert blocked_list[37] == expected[37]
+
+    def test_block_capacity_stays_fixed(self):
+        blocked_list = BlockedList(range(2000), block_size=16)
+        rng = random.Random(0)
+        for i in range(2000):
+            blocked_list.put(rng.randrange(len(blocked_list) + 1), i)
+            if i % 3 == 0:
+                blocked_list.remove(rng.randrange(len(blocked_list)))
+
+        assert {block.capacity for block in blocked_list._blocks} == {2 * 16 + 1}
+        assert all(block.allocation_stats.resizes <= 1 for block in blocked_list._blocks)
+
+    def test_equal(self):
+        assert BlockedList(range(10), block_size=2) == BlockedList(range(10), block_size=5)
+        assert BlockedList(range(10)) != BlockedList(range(9))
+        with pytest.raises(TypeError):
+            _ = BlockedList(range(3)) == [0, 1, 2]
+
+    def test_typed(self):
+        blocked_list = BlockedList([1.5, 2.5], block_size=2, typecode="d")
+        blocked_list.put(1, 2.0)
+        assert list(blocked_list) == [1.5, 2.0, 2.5]
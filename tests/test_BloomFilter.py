@@ -0,0 +1,96 @@
+import pytest
+
+from src.data_structures.BloomFilter import COUNTER_MAX, BloomFilter
+
+
+class TestBloomFilter:
+    @pytest.mark.parametrize(
+        "expected_size, false_positive_rate, size, hash_count",
+        [(1000, 0.01, 9586, 7), (1000, 0.1, 4793, 3), (0, 0.01, 10, 7), (1, 0.5, 8, 6)],
+    )
+    def test_sizing(self, expected_size, false_positive_rate, size, hash_count):
+        bloom_filter = BloomFilter(expected_size, false_positive_rate)
+        assert bloom_filter.size == size
+        assert bloom_filter.hash_count == hash_count
+        assert len(bloom_filter._cells) == (size + 7) // 8
+
+    @pytest.mark.parametrize(
+        "args", [{"false_positive_rate": 0}, {"false_positive_rate": 1}, {"expected_size": -1}]
+    )
+    def test_invalid_arguments(self, args):
+        with pytest.raises(ValueError):
+            BloomFilter(**args)
+
+    @pytest.mark.parametrize("counting", [False, True])
+    def test_no_false_negatives(self, counting):
+        bloom_filter = BloomFilter(1000, 0.01, counting=counting)
+        keys = [f"key{i}" for i in range(1000)] + list(range(-500, 500))
+        for key in keys:
+            bloom_filter.add(key)
+
+        assert len(bloom_filter) == 2000
+        assert all(key in bloom_filter for key in keys)
+
+    @pytest.mark.parametrize("counting", [False, True])
+    def test_false_positive_rate(self, counting):
+        bloom_filter = BloomFilter(10_000, 0.01, counting=counting)
+        for i in range(10_000):
+            bloom_filter.add(f"key{i}")
+
+        false_positives = sum(f"missing{i}" in bloom_filter for i in range(10_000))
+        assert false_positives < 200
+        assert bloom_filter.estimated_false_positive_rate() == pytest.approx(0.01, rel=0.1)
+
+    def test_empty(self):
+        bloom_filter = BloomFilter()
+        assert "key" not in bloom_filter
+        assert bloom_filter.estimated_false_positive_rate() == 0.0
+
+    def test_counting_remove(self):
+        bloom_filter = BloomFilter(100, 0.01, counting=True)
+        bloom_filter.add("a")
+        bloom_filter.add("b")
+        bloom_filter.add("b")
+
+        bloom_filter.remove("a")
+        assert "a" not in bloom_filter
+        assert "b" in bloom_filter
+
+        bloom_filter.remove("b")
+        assert "b" in bloom_filter
+        bloom_filter.remove("b")
+        assert "b" not in bloom_filter
+        assert len(bloom_filter) == 0
+
+    def test_saturated_counters_stay_set(self):
+        bloom_filter = BloomFilter(100, 0.01, counting=True)
+        for _ in range(COUNTER_MAX + 10):
+            bloom_filter.add("a")
+        for _ in range(COUNTER_MAX + 10):
+            bloom_filter.remove("a")
+
+        assert "a" in bloom_filter
+
+    def test_remove_requires_counting(self):
+        bloom_filter = BloomFilter()
+        bloom_filter.add("a")
+        with pytest.raises(ValueError):
+            bloom_filter.remove("a")
+
+    def test_hash_methods(self):
+        bloom_filter = BloomFilter(100, 0.01, counting=True)
+        bloom_filter.add_hash(hash("a"))
+        assert "a" in bloom_filter
+        assert bloom_filter.contains_hash(hash("a"))
+
+        bloom_filter.remove_hash(hash("a"))
+        assert not bloom_filter.contains_hash(hash("a"))
+
+    def test_clear(self):
+        bloom_filter = BloomFilter(100, 0.01)
+        bloom_filter.add("a")
+        bloom_filter.clear()
+
+        assert "a" not in bloom_filter
+        assert len(bloom_filter) == 0
+        assert "length=0" in repr(bloom_filter)
@@ -0,0 +1,141 @@
+import pytest
+
+from src.data_structures.CompactHashMap import CompactHashMap, _index_typecode
+from src.data_structures.Hashing import fibonacci_slot
+from tests.conftest import CollidingKey
+
+
+class TestCompactHashMap:
+    def test_update_keeps_position(self):
+        hash_map = CompactHashMap()
+        hash_map["a"] = 1
+        hash_map["b"] = 2
+        hash_map.update("a", 10)
+        hash_map["b"] = 20
+
+        assert list(hash_map.items()) == [("a", 10), ("b", 20)]
+
+    def test_insertion_order(self):
+        hash_map = CompactHashMap()
+        keys = [f"key{i}" for i in range(200)]
+        for key in keys:
+            hash_map[key] = key.upper()
+
+        assert list(hash_map) == keys
+        assert list(hash_map.keys()) == keys
+        assert list(hash_map.values()) == [key.upper() for key in keys]
+        assert str(CompactHashMap()) == "{}"
+
+    def test_remove_and_reinsert_moves_to_end(self):
+        hash_map = CompactHashMap()
+        for key in "abc":
+            hash_map[key] = key
+
+        kv_pair = hash_map.remove("a")
+        assert (kv_pair.key, kv_pair.value) == ("a", "a")
+        assert hash_map.remove("a") is None
+        hash_map["a"] = "A"
+
+        assert str(hash_map) == "{'b': 'b', 'c': 'c', 'a': 'A'}"
+
+    def test_pop(self):
+        hash_map = CompactHashMap()
+        hash_map["a"] = 1
+
+        assert hash_map.pop("a") == 1
+        assert hash_map.pop("a", None) is None
+        with pytest.raises(KeyError, match="Key: a does not exist!"):
+            hash_map.pop("a")
+        assert hash_map.length == 0
+
+    def test_colliding_removal_keeps_probe_sequence(self):
+        hash_map = CompactHashMap()
+        keys = [CollidingKey(name) for name in "xyz"]
+        for i, key in enumerate(keys):
+            hash_map.put(key, i)
+
+        hash_map.remove(keys[0])
+        assert hash_map.get(keys[2]) == 2
+        assert list(hash_map) == keys[1:]
+
+    def test_resize_keeps_order_and_drops_holes(self):
+        hash_map = CompactHashMap()
+        for i in range(100):
+            hash_map[i] = i
+        for i in range(0, 100, 2):
+            hash_map.remove(i)
+        for i in range(100, 200):
+            hash_map[i] = i
+
+        expected = list(range(1, 100, 2)) + list(range(100, 200))
+        assert list(hash_map) == expected
+        assert hash_map.length == len(expected)
+        assert len(hash_map._keys) < 200
+        assert hash_map.allocation_stats.resizes > 0
+        for key in expected:
+            assert hash_map[key] == key
+
+    def test_churn_does_not_grow(self):
+        hash_map = CompactHashMap()
+        for i in range(1000):
+            hash_map[i] = i
+            hash_map.remove(i)
+
+        assert hash_map.capacity == 8
+
+    def test_aligned_integer_keys(self):
+        # keys sharing their low 20 bits used to fall into a single probe chain
+        hash_map = CompactHashMap()
+        keys = [i << 20 for i in range(4000)]
+        for key in keys:
+            hash_map[key] = key
+
+        mask = hash_map.capacity - 1
+        longest_probe = max(
+            (slot - fibonacci_slot(hash_map._hashes[entry], hash_map._bits)) & mask
+            for slot, entry in enumerate(hash_map._index)
+            if entry >= 0
+        )
+        assert longest_probe < 32
+        assert all(hash_map[key] == key for key in keys)
+
+    @pytest.mark.parametrize(
+        "capacity, typecode", [(8, "b"), (128, "b"), (256, "h"), (1 << 16, "i"), (1 << 32, "q")])
+    def test_index_typecode(self, capacity, typecode):
+        assert _index_typecode(capacity) == typecode
+
+    def test_index_grows_its_typecode(self):
+        hash_map = CompactHashMap()
+        for i in range(200):
+            hash_map[i] = i
+
+        assert hash_map._index.typecode == "h"
+
+    @pytest.mark.parametrize(
+        "mutation",
+        [
+            lambda hash_map: hash_map.put("new", 0),
+            lambda hash_map: hash_map.remove("a"),
+        ],
+    )
+    def test_mutation_during_iteration_raises(self, mutation):
+        hash_map = CompactHashMap()
+        for key in "abc":
+            hash_map[key] = key
+
+        with pytest.raises(RuntimeError, match="CompactHashMap changed size during iteration"):
+            for _ in hash_map.items():
+                mutation(hash_map)
+
+    def test_matches_dict(self):
+        hash_map = CompactHashMap()
+        model = {}
+        for i in range(3000):
+            key = (i * 7919) % 500
+            if i % 3 == 2:
+                assert hash_map.pop(key, None) == model.pop(key, None)
+            else:
+                hash_map[key] = i
+                model[key] = i
+
+        assert list(hash_map.items()) == list(model.items())
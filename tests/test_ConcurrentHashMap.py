@@ -0,0 +1,117 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.data_structures.ConcurrentHashMap import ConcurrentHashMap
+
+
+class TestConcurrentHashMap:
+    def test_init(self):
+        hash_map = ConcurrentHashMap()
+        assert len(hash_map) == 0
+        assert hash_map.segments == 16
+        assert str(hash_map) == "{}"
+
+    def test_invalid_segments(self):
+        with pytest.raises(ValueError):
+            ConcurrentHashMap(segments=0)
+
+    def test_expected_size_presizes_segments(self):
+        hash_map = ConcurrentHashMap(segments=4, expected_size=400)
+        assert all(segment.capacity >= 100 / 0.7 for segment in hash_map._segments)
+
+    def test_put_get_update(self):
+        hash_map = ConcurrentHashMap()
+        hash_map.put("a", 1)
+        hash_map["b"] = 2
+        hash_map.update("a", 10)
+
+        assert hash_map["a"] == 10
+        assert hash_map.get("b") == 2
+        assert hash_map.get("c") is None
+        assert hash_map.get("c", 0) == 0
+        assert "a" in hash_map
+        assert "c" not in hash_map
+        assert len(hash_map) == 2
+
+    def test_missing_and_existing_keys(self):
+        hash_map = ConcurrentHashMap()
+        hash_map.put("a", 1)
+        with pytest.raises(KeyError, match="Key: a already exists!"):
+            hash_map.put("a", 2)
+        with pytest.raises(KeyError, match="Key: b does not exist!"):
+            _ = hash_map["b"]
+        with pytest.raises(KeyError, match="Key: b does not exist!"):
+            hash_map.update("b", 2)
+
+    def test_remove_and_pop(self):
+        hash_map = ConcurrentHashMap()
+        hash_map["a"] = 1
+        hash_map["b"] = 2
+
+        assert hash_map.remove("a").value == 1
+        assert hash_map.remove("a") is None
+        assert hash_map.pop("b") == 2
+        assert hash_map.pop("b", None) is None
+        with pytest.raises(KeyError, match="Key: b does not exist!"):
+            hash_map.pop("b")
+        assert len(hash_map) == 0
+
+    def test_compute_if_absent_and_setdefault(self):
+        hash_map = ConcurrentHashMap()
+        assert hash_map.compute_if_absent("a", lambda key: key * 2) == "aa"
+        assert hash_map.compute_if_absent("a", lambda key: "unused") == "aa"
+        assert hash_map.setdefault("b", 1) == 1
+        assert hash_map.setdefault("b", 2) == 1
+
+    def test_iteration(self):
+        hash_map = ConcurrentHashMap(segments=4)
+        for i in range(100):
+            hash_map[i] = -i
+
+        assert sorted(hash_map) == list(range(100))
+        assert sorted(hash_map.keys()) == list(range(100))
+        assert sorted(hash_map.values()) == sorted(-i for i in range(100))
+        assert sorted(hash_map.items()) == [(i, -i) for i in range(100)]
+
+    def test_keys_are_spread_across_segments(self):
+        hash_map = ConcurrentHashMap(segments=8)
+        for i in range(800):
+            hash_map[i] = i
+
+        lengths = [segment.length for segment in hash_map._segments]
+        assert min(lengths) > 50
+
+    def test_concurrent_inserts(self):
+        hash_map = ConcurrentHashMap(segments=4)
+
+        def insert(start):
+            for i in range(start, start + 2000):
+                hash_map[i] = i
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(insert, range(0, 16000, 2000)))
+
+        assert len(hash_map) == 16000
+        assert all(hash_map[i] == i for i in range(16000))
+
+    def test_compute_if_absent_calls_factory_once(self):
+        hash_map = ConcurrentHashMap()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def factory(key):
+            calls.append(key)
+            return object()
+
+        def worker(_):
+            barrier.wait()
+            return [hash_map.compute_if_absent(key, factory) for key in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(worker, range(8)))
+
+        assert sorted(calls) == list(range(200))
+        for result in results[1:]:
+            assert all(a is b for a, b in zip(result, results[0]))
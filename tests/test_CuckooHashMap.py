@@ -0,0 +1,100 @@
+import pytest
+
+from src.data_structures.CuckooHashMap import (BUCKET_SLOTS, STASH_SIZE,
+                                               CuckooHashMap)
+from tests.conftest import CollidingKey
+
+
+class TestCuckooHashMap:
+    def test_remove_and_pop(self):
+        hash_map = CuckooHashMap()
+        hash_map["a"] = 1
+        hash_map["b"] = 2
+
+        kv_pair = hash_map.remove("a")
+        assert (kv_pair.key, kv_pair.value) == ("a", 1)
+        assert hash_map.remove("a") is None
+        assert hash_map.pop("b") == 2
+        assert hash_map.pop("b", None) is None
+        with pytest.raises(KeyError, match="Key: b does not exist!"):
+            hash_map.pop("b")
+        assert hash_map.length == 0
+
+    def test_colliding_keys_use_the_stash(self):
+        hash_map = CuckooHashMap()
+        keys = [CollidingKey(i) for i in range(2 * BUCKET_SLOTS + STASH_SIZE)]
+        for i, key in enumerate(keys):
+            hash_map[key] = i
+
+        assert len(hash_map._stash) == STASH_SIZE
+        assert hash_map._allocation_stats is None
+        for i, key in enumerate(keys):
+            assert hash_map[key] == i
+
+        hash_map[CollidingKey("stashed")] = 0
+        stashed = hash_map._stash[0].key
+        hash_map.update(stashed, -1)
+        assert hash_map[stashed] == -1
+        assert hash_map.remove(stashed).value == -1
+        assert stashed not in hash_map
+
+    def test_removal_moves_stashed_entry_back(self):
+        hash_map = CuckooHashMap()
+        keys = [CollidingKey(i) for i in range(2 * BUCKET_SLOTS + 1)]
+        for key in keys:
+            hash_map[key] = key.name
+
+        assert len(hash_map._stash) == 1
+        hash_map.remove(keys[0])
+        assert hash_map._stash == []
+        assert sorted(hash_map.values()) == list(range(1, 2 * BUCKET_SLOTS + 1))
+
+    def test_many_colliding_keys_stay_bounded(self):
+        hash_map = CuckooHashMap()
+        for i in range(1000):
+            hash_map[CollidingKey(i)] = i
+
+        assert hash_map.capacity <= 1 << 14
+        assert all(hash_map[CollidingKey(i)] == i for i in range(1000))
+
+    def test_grows_and_keeps_entries(self):
+        hash_map = CuckooHashMap()
+        for i in range(5000):
+            hash_map[f"key{i}"] = i
+
+        assert hash_map.allocation_stats.resizes > 0
+        assert len(hash_map._stash) <= STASH_SIZE
+        assert hash_map.length / hash_map.capacity > 0.3
+        assert sorted(hash_map.values()) == list(range(5000))
+
+    def test_iteration(self):
+        hash_map = CuckooHashMap()
+        for i in range(100):
+            hash_map[i] = -i
+
+        assert sorted(hash_map) == list(range(100))
+        assert sorted(hash_map.keys()) == list(range(100))
+        assert sorted(hash_map.items()) == [(i, -i) for i in range(100)]
+
+    def test_mutation_during_iteration_raises(self):
+        hash_map = CuckooHashMap()
+        for key in "abc":
+            hash_map[key] = key
+
+        with pytest.raises(RuntimeError, match="CuckooHashMap changed size during iteration"):
+            for key in hash_map:
+                hash_map.remove(key)
+
+    def test_matches_dict(self):
+        hash_map = CuckooHashMap()
+        model = {}
+        for i in range(5000):
+            key = (i * 7919) % 700
+            if i % 3 == 2:
+                assert hash_map.pop(key, None) == model.pop(key, None)
+            else:
+                hash_map[key] = i
+                model[key] = i
+
+        assert hash_map.length == len(model)
+        assert sorted(hash_map.items()) == sorted(model.items())
@@ -0,0 +1,57 @@
+import pytest
+
+from src.data_structures.GrowthPolicy import GrowthPolicy
+
+
+class TestGrowthPolicy:
+    @pytest.mark.parametrize(
+        "policy, capacity, required, expected_capacity",
+        [
+            (GrowthPolicy(), 4, 5, 8),
+            (GrowthPolicy(), 0, 1, 1),
+            (GrowthPolicy(), 4, 20, 20),
+            (GrowthPolicy(factor=1.5), 10, 11, 15),
+            (GrowthPolicy(factor=1.5, min_step=8), 4, 5, 12),
+            (GrowthPolicy(max_headroom=100), 1000, 1001, 1101),
+            (GrowthPolicy(max_headroom=100), 10, 11, 20),
+        ],
+    )
+    def test_grow(self, policy, capacity, required, expected_capacity):
+        assert policy.grow(capacity, required) == expected_capacity
+
+    @pytest.mark.parametrize(
+        "policy, capacity, expected_limit",
+        [
+            (GrowthPolicy(), 64, 0),
+            (GrowthPolicy(), 128, 32),
+            (GrowthPolicy(min_capacity=4), 16, 4),
+            (GrowthPolicy(shrink_threshold=None), 1024, 0),
+        ],
+    )
+    def test_shrink_limit(self, policy, capacity, expected_limit):
+        assert policy.shrink_limit(capacity) == expected_limit
+
+    @pytest.mark.parametrize(
+        "policy, length, expected_capacity",
+        [
+            (GrowthPolicy(), 10, 64),
+            (GrowthPolicy(), 100, 200),
+            (GrowthPolicy(factor=1.5, min_capacity=0), 10, 15),
+        ],
+    )
+    def test_shrink(self, policy, length, expected_capacity):
+        assert policy.shrink(length) == expected_capacity
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"factor": 1},
+            {"factor": 0.5},
+            {"min_step": 0},
+            {"shrink_threshold": 0.5},
+            {"shrink_threshold": 0},
+        ],
+    )
+    def test_invalid_policy(self, kwargs):
+        with pytest.raises(ValueError):
+            GrowthPolicy(**kwargs)
@@ -1,6 +1,7 @@
 import pytest
 
-from src.data_structures.HashMap import HashMap, KeyValuePair
+from src.data_structures.HashMap import (REHASH_STEP, SHRINK_RATIO, HashMap,
+                                         KeyValuePair)
 
 
 class TestKeyValuePair:
@@ -30,6 +31,10 @@ class TestKeyValuePair:
         kv_pair = KeyValuePair(key, value)
         assert repr(kv_pair) == expected_repr
 
+    def test_cached_hash(self):
+        assert KeyValuePair("name", "Alice").hash == hash("name")
+        assert KeyValuePair("name", "Alice", 7).hash == 7
+
 
 class TestHashMap:
     def test_init(self):
@@ -276,3 +281,533 @@ class TestHashMap:
         hash_map.put("c", 3)
         assert hash_map.get("c") == 3
         assert hash_map.length == 2
+
+
+class CountingKey:
+    """Key that counts how many times it is hashed"""
+
+    hash_calls = 0
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __hash__(self) -> int:
+        CountingKey.hash_calls += 1
+        return hash(self.name)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CountingKey) and self.name == other.name
+
+
+class TestHashMapSingleProbe:
+    @pytest.fixture(autouse=True)
+    def reset_counter(self):
+        CountingKey.hash_calls = 0
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda hash_map, key: hash_map.__getitem__(key),
+            lambda hash_map, key: hash_map.__setitem__(key, 1),
+            lambda hash_map, key: hash_map.get(key),
+            lambda hash_map, key: hash_map.update(key, 1),
+            lambda hash_map, key: hash_map.setdefault(key, 1),
+            lambda hash_map, key: hash_map.get_or_insert(key, lambda: 1),
+            lambda hash_map, key: hash_map.pop(key),
+            lambda hash_map, key: hash_map.remove(key),
+        ],
+    )
+    def test_existing_key_hashed_once(self, operation):
+        hash_map = HashMap()
+        key = CountingKey("a")
+        hash_map.put(key, 0)
+        CountingKey.hash_calls = 0
+
+        operation(hash_map, key)
+        assert CountingKey.hash_calls == 1
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda hash_map, key: hash_map.put(key, 1),
+            lambda hash_map, key: hash_map.__setitem__(key, 1),
+            lambda hash_map, key: hash_map.setdefault(key, 1),
+            lambda hash_map, key: hash_map.get_or_insert(key, lambda: 1),
+        ],
+    )
+    def test_new_key_hashed_once(self, operation):
+        hash_map = HashMap()
+        operation(hash_map, CountingKey("a"))
+        assert CountingKey.hash_calls == 1
+        assert hash_map.get(CountingKey("a")) == 1
+
+    def test_setdefault(self):
+        hash_map = HashMap()
+        assert hash_map.setdefault("a", 1) == 1
+        assert hash_map.setdefault("a", 2) == 1
+        assert hash_map.setdefault("b") is None
+        assert hash_map.length == 2
+
+    def test_get_or_insert(self):
+        hash_map = HashMap()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return []
+
+        first = hash_map.get_or_insert("a", factory)
+        first.append(5)
+        assert hash_map.get_or_insert("a", factory) == [5]
+        assert len(calls) == 1
+
+    def test_pop(self):
+        hash_map = HashMap()
+        hash_map.put("a", 1)
+
+        assert hash_map.pop("a") == 1
+        assert hash_map.length == 0
+        assert hash_map.pop("a", None) is None
+        assert hash_map.pop("a", 5) == 5
+        with pytest.raises(KeyError, match="Key: a does not exist!"):
+            hash_map.pop("a")
+
+    def test_resize_does_not_rehash_keys(self):
+        hash_map = HashMap()
+        keys = [CountingKey(str(i)) for i in range(100)]
+        for key in keys:
+            hash_map.put(key, 0)
+        first_entry = hash_map._find(keys[0], hash(keys[0]))
+        first_entry = first_entry[0][first_entry[1]]
+        CountingKey.hash_calls = 0
+
+        for i in range(100, 1000):
+            hash_map.put(CountingKey(str(i)), 0)
+
+        assert hash_map.allocation_stats.resizes > 0
+        assert CountingKey.hash_calls == 900
+        # entries are moved to the new buckets, not copied
+        bucket, pos = hash_map._find(keys[0], hash(keys[0]))
+        assert bucket[pos] is first_entry
+
+
+class TestHashMapIncrementalResize:
+    def test_resize_keeps_old_table(self):
+        hash_map = HashMap(incremental_resize=True)
+        for i in range(8):
+            hash_map.put(i, i)
+
+        assert hash_map.capacity == 20
+        assert hash_map._old_container is not None
+        assert hash_map._rehash_idx == 0
+
+    def test_lookups_consult_both_tables(self):
+        hash_map = HashMap(incremental_resize=True)
+        for i in range(8):
+            hash_map.put(i, i)
+
+        for i in range(8):
+            assert hash_map[i] == i
+        assert hash_map.get(8) is None
+        assert hash_map._old_container is None
+
+    def test_each_operation_moves_bounded_buckets(self):
+        hash_map = HashMap(incremental_resize=True)
+        for i in range(8):
+            hash_map.put(i, i)
+
+        hash_map.get(0)
+        assert hash_map._rehash_idx == REHASH_STEP
+        hash_map.get(0)
+        assert hash_map._rehash_idx == 2 * REHASH_STEP
+
+    def test_update_and_remove_during_migration(self):
+        hash_map = HashMap(incremental_resize=True)
+        for i in range(8):
+            hash_map.put(i, i)
+
+        hash_map.update(0, 90)
+        hash_map[1] = 10
+        assert hash_map.remove(2).value == 2
+        assert hash_map.pop(3) == 3
+        with pytest.raises(KeyError):
+            hash_map.put(4, 0)
+
+        assert hash_map.length == 6
+        assert {key: hash_map[key] for key in (0, 1, 4, 5, 6, 7)} == {
+            0: 90, 1: 10, 4: 4, 5: 5, 6: 6, 7: 7}
+
+    def test_str_during_migration(self):
+        hash_map = HashMap(incremental_resize=True)
+        for i in range(8):
+            hash_map.put(i, i)
+
+        assert sorted(str(hash_map)[1:-1].split(", ")) == [f"{i}: {i}" for i in range(8)]
+
+    def test_matches_dict(self):
+        hash_map = HashMap(incremental_resize=True)
+        model = {}
+        for i in range(3000):
+            key = (i * 7919) % 1000
+            if i % 3 == 2:
+                assert hash_map.pop(key, None) == model.pop(key, None)
+            else:
+                hash_map[key] = i
+                model[key] = i
+
+        assert hash_map.length == len(model)
+        for key in range(1000):
+            assert hash_map.get(key) == model.get(key)
+
+    def test_shrink_never_finishes_migration(self, monkeypatch):
+        hash_map = HashMap(incremental_resize=True)
+        for i in range(5000):
+            hash_map.put(i, i)
+
+        def finish_rehash():
+            raise AssertionError("a removal migrated the whole old table")
+
+        monkeypatch.setattr(hash_map, "_finish_rehash", finish_rehash)
+        for i in range(5000):
+            assert hash_map.pop(i) == i
+
+        assert hash_map.length == 0
+        assert hash_map.allocation_stats.resizes > 10
+
+
+class TestHashMapSizing:
+    @pytest.mark.parametrize(
+        "expected_size, load_factor, expected_capacity",
+        [(0, 0.7, 10), (5, 0.7, 10), (100, 0.5, 200), (1000, 0.7, 1429), (64, 1.0, 64)],
+    )
+    def test_expected_size_capacity(self, expected_size, load_factor, expected_capacity):
+        hash_map = HashMap(expected_size=expected_size, load_factor=load_factor)
+        assert hash_map.capacity == expected_capacity
+        assert hash_map.load_factor == load_factor
+
+    @pytest.mark.parametrize("expected_size, load_factor", [(100, 0.7), (1000, 0.5), (800, 2.0)])
+    def test_presized_build_does_not_resize(self, expected_size, load_factor):
+        hash_map = HashMap(expected_size=expected_size, load_factor=load_factor)
+        for i in range(expected_size):
+            hash_map.put(i, i)
+
+        assert hash_map._allocation_stats is None
+        hash_map.put(expected_size, 0)
+        assert hash_map.allocation_stats.resizes == 1
+
+    def test_custom_load_factor_triggers_resize(self):
+        hash_map = HashMap(load_factor=0.5)
+        for i in range(5):
+            hash_map.put(i, i)
+        assert hash_map.capacity == 10
+
+        hash_map.put(5, 5)
+        assert hash_map.capacity == 20
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"load_factor": 0}, {"load_factor": -1}, {"expected_size": -1}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            HashMap(**kwargs)
+
+    @pytest.mark.parametrize("incremental_resize", [False, True])
+    def test_presized_never_shrinks(self, incremental_resize):
+        hash_map = HashMap(expected_size=100_000, incremental_resize=incremental_resize)
+        hash_map.put(-1, -1)
+        hash_map.remove(-1)
+        assert hash_map.capacity == hash_map.min_capacity == 142858
+
+        for i in range(100_000):
+            hash_map.put(i, i)
+        for i in range(100_000):
+            hash_map.remove(i)
+
+        assert hash_map.capacity == 142858
+        assert hash_map._allocation_stats is None
+
+    @pytest.mark.parametrize("incremental_resize", [False, True])
+    def test_shrinks_when_drained(self, incremental_resize):
+        hash_map = HashMap(incremental_resize=incremental_resize)
+        for i in range(1000):
+            hash_map.put(i, i)
+        grown = hash_map.capacity
+
+        for i in range(990):
+            if i % 2:
+                hash_map.remove(i)
+            else:
+                hash_map.pop(i)
+
+        assert hash_map.capacity < grown
+        assert hash_map.length == 10
+        assert hash_map.length / hash_map.capacity >= hash_map.load_factor / SHRINK_RATIO
+        for i in range(990, 1000):
+            assert hash_map[i] == i
+
+    def test_does_not_shrink_below_default_capacity(self):
+        hash_map = HashMap()
+        hash_map.put("a", 1)
+        hash_map.remove("a")
+        assert hash_map.capacity == 10
+
+
+class TestHashMapBatch:
+    @pytest.mark.parametrize("as_generator", [False, True])
+    def test_from_pairs(self, as_generator):
+        pairs = [(f"key{i}", i) for i in range(500)]
+        hash_map = HashMap.from_pairs(iter(pairs) if as_generator else pairs)
+
+        assert hash_map.length == 500
+        assert hash_map._allocation_stats is None
+        assert hash_map.get_many(key for key, _ in pairs) == list(range(500))
+
+    def test_from_pairs_last_value_wins(self):
+        hash_map = HashMap.from_pairs([("a", 1), ("b", 2), ("a", 3)])
+        assert hash_map.length == 2
+        assert hash_map["a"] == 3
+
+    def test_from_pairs_options(self):
+        hash_map = HashMap.from_pairs([(1, 1)], load_factor=0.5, incremental_resize=True)
+        assert hash_map.load_factor == 0.5
+        assert hash_map.incremental_resize
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            {"b": 20, "c": 30},
+            [("b", 20), ("c", 30)],
+            (pair for pair in [("b", 20), ("c", 30)]),
+            HashMap.from_pairs([("b", 20), ("c", 30)]),
+        ],
+    )
+    def test_merge(self, other):
+        hash_map = HashMap.from_pairs([("a", 1), ("b", 2)])
+        hash_map.merge(other)
+
+        assert hash_map.length == 3
+        assert hash_map.get_many(["a", "b", "c"]) == [1, 20, 30]
+
+    def test_merge_resizes_once(self):
+        hash_map = HashMap()
+        hash_map.merge({i: i for i in range(1000)})
+
+        assert hash_map.allocation_stats.resizes == 1
+        assert hash_map.get_many(range(1000)) == list(range(1000))
+
+    def test_merge_self(self):
+        hash_map = HashMap.from_pairs([("a", 1)])
+        hash_map.merge(hash_map)
+        assert hash_map.length == 1
+
+    def test_put_many(self):
+        hash_map = HashMap()
+        hash_map.put_many((i, str(i)) for i in range(100))
+
+        assert hash_map.length == 100
+        assert hash_map.allocation_stats.resizes == 1
+        assert hash_map[42] == "42"
+
+    def test_put_many_existing_key(self):
+        hash_map = HashMap.from_pairs([("b", 0)])
+        with pytest.raises(KeyError, match="Key: b already exists!"):
+            hash_map.put_many([("a", 1), ("b", 2), ("c", 3)])
+
+        assert hash_map.get_many(["a", "b", "c"]) == [1, 0, None]
+
+    def test_get_many_default(self):
+        hash_map = HashMap.from_pairs([("a", 1)])
+        assert hash_map.get_many(["a", "x"], default=0) == [1, 0]
+        assert hash_map.get_many([]) == []
+
+
+class TestHashMapIteration:
+    def test_len_and_contains(self):
+        hash_map = HashMap.from_pairs([("a", 1), ("b", 2)])
+        assert len(hash_map) == 2
+        assert "a" in hash_map
+        assert "c" not in hash_map
+        assert len(HashMap()) == 0
+
+    @pytest.mark.parametrize("incremental_resize", [False, True])
+    def test_keys_values_items(self, incremental_resize):
+        pairs = [(i, i * i) for i in range(100)]
+        hash_map = HashMap(incremental_resize=incremental_resize)
+        hash_map.put_many(pairs)
+
+        assert sorted(hash_map) == list(range(100))
+        assert sorted(hash_map.keys()) == list(range(100))
+        assert sorted(hash_map.values()) == [value for _, value in pairs]
+        assert sorted(hash_map.items()) == pairs
+
+    def test_iterators_are_lazy(self):
+        hash_map = HashMap.from_pairs([("a", 1)])
+        items = hash_map.items()
+        assert not isinstance(items, list)
+        assert next(items) == ("a", 1)
+        with pytest.raises(StopIteration):
+            next(items)
+
+    def test_empty(self):
+        assert list(HashMap().items()) == []
+
+    def test_lookups_during_iteration(self):
+        hash_map = HashMap(incremental_resize=True)
+        for i in range(8):
+            hash_map.put(i, i)
+        assert hash_map._old_container is not None
+
+        seen = []
+        for key in hash_map:
+            hash_map[key] = hash_map[key] + 1
+            seen.append(key)
+
+        assert sorted(seen) == list(range(8))
+        assert sorted(hash_map.values()) == list(range(1, 9))
+
+    @pytest.mark.parametrize(
+        "mutation",
+        [
+            lambda hash_map: hash_map.put("new", 0),
+            lambda hash_map: hash_map.remove("a"),
+            lambda hash_map: hash_map.pop("b"),
+        ],
+    )
+    def test_mutation_during_iteration_raises(self, mutation):
+        hash_map = HashMap.from_pairs([("a", 1), ("b", 2), ("c", 3)])
+        with pytest.raises(RuntimeError, match="HashMap changed size during iteration"):
+            for _ in hash_map.keys():
+                mutation(hash_map)
+
+    def test_str_uses_all_entries(self):
+        hash_map = HashMap.from_pairs([("a", 1), (2, "b")])
+        assert str(hash_map) in ("{'a': 1, 2: 'b'}", "{2: 'b', 'a': 1}")
+
+
+class TestHashMapStats:
+    def test_empty(self):
+        stats = HashMap().stats()
+        assert stats.length == 0
+        assert stats.capacity == 10
+        assert stats.load_factor == 0
+        assert stats.bucket_histogram == {0: 10}
+        assert stats.max_chain == 0
+        assert stats.mean_chain == 0
+        assert stats.resizes == 0
+        assert stats.resize_seconds == 0
+
+    def test_chains(self):
+        hash_map = HashMap()
+        for key in (0, 10, 20, 1, 2):
+            hash_map.put(key, key)
+
+        stats = hash_map.stats()
+        assert stats.load_factor == 0.5
+        assert stats.bucket_histogram == {0: 7, 1: 2, 3: 1}
+        assert stats.max_chain == 3
+        assert stats.mean_chain == 5 / 3
+        assert "max_chain=3" in repr(stats)
+
+    def test_removed_keys_leave_empty_buckets(self):
+        hash_map = HashMap()
+        hash_map.put(1, 1)
+        hash_map.remove(1)
+        assert hash_map.stats().bucket_histogram == {0: 10}
+
+    def test_resizes(self):
+        hash_map = HashMap()
+        for i in range(100):
+            hash_map.put(i, i)
+
+        stats = hash_map.stats()
+        assert stats.resizes == hash_map.allocation_stats.resizes == 4
+        assert stats.resize_seconds > 0
+        assert sum(stats.bucket_histogram.values()) == stats.capacity == 160
+        assert sum(length * count for length, count in stats.bucket_histogram.items()) == 100
+
+    def test_incremental_resize_counts_both_tables(self):
+        hash_map = HashMap(incremental_resize=True)
+        for i in range(8):
+            hash_map.put(i, i)
+
+        stats = hash_map.stats()
+        assert stats.capacity == 30
+        assert sum(length * count for length, count in stats.bucket_histogram.items()) == 8
+
+
+class TestHashMapBloomFilter:
+    def test_disabled_by_default(self):
+        assert HashMap().bloom_filter is None
+
+    def test_sized_for_table(self):
+        hash_map = HashMap(expected_size=1000, bloom_false_positive_rate=0.05)
+        assert hash_map.bloom_filter.counting
+        assert hash_map.bloom_filter.expected_size == 1000
+        assert hash_map.bloom_filter.false_positive_rate == 0.05
+
+    def test_missing_key_skips_bucket(self):
+        plain = HashMap()
+        filtered = HashMap(bloom_false_positive_rate=0.01)
+        for i in range(7):
+            plain.put(i, i)
+            filtered.put(i, i)
+
+        # 10 falls in the bucket of 0
+        assert plain._find(10, hash(10)) == (plain._data_container[0], -1)
+        assert filtered._find(10, hash(10)) == (None, -1)
+        assert filtered.get(10) is None
+        assert 10 not in filtered
+
+    def test_operations_match_dict(self):
+        hash_map = HashMap(bloom_false_positive_rate=0.01)
+        expected = {}
+        for i in range(2000):
+            key = f"key{i % 300}"
+            if i % 3 == 2:
+                assert hash_map.pop(key, None) == expected.pop(key, None)
+            else:
+                hash_map[key] = i
+                expected[key] = i
+
+        assert dict(hash_map.items()) == expected
+        assert all(hash_map.get(f"key{i}") == expected.get(f"key{i}") for i in range(400))
+        assert len(hash_map.bloom_filter) == len(expected)
+
+    def test_removed_keys_leave_filter(self):
+        hash_map = HashMap(bloom_false_positive_rate=0.01)
+        hash_map.put("a", 1)
+        hash_map.remove("a")
+
+        assert not hash_map.bloom_filter.contains_hash(hash("a"))
+
+    def test_rebuilt_when_table_grows(self):
+        hash_map = HashMap(bloom_false_positive_rate=0.01)
+        for i in range(10_000):
+            hash_map.put(f"key{i}", i)
+
+        bloom_filter = hash_map.bloom_filter
+        assert bloom_filter.expected_size >= 10_000
+        assert len(bloom_filter) == 10_000
+        assert all(f"key{i}" in hash_map for i in range(10_000))
+        assert sum(f"missing{i}" in bloom_filter for i in range(10_000)) < 200
+
+    def test_incremental_resize_keeps_filter(self):
+        hash_map = HashMap(
+            expected_size=100, incremental_resize=True, bloom_false_positive_rate=0.01)
+        bloom_filter = hash_map.bloom_filter
+        for i in range(500):
+            hash_map.put(i, i)
+
+        assert hash_map.bloom_filter is bloom_filter
+        assert all(hash_map[i] == i for i in range(500))
+
+    @pytest.mark.parametrize("build", ["from_pairs", "merge", "put_many"])
+    def test_batch_operations(self, build):
+        pairs = [(i, -i) for i in range(100)]
+        if build == "from_pairs":
+            hash_map = HashMap.from_pairs(pairs, bloom_false_positive_rate=0.01)
+        else:
+            hash_map = HashMap(bloom_false_positive_rate=0.01)
+            getattr(hash_map, build)(pairs)
+
+        assert len(hash_map.bloom_filter) == 100
+        assert hash_map.get_many([0, 99, 100]) == [0, -99, None]
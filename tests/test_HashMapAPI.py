@@ -0,0 +1,76 @@
+import pytest
+
+from src.data_structures.CompactHashMap import CompactHashMap
+from src.data_structures.CuckooHashMap import CuckooHashMap
+from src.data_structures.OpenAddressingHashMap import OpenAddressingHashMap
+from tests.conftest import CollidingKey
+
+# Initial capacity of each hash map sharing the HashMap API
+INITIAL_CAPACITY = {
+    OpenAddressingHashMap: 16,
+    CompactHashMap: 8,
+    CuckooHashMap: 32,
+}
+
+
+@pytest.fixture(params=list(INITIAL_CAPACITY), ids=lambda cls: cls.__name__)
+def map_class(request):
+    return request.param
+
+
+class TestHashMapAPI:
+    """Test cases shared by the hash maps with the same API as HashMap"""
+
+    def test_init(self, map_class):
+        hash_map = map_class()
+        assert hash_map.length == 0
+        assert hash_map.capacity == INITIAL_CAPACITY[map_class]
+        assert len(hash_map) == 0
+        assert str(hash_map) == "{}"
+
+    @pytest.mark.parametrize(
+        "items",
+        [
+            [("a", 1), ("b", 2), ("c", 3)],
+            [(0, 100), (1, 200), (9, 300), (17, 400), (33, 500), (-1, 600)],
+            [(CollidingKey("x"), 1), (CollidingKey("y"), 2), (CollidingKey("z"), 3)],
+        ],
+    )
+    def test_put_get(self, map_class, items):
+        hash_map = map_class()
+        for key, value in items:
+            hash_map.put(key, value)
+
+        assert hash_map.length == len(items)
+        for key, value in items:
+            assert hash_map.get(key) == value
+            assert hash_map[key] == value
+            assert key in hash_map
+
+    def test_put_duplicate_key_raises_error(self, map_class):
+        hash_map = map_class()
+        hash_map.put("key1", "value1")
+        with pytest.raises(KeyError, match="Key: key1 already exists!"):
+            hash_map.put("key1", "value2")
+
+    def test_missing_key(self, map_class):
+        hash_map = map_class()
+        hash_map.put("key1", "value1")
+        assert hash_map.get("key2") is None
+        assert "key2" not in hash_map
+        with pytest.raises(KeyError, match="Key: key2 does not exist!"):
+            _ = hash_map["key2"]
+        with pytest.raises(KeyError, match="Key: key2 does not exist!"):
+            hash_map.update("key2", 0)
+
+    def test_update_and_setitem(self, map_class):
+        hash_map = map_class()
+        hash_map.put("key1", "value1")
+        hash_map.update("key1", "value2")
+        assert hash_map.get("key1") == "value2"
+
+        hash_map["a"] = 1
+        hash_map["a"] = 2
+        hash_map["b"] = 3
+        assert hash_map["a"] == 2
+        assert hash_map.length == 3
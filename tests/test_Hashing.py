@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from src.data_structures.Hashing import (FIBONACCI, MASK_64, fibonacci_mix,
+                                         fibonacci_slot, rebuilt_capacity)
+
+
+class TestHashing:
+    @pytest.mark.parametrize("key_hash", [0, 1, 12345, -1, -(2**63), 2**64 + 7])
+    def test_mix_wraps_like_uint64(self, key_hash):
+        expected = np.array([key_hash & MASK_64], dtype=np.uint64) * np.uint64(FIBONACCI)
+        assert fibonacci_mix(key_hash) == int(expected[0])
+
+    def test_slot_spreads_consecutive_hashes(self):
+        slots = {fibonacci_slot(key_hash * 16, 4) for key_hash in range(16)}
+        assert len(slots) > 8
+        assert all(0 <= slot < 16 for slot in slots)
+
+    @pytest.mark.parametrize(
+        "length, capacity, expected_capacity",
+        [(5, 16, 16), (6, 16, 32), (0, 8, 8), (11, 16, 32)],
+    )
+    def test_rebuilt_capacity(self, length, capacity, expected_capacity):
+        assert rebuilt_capacity(length, capacity, 0.7) == expected_capacity
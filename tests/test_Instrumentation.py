@@ -0,0 +1,98 @@
+import pytest
+
+from src.data_structures.ArrayList import ArrayList
+from src.data_structures.HashMap import HashMap
+from src.data_structures.Instrumentation import (AllocationStats,
+                                                 register_hook,
+                                                 unregister_hook)
+from src.data_structures.RingBuffer import RingBuffer
+
+
+@pytest.fixture
+def resize_events():
+    events = []
+
+    def hook(owner, old_capacity, new_capacity, elements_copied, bytes_allocated):
+        events.append((type(owner).__name__, old_capacity, new_capacity, elements_copied))
+        assert bytes_allocated > 0
+
+    register_hook(hook)
+    yield events
+    unregister_hook(hook)
+
+
+class TestAllocationStats:
+    def test_record(self):
+        stats = AllocationStats()
+        stats.record(8, 4, 100)
+        stats.record(4, 2, 50)
+
+        assert stats.resizes == 2
+        assert stats.elements_copied == 6
+        assert stats.bytes_allocated == 150
+        assert stats.peak_capacity == 8
+
+    def test_resize_seconds(self):
+        stats = AllocationStats()
+        stats.record(8, 4, 100, 0.5)
+        stats.record(16, 8, 200)
+
+        assert stats.resize_seconds == 0.5
+        assert "resize_seconds=0.500000" in repr(stats)
+
+    def test_no_resize(self):
+        array_list = ArrayList([1, 2])
+        assert array_list._allocation_stats is None
+        assert array_list.allocation_stats.resizes == 0
+
+    def test_array_list(self):
+        array_list = ArrayList()
+        for item in range(9):
+            array_list.push(item)
+
+        stats = array_list.allocation_stats
+        assert stats.resizes == 2
+        assert stats.elements_copied == 4 + 8
+        assert stats.peak_capacity == 16
+        assert stats.bytes_allocated > 0
+
+    def test_ring_buffer(self):
+        buffer = RingBuffer()
+        for item in range(5):
+            buffer.push(item)
+
+        assert buffer.allocation_stats.resizes == 1
+        assert buffer.allocation_stats.elements_copied == 4
+        assert buffer.allocation_stats.peak_capacity == 8
+
+    def test_hash_map(self):
+        hash_map = HashMap()
+        for item in range(8):
+            hash_map.put(item, item)
+
+        assert hash_map.allocation_stats.resizes == 1
+        assert hash_map.allocation_stats.elements_copied == 7
+        assert hash_map.allocation_stats.peak_capacity == 20
+
+
+class TestHooks:
+    def test_hook_called(self, resize_events):
+        array_list = ArrayList()
+        array_list.extend(range(5))
+        buffer = RingBuffer([1])
+        buffer.reserve(10)
+
+        assert resize_events == [("ArrayList", 4, 8, 0), ("RingBuffer", 4, 10, 1)]
+
+    def test_unregister(self, resize_events):
+        hook_events = []
+
+        def hook(*args):
+            hook_events.append(args)
+
+        register_hook(hook)
+        unregister_hook(hook)
+        ArrayList().extend(range(5))
+
+        assert not hook_events
+        assert len(resize_events) == 1
@@ -0,0 +1,150 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from src.data_structures.IntHashMap import IntHashMap
+
+
+class TestIntHashMap:
+    def test_init(self):
+        hash_map = IntHashMap()
+        assert hash_map.length == 0
+        assert hash_map.capacity == 16
+        assert hash_map.dtype == np.int64
+        assert str(hash_map) == "{}"
+
+    @pytest.mark.parametrize("keys", [[1, 2, 3], [0, -1, 2**62, -(2**63)], [16, 32, 48, 64]])
+    def test_put_get(self, keys):
+        hash_map = IntHashMap()
+        for key in keys:
+            hash_map.put(key, key % 1000)
+
+        assert hash_map.length == len(keys)
+        for key in keys:
+            assert hash_map[key] == key % 1000
+            assert hash_map.get(key) == key % 1000
+            assert key in hash_map
+        assert isinstance(hash_map[keys[0]], int)
+
+    def test_float_values(self):
+        hash_map = IntHashMap(dtype="float64")
+        hash_map[1] = 0.5
+        assert hash_map[1] == 0.5
+        assert isinstance(hash_map[1], float)
+
+    def test_numpy_integer_keys(self):
+        hash_map = IntHashMap()
+        hash_map[np.int64(5)] = 1
+        assert hash_map[5] == 1
+
+    def test_non_integer_key(self):
+        with pytest.raises(TypeError):
+            IntHashMap()[1.5] = 1
+
+    def test_missing_and_existing_keys(self):
+        hash_map = IntHashMap()
+        hash_map.put(1, 1)
+        assert hash_map.get(2) is None
+        assert 2 not in hash_map
+        with pytest.raises(KeyError, match="Key: 1 already exists!"):
+            hash_map.put(1, 2)
+        with pytest.raises(KeyError, match="Key: 2 does not exist!"):
+            _ = hash_map[2]
+        with pytest.raises(KeyError, match="Key: 2 does not exist!"):
+            hash_map.update(2, 0)
+
+    def test_update_remove_pop(self):
+        hash_map = IntHashMap()
+        hash_map[1] = 10
+        hash_map[1] = 11
+        hash_map.update(1, 12)
+        hash_map[2] = 20
+
+        kv_pair = hash_map.remove(1)
+        assert (kv_pair.key, kv_pair.value) == (1, 12)
+        assert hash_map.remove(1) is None
+        assert hash_map.pop(2) == 20
+        assert hash_map.pop(2, None) is None
+        with pytest.raises(KeyError, match="Key: 2 does not exist!"):
+            hash_map.pop(2)
+        assert hash_map.length == 0
+
+    def test_iteration(self):
+        hash_map = IntHashMap()
+        for key in range(100):
+            hash_map[key] = -key
+
+        assert sorted(hash_map) == list(range(100))
+        assert sorted(hash_map.keys().tolist()) == list(range(100))
+        assert sorted(hash_map.values().tolist()) == sorted(-key for key in range(100))
+        assert sorted(hash_map.items()) == [(key, -key) for key in range(100)]
+        assert isinstance(hash_map.keys(), np.ndarray)
+
+    def test_get_many(self):
+        hash_map = IntHashMap()
+        for key in range(0, 100, 2):
+            hash_map[key] = key * 10
+
+        keys = np.arange(100)
+        expected = np.where(keys % 2 == 0, keys * 10, -1)
+        np.testing.assert_array_equal(hash_map.get_many(keys, default=-1), expected)
+        np.testing.assert_array_equal(hash_map.contains_many(keys), keys % 2 == 0)
+        assert hash_map.get_many([]).size == 0
+
+    def test_put_many(self):
+        hash_map = IntHashMap(dtype="float64")
+        hash_map[-1] = 0.0
+        keys = np.arange(10_000) * 7919
+        hash_map.put_many(keys, keys / 2)
+
+        assert hash_map.length == 10_001
+        assert hash_map.allocation_stats.resizes == 1
+        np.testing.assert_array_equal(hash_map.get_many(keys), keys / 2)
+        assert hash_map[-1] == 0.0
+
+    def test_put_many_rejects_existing_or_repeated_keys(self):
+        hash_map = IntHashMap()
+        hash_map[3] = 3
+        with pytest.raises(KeyError, match="Key: 3 already exists!"):
+            hash_map.put_many([1, 2, 3], [1, 2, 3])
+        with pytest.raises(KeyError, match="Key: 5 is repeated!"):
+            hash_map.put_many([4, 5, 5], [1, 2, 3])
+        with pytest.raises(ValueError):
+            hash_map.put_many([4, 5], [1])
+
+        assert hash_map.length == 1
+        assert 1 not in hash_map
+
+    def test_put_many_reuses_tombstones(self):
+        hash_map = IntHashMap()
+        hash_map.put_many(np.arange(4), np.arange(4))
+        for key in range(4):
+            hash_map.remove(key)
+        hash_map.put_many(np.arange(4), np.arange(4) + 1)
+
+        assert hash_map.capacity == 16
+        assert hash_map._used == 4
+        np.testing.assert_array_equal(hash_map.get_many(np.arange(4)), np.arange(4) + 1)
+
+    def test_scalar_and_vectorized_hashing_agree(self):
+        hash_map = IntHashMap()
+        keys = np.array([0, 1, -1, 2**63 - 1, -(2**63), 123456789])
+        np.testing.assert_array_equal(
+            hash_map._slots_of(keys), [hash_map._slot_of(int(key)) for key in keys])
+
+    def test_matches_dict(self):
+        hash_map = IntHashMap()
+        model = {}
+        for i in range(3000):
+            key = (i * 7919) % 500 - 250
+            if i % 3 == 2:
+                assert hash_map.pop(key, None) == model.pop(key, None)
+            else:
+                hash_map[key] = i
+                model[key] = i
+
+        assert sorted(hash_map.items()) == sorted(model.items())
+        keys = np.arange(-300, 300)
+        np.testing.assert_array_equal(
+            hash_map.get_many(keys, default=-1), [model.get(int(key), -1) for key in keys])
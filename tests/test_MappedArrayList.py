@@ -0,0 +1,152 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.data_structures.MappedArrayList import HEADER_SIZE, MappedArrayList
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_and_crash(code: str) -> None:
+    # run code in a new interpreter that exits without closing or flushing anything
+    script = "import os\nfrom src.data_structures.MappedArrayList import MappedArrayList\n"
+    script += textwrap.dedent(code) + "\nos._exit(0)\n"
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True)
+
+
+class TestMappedArrayList:
+    def test_init_new_file(self, tmp_path):
+        path = tmp_path / "log.bin"
+        with MappedArrayList(path, typecode="q") as array_list:
+            assert array_list.length == 0
+            assert array_list.capacity == 4
+            assert array_list.typecode == "q"
+
+        assert path.stat().st_size == HEADER_SIZE + 4 * 8
+
+    def test_push_grows_file(self, tmp_path):
+        path = tmp_path / "log.bin"
+        with MappedArrayList(path, typecode="d") as array_list:
+            for item in range(9):
+                array_list.push(item * 1.5)
+
+            assert array_list.capacity == 16
+            assert array_list[-1] == 12.0
+            assert path.stat().st_size == HEADER_SIZE + 16 * 8
+
+    def test_reopen(self, tmp_path):
+        path = tmp_path / "log.bin"
+        with MappedArrayList(path, typecode="q") as array_list:
+            array_list.extend(range(100))
+            array_list.deque()
+            array_list.enqueue(-1)
+
+        with MappedArrayList(path) as array_list:
+            assert array_list.typecode == "q"
+            assert array_list.length == 100
+            assert array_list[0] == -1
+            assert array_list._get_array() == [-1] + list(range(1, 100))
+
+    def test_list_operations(self, tmp_path):
+        with MappedArrayList(tmp_path / "log.bin", typecode="i") as array_list:
+            array_list.extend([0, 1, 2, 3, 4, 5])
+            array_list.put(2, 9)
+            removed = array_list.remove_range(0, 2)
+
+            assert removed._get_array() == [0, 1]
+            assert array_list.remove(0) == 9
+            assert array_list.pop() == 5
+            assert array_list._get_array() == [2, 3, 4]
+            assert list(array_list.view(1)) == [3, 4]
+
+    def test_shrink_to_fit(self, tmp_path):
+        path = tmp_path / "log.bin"
+        with MappedArrayList(path, typecode="d") as array_list:
+            array_list.extend(range(10))
+            array_list.shrink_to_fit()
+
+            assert array_list.capacity == 10
+            assert path.stat().st_size == HEADER_SIZE + 10 * 8
+            assert array_list._get_array() == [float(item) for item in range(10)]
+
+    @pytest.mark.parametrize(
+        "patched, operation, expected_items",
+        [
+            # killed after the new length is set, before the pushed item is written
+            ("MappedArrayList.shift_forward", "push(4)", [1, 2, 3]),
+            ("MappedArrayList._move_items", "enqueue(0)", [1, 2, 3]),
+            # killed after the removal is published, before the vacated slot is cleared
+            ("ArrayList._clear", "pop()", [1, 2]),
+            ("ArrayList._clear", "deque()", [2, 3]),
+        ],
+    )
+    def test_process_exit_inside_operation(self, tmp_path, patched, operation, expected_items):
+        path = tmp_path / "log.bin"
+        _run_and_crash(f"""
+            from src.data_structures.ArrayList import ArrayList
+            array_list = MappedArrayList({str(path)!r}, typecode="q")
+            array_list.reserve(8)
+            array_list.extend(range(4))
+            array_list.deque()
+            {patched} = lambda *args: os._exit(0)
+            array_list.{operation}
+        """)
+
+        with MappedArrayList(path) as array_list:
+            assert array_list._get_array() == expected_items
+
+    def test_resize_with_live_view(self, tmp_path):
+        path = tmp_path / "log.bin"
+        with MappedArrayList(path, typecode="q") as array_list:
+            array_list.extend(range(4))
+            view = array_list.view(1, 3)
+            with pytest.raises(BufferError):
+                array_list.push(4)
+            with pytest.raises(BufferError):
+                array_list.close()
+
+            # the list stays usable and the view still shares its storage
+            array_list[1] = 10
+            assert list(view) == [10, 2]
+            for _ in range(3):
+                array_list.pop()
+            assert array_list._get_array() == [0]
+
+            del view
+            array_list.extend(range(1, 9))
+            assert array_list._get_array() == list(range(9))
+
+        with MappedArrayList(path) as array_list:
+            assert array_list._get_array() == list(range(9))
+
+    def test_typecode_mismatch(self, tmp_path):
+        path = tmp_path / "log.bin"
+        MappedArrayList(path, typecode="d").close()
+        with pytest.raises(ValueError):
+            MappedArrayList(path, typecode="i")
+
+    def test_not_a_mapped_file(self, tmp_path):
+        path = tmp_path / "log.bin"
+        path.write_bytes(b"x" * 100)
+        with pytest.raises(ValueError):
+            MappedArrayList(path)
+
+    def test_survives_process_exit(self, tmp_path):
+        path = tmp_path / "log.bin"
+        _run_and_crash(f"""
+            array_list = MappedArrayList({str(path)!r}, typecode="q")
+            array_list.extend(range(10))
+            array_list.flush()
+            for _ in range(6):
+                array_list.deque()
+            for item in range(10, 13):
+                array_list.push(item)
+        """)
+
+        with MappedArrayList(path) as array_list:
+            assert array_list._get_array() == list(range(6, 13))
+            array_list.enqueue(5)
+            assert array_list._get_array() == list(range(5, 13))
@@ -0,0 +1,176 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.data_structures.MappedHashMap import (DEFAULT_CAPACITY, HEADER_SIZE,
+                                               SLOT, MappedHashMap)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_and_crash(code: str) -> None:
+    # run code in a new interpreter that exits without closing or flushing anything
+    script = "import os\nfrom src.data_structures.MappedHashMap import MappedHashMap\n"
+    script += textwrap.dedent(code) + "\nos._exit(0)\n"
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True)
+
+
+class TestMappedHashMap:
+    def test_init_new_file(self, tmp_path):
+        path = tmp_path / "table.db"
+        with MappedHashMap(path) as hash_map:
+            assert hash_map.length == 0
+            assert hash_map.capacity == DEFAULT_CAPACITY
+            assert str(hash_map) == "{}"
+
+        assert path.stat().st_size == HEADER_SIZE + DEFAULT_CAPACITY * SLOT.size
+        assert (tmp_path / "table.db.heap").exists()
+
+    def test_put_get(self, tmp_path):
+        with MappedHashMap(tmp_path / "table.db") as hash_map:
+            hash_map.put("a", "1")
+            hash_map[b"a"] = b"2"
+            hash_map["long"] = "x" * 10_000
+
+            assert hash_map.length == 3
+            assert hash_map["a"] == "1"
+            assert hash_map[b"a"] == b"2"
+            assert hash_map.get("long") == "x" * 10_000
+            assert "a" in hash_map
+            assert "b" not in hash_map
+
+    def test_missing_and_existing_keys(self, tmp_path):
+        with MappedHashMap(tmp_path / "table.db") as hash_map:
+            hash_map.put("a", "1")
+            assert hash_map.get("b") is None
+            with pytest.raises(KeyError, match="Key: a already exists!"):
+                hash_map.put("a", "2")
+            with pytest.raises(KeyError, match="Key: b does not exist!"):
+                _ = hash_map["b"]
+            with pytest.raises(KeyError, match="Key: b does not exist!"):
+                hash_map.update("b", "2")
+
+    @pytest.mark.parametrize("item", [1, 1.5, None, ["a"]])
+    def test_unsupported_types(self, tmp_path, item):
+        with MappedHashMap(tmp_path / "table.db") as hash_map:
+            with pytest.raises(TypeError):
+                hash_map[item] = "value"
+            with pytest.raises(TypeError):
+                hash_map["key"] = item
+
+    def test_update_remove_pop(self, tmp_path):
+        with MappedHashMap(tmp_path / "table.db") as hash_map:
+            hash_map["a"] = "1"
+            hash_map["a"] = "2"
+            hash_map.update("a", "3")
+            hash_map["b"] = "4"
+
+            kv_pair = hash_map.remove("a")
+            assert (kv_pair.key, kv_pair.value) == ("a", "3")
+            assert hash_map.remove("a") is None
+            assert hash_map.pop("b") == "4"
+            assert hash_map.pop("b", None) is None
+            with pytest.raises(KeyError, match="Key: b does not exist!"):
+                hash_map.pop("b")
+            assert hash_map.length == 0
+
+    def test_grows_and_reopens(self, tmp_path):
+        path = tmp_path / "table.db"
+        with MappedHashMap(path) as hash_map:
+            for i in range(1000):
+                hash_map[f"key{i}"] = f"value{i}"
+            for i in range(0, 1000, 2):
+                hash_map.remove(f"key{i}")
+
+            assert hash_map.allocation_stats.resizes > 0
+            capacity = hash_map.capacity
+
+        assert not (tmp_path / "table.db.resize").exists()
+        with MappedHashMap(path) as hash_map:
+            assert hash_map.length == 500
+            assert hash_map.capacity == capacity
+            assert dict(hash_map.items()) == {
+                f"key{i}": f"value{i}" for i in range(1, 1000, 2)}
+            hash_map["key0"] = "again"
+            assert hash_map["key0"] == "again"
+
+    def test_iteration(self, tmp_path):
+        with MappedHashMap(tmp_path / "table.db") as hash_map:
+            for i in range(50):
+                hash_map[str(i)] = str(-i)
+
+            assert sorted(hash_map) == sorted(str(i) for i in range(50))
+            assert sorted(hash_map.values()) == sorted(str(-i) for i in range(50))
+
+            with pytest.raises(RuntimeError, match="MappedHashMap changed size during iteration"):
+                for key in hash_map.keys():
+                    hash_map.remove(key)
+
+    def test_readonly(self, tmp_path):
+        path = tmp_path / "table.db"
+        with MappedHashMap(path) as hash_map:
+            hash_map["a"] = "1"
+
+        with MappedHashMap(path, readonly=True) as hash_map:
+            assert hash_map["a"] == "1"
+            with pytest.raises(PermissionError):
+                hash_map["b"] = "2"
+            with pytest.raises(PermissionError):
+                hash_map.remove("a")
+
+    def test_readonly_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            MappedHashMap(tmp_path / "missing.db", readonly=True)
+
+    def test_concurrent_reader(self, tmp_path):
+        path = tmp_path / "table.db"
+        with MappedHashMap(path) as writer:
+            writer["first"] = "1"
+            writer.flush()
+            reader = MappedHashMap(path, readonly=True)
+            assert len(reader) == 1
+
+            # growing the heap is picked up by the reader on demand
+            writer["large"] = "x" * 100_000
+            assert reader["large"] == "x" * 100_000
+
+            # a resized table is picked up after refresh()
+            for i in range(200):
+                writer[str(i)] = str(i)
+            writer.flush()
+            reader.refresh()
+            assert len(reader) == 202
+            assert reader["199"] == "199"
+            reader.close()
+
+    def test_not_a_map_file(self, tmp_path):
+        path = tmp_path / "table.db"
+        path.write_bytes(b"\0" * 128)
+        (tmp_path / "table.db.heap").write_bytes(b"\0" * 128)
+        with pytest.raises(ValueError, match="is not a MappedHashMap file"):
+            MappedHashMap(path)
+
+    def test_survives_process_exit(self, tmp_path):
+        path = tmp_path / "table.db"
+        _run_and_crash(f"""
+            hash_map = MappedHashMap({str(path)!r})
+            hash_map["a"] = "1"
+            hash_map.flush()
+            hash_map["b"] = "2"
+            hash_map["c"] = "3"
+            hash_map.remove("a")
+            for i in range(100):
+                hash_map[f"key{{i}}"] = str(i)
+        """)
+
+        with MappedHashMap(path) as hash_map:
+            assert len(hash_map) == 102
+            hash_map["zzzzzzzz"] = "4"
+            assert hash_map["b"] == "2"
+            assert hash_map["c"] == "3"
+            assert "a" not in hash_map
+            assert dict(hash_map.items()) == {
+                "b": "2", "c": "3", "zzzzzzzz": "4", **{f"key{i}": str(i) for i in range(100)}}
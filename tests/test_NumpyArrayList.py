@@ -0,0 +1,96 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from src.data_structures.NumpyArrayList import NumpyArrayList
+
+
+class TestNumpyArrayList:
+    @pytest.mark.parametrize(
+        "array_list_init, dtype, expected_length, expected_capacity, expected_dtype",
+        [
+            (None, None, 0, 4, "float64"),
+            (1.5, None, 1, 4, "float64"),
+            ([1, 2, 3], "int64", 3, 3, "int64"),
+            (np.arange(5, dtype="int32"), None, 5, 5, "int32"),
+        ],
+    )
+    def test_init(self, array_list_init, dtype, expected_length, expected_capacity, expected_dtype):
+        array_list = NumpyArrayList(array_list_init, dtype=dtype)
+        assert isinstance(array_list._array, np.ndarray)
+        assert array_list.length == expected_length
+        assert array_list.capacity == expected_capacity
+        assert array_list.dtype == np.dtype(expected_dtype)
+
+    def test_init_does_not_alias(self):
+        values = np.arange(3)
+        array_list = NumpyArrayList(values)
+        array_list[0] = 7
+        assert values[0] == 0
+
+    def test_push_grows_by_doubling(self):
+        array_list = NumpyArrayList(dtype="int64")
+        for item in range(9):
+            array_list.push(item)
+
+        assert array_list.capacity == 16
+        assert array_list._get_array() == list(range(9))
+
+    def test_list_operations(self):
+        array_list = NumpyArrayList(list(range(6)), dtype="int64")
+        array_list.put(2, 9)
+        array_list.enqueue(-1)
+        removed = array_list.remove_range(0, 2)
+
+        assert isinstance(removed, NumpyArrayList)
+        assert removed._get_array() == [-1, 0]
+        assert array_list.deque() == 1
+        assert array_list.pop() == 5
+        assert array_list._get_array() == [9, 2, 3, 4]
+
+    def test_values_is_view(self):
+        array_list = NumpyArrayList([1.0, 2.0, 3.0])
+        array_list.values()[1] = 5.0
+        assert array_list[1] == 5.0
+
+    def test_map(self):
+        array_list = NumpyArrayList([1.0, 4.0, 9.0])
+        assert array_list.map(np.sqrt)._get_array() == [1.0, 2.0, 3.0]
+
+    def test_filter(self):
+        array_list = NumpyArrayList(list(range(10)), dtype="int64")
+        assert array_list.filter(lambda values: values % 3 == 0)._get_array() == [0, 3, 6, 9]
+
+    def test_reductions(self):
+        array_list = NumpyArrayList([3, 8, 1, 8], dtype="int64")
+        assert array_list.sum() == 20
+        assert array_list.argmax() == 1
+
+    def test_argmax_empty(self):
+        with pytest.raises(ValueError):
+            NumpyArrayList().argmax()
+
+    @pytest.mark.parametrize(
+        "value, side, expected_index",
+        [(0, "left", 0), (3, "left", 2), (3, "right", 4), (10, "left", 6)],
+    )
+    def test_searchsorted(self, value, side, expected_index):
+        array_list = NumpyArrayList([1, 2, 3, 3, 5, 8], dtype="int64")
+        assert array_list.searchsorted(value, side) == expected_index
+
+    def test_elementwise_arithmetic(self):
+        first = NumpyArrayList([1.0, 2.0, 3.0])
+        second = NumpyArrayList([4.0, 5.0, 6.0])
+
+        assert (first + second)._get_array() == [5.0, 7.0, 9.0]
+        assert (second - first)._get_array() == [3.0, 3.0, 3.0]
+        assert (first * 2)._get_array() == [2.0, 4.0, 6.0]
+        assert (2 * first)._get_array() == [2.0, 4.0, 6.0]
+        assert (10 - first)._get_array() == [9.0, 8.0, 7.0]
+        assert (second / 2)._get_array() == [2.0, 2.5, 3.0]
+        assert (-first)._get_array() == [-1.0, -2.0, -3.0]
+
+    def test_elementwise_length_mismatch(self):
+        with pytest.raises(ValueError):
+            _ = NumpyArrayList([1.0, 2.0]) + NumpyArrayList([1.0])
@@ -0,0 +1,84 @@
+from src.data_structures.Hashing import fibonacci_slot
+from src.data_structures.OpenAddressingHashMap import (_DELETED, _EMPTY,
+                                                       OpenAddressingHashMap)
+from tests.conftest import CollidingKey
+
+
+class TestOpenAddressingHashMap:
+    def test_remove(self):
+        hash_map = OpenAddressingHashMap()
+        hash_map.put("key1", "value1")
+        removed = hash_map.remove("key1")
+
+        assert removed.value == "value1"
+        assert hash_map.get("key1") is None
+        assert hash_map.length == 0
+        assert hash_map.remove("key1") is None
+
+    def test_remove_keeps_probe_sequence(self):
+        hash_map = OpenAddressingHashMap()
+        keys = [CollidingKey(name) for name in "abcd"]
+        for i, key in enumerate(keys):
+            hash_map.put(key, i)
+
+        hash_map.remove(keys[1])
+        assert hash_map.get(keys[3]) == 3
+        assert CollidingKey("b") not in hash_map
+
+        # the tombstone is reused by the next insert
+        hash_map.put(CollidingKey("e"), 4)
+        assert hash_map._keys[(fibonacci_slot(7, 4) + 1) % 16] == CollidingKey("e")
+
+    def test_reallocate_container(self):
+        hash_map = OpenAddressingHashMap()
+        for i in range(12):
+            hash_map.put(f"key{i}", i)
+
+        assert hash_map.capacity == 32
+        assert hash_map.allocation_stats.resizes == 1
+        for i in range(12):
+            assert hash_map.get(f"key{i}") == i
+
+    def test_tombstones_are_dropped_on_resize(self):
+        hash_map = OpenAddressingHashMap()
+        for i in range(100):
+            hash_map.put(i, i)
+            hash_map.remove(i)
+
+        assert hash_map.length == 0
+        assert hash_map.capacity == 16
+        assert hash_map.allocation_stats.resizes > 0
+
+    def test_aligned_integer_keys(self):
+        # keys sharing their low 20 bits used to fall into a single probe chain
+        hash_map = OpenAddressingHashMap()
+        keys = [i << 20 for i in range(4000)]
+        for key in keys:
+            hash_map[key] = key
+
+        mask = hash_map.capacity - 1
+        longest_probe = max(
+            (slot - fibonacci_slot(hash_map._hashes[slot], hash_map._bits)) & mask
+            for slot, key in enumerate(hash_map._keys)
+            if key is not _EMPTY and key is not _DELETED
+        )
+        assert longest_probe < 32
+        assert all(hash_map[key] == key for key in keys)
+
+    def test_str(self):
+        hash_map = OpenAddressingHashMap()
+        assert str(hash_map) == "{}"
+        hash_map.put("a", 1)
+        hash_map.put(2, "b")
+        hash_map.remove(2)
+        assert str(hash_map) == "{'a': 1}"
+
+    def test_repr(self):
+        hash_map = OpenAddressingHashMap()
+        hash_map.put(1, "one")
+        hash_map.put(2, "two")
+        hash_map.remove(2)
+        output = repr(hash_map)
+        assert f"{fibonacci_slot(1, 4):03} -> 1: 'one'" in output
+        assert f"{fibonacci_slot(2, 4):03} -> <deleted>" in output
+        assert "015 ->" in output
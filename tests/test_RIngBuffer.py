@@ -1,5 +1,6 @@
 import pytest
 
+from src.data_structures.GrowthPolicy import GrowthPolicy
 from src.data_structures.RingBuffer import RingBuffer
 
 
@@ -153,3 +154,47 @@ class TestRingBuffer:
         assert buffer.head == 5
         assert buffer.tail == 4
         assert buffer.get_array() == list(range(5, 21))
+
+    def test_shrink_on_deque(self):
+        buffer = RingBuffer(growth_policy=GrowthPolicy(min_capacity=4))
+        for i in range(64):
+            buffer.push(i)
+        for _ in range(50):
+            buffer.deque()
+
+        assert buffer.capacity == 30
+        assert buffer.head == 1
+        assert buffer.get_array() == list(range(50, 64))
+
+    def test_reserve(self):
+        buffer = RingBuffer([1, 2, 3])
+        buffer.reserve(50)
+        for i in range(47):
+            buffer.push(i)
+
+        assert buffer.capacity == 50
+        assert buffer.get_array() == [1, 2, 3] + list(range(47))
+
+    def test_reserve_survives_removals(self):
+        buffer = RingBuffer()
+        buffer.reserve(10_000)
+        buffer.push(1)
+        buffer.pop()
+        assert buffer.capacity == 10_000
+
+        buffer.shrink_to_fit()
+        for i in range(200):
+            buffer.push(i)
+        for _ in range(200):
+            buffer.deque()
+        assert buffer.capacity < 10_000
+
+    def test_shrink_to_fit_wrapped(self):
+        buffer = RingBuffer(list(range(8)))
+        for _ in range(3):
+            buffer.deque()
+        buffer.push(8)
+        buffer.shrink_to_fit()
+
+        assert buffer.capacity == 6
+        assert buffer.get_array() == list(range(3, 9))
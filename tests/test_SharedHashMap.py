@@ -0,0 +1,180 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import pytest
+
+from src.data_structures.SharedHashMap import (DEFAULT_CAPACITY, HEADER_SIZE,
+                                               SLOT_KEY, SLOT_VALUE,
+                                               SharedHashMap)
+
+
+def _lookup(hash_map, keys):
+    return [hash_map[key] for key in keys], len(hash_map), hash_map.readonly
+
+
+@pytest.fixture
+def hash_map():
+    with SharedHashMap(key_size=16, value_size=16) as shared_map:
+        yield shared_map
+
+
+class TestSharedHashMap:
+    def test_init(self, hash_map):
+        assert hash_map.length == 0
+        assert hash_map.capacity == DEFAULT_CAPACITY
+        assert hash_map.slot_size == SLOT_KEY.size + 16 + SLOT_VALUE.size + 16
+        assert str(hash_map) == "{}"
+
+    @pytest.mark.parametrize(
+        "expected_size, capacity", [(0, 16), (8, 16), (9, 32), (1000, 2048)]
+    )
+    def test_expected_size(self, expected_size, capacity):
+        with SharedHashMap(expected_size) as hash_map:
+            assert hash_map.capacity == capacity
+
+    @pytest.mark.parametrize(
+        "args", [{"expected_size": -1}, {"key_size": 4}, {"value_size": 0}]
+    )
+    def test_invalid_arguments(self, args):
+        with pytest.raises(ValueError):
+            SharedHashMap(**args)
+
+    def test_put_get(self, hash_map):
+        hash_map.put(1, 10)
+        hash_map[b"1"] = b"ten"
+        hash_map[-(2**63)] = b""
+
+        assert hash_map.length == 3
+        assert hash_map[1] == 10
+        assert hash_map[b"1"] == b"ten"
+        assert hash_map.get(-(2**63)) == b""
+        assert hash_map.get(2) is None
+        assert 1 in hash_map
+        assert b"2" not in hash_map
+
+    def test_missing_and_existing_keys(self, hash_map):
+        hash_map.put(1, 1)
+        with pytest.raises(KeyError, match="Key: 1 already exists!"):
+            hash_map.put(1, 2)
+        with pytest.raises(KeyError, match="Key: 2 does not exist!"):
+            _ = hash_map[2]
+        with pytest.raises(KeyError, match="Key: 2 does not exist!"):
+            hash_map.update(2, 2)
+
+    @pytest.mark.parametrize("item", ["a", 1.5, None, (1,)])
+    def test_unsupported_types(self, hash_map, item):
+        with pytest.raises(TypeError):
+            hash_map[item] = 1
+        with pytest.raises(TypeError):
+            hash_map[1] = item
+
+    def test_too_long(self, hash_map):
+        with pytest.raises(ValueError):
+            hash_map[b"x" * 17] = 1
+        with pytest.raises(ValueError):
+            hash_map[1] = b"x" * 17
+        with pytest.raises(OverflowError):
+            hash_map[2**63] = 1
+
+    def test_update_remove_pop(self, hash_map):
+        hash_map[1] = b"long value"
+        hash_map[1] = b"short"
+        assert hash_map[1] == b"short"
+        hash_map.update(1, 5)
+        hash_map[2] = 6
+
+        kv_pair = hash_map.remove(1)
+        assert (kv_pair.key, kv_pair.value) == (1, 5)
+        assert hash_map.remove(1) is None
+        assert hash_map.pop(2) == 6
+        assert hash_map.pop(2, None) is None
+        with pytest.raises(KeyError, match="Key: 2 does not exist!"):
+            hash_map.pop(2)
+        assert hash_map.length == 0
+
+    def test_resize_moves_block(self, hash_map):
+        name = hash_map.name
+        for i in range(1000):
+            hash_map[i] = -i
+        for i in range(0, 1000, 2):
+            hash_map.remove(i)
+
+        assert hash_map.name != name
+        assert hash_map.allocation_stats.resizes > 0
+        assert hash_map.length == 500
+        assert dict(hash_map.items()) == {i: -i for i in range(1, 1000, 2)}
+        with pytest.raises(FileNotFoundError):
+            SharedHashMap.attach(name)
+
+    def test_tombstones_reused(self, hash_map):
+        for _ in range(100):
+            hash_map[1] = 1
+            hash_map.remove(1)
+
+        assert hash_map.capacity == DEFAULT_CAPACITY
+
+    def test_from_pairs(self):
+        pairs = [(i, i) for i in range(100)] + [(0, -1)]
+        with SharedHashMap.from_pairs(pairs) as hash_map:
+            assert hash_map.capacity == 256
+            assert hash_map.allocation_stats.resizes == 0
+            assert hash_map[0] == -1
+            assert sorted(hash_map) == list(range(100))
+
+    def test_iteration(self, hash_map):
+        for i in range(50):
+            hash_map[i] = i
+        assert sorted(hash_map.values()) == list(range(50))
+
+        with pytest.raises(RuntimeError, match="SharedHashMap changed size during iteration"):
+            for key in hash_map.keys():
+                hash_map.remove(key)
+
+    def test_attach(self, hash_map):
+        hash_map[1] = b"one"
+        attached = SharedHashMap.attach(hash_map.name)
+
+        assert not attached.owner
+        assert attached.key_size == 16
+        assert attached[1] == b"one"
+
+        # attached readers see the owner's writes in place
+        hash_map[2] = b"two"
+        assert len(attached) == 2
+        assert attached[2] == b"two"
+
+        with pytest.raises(PermissionError):
+            attached[3] = b"three"
+        with pytest.raises(PermissionError):
+            attached.remove(1)
+        with pytest.raises(PermissionError):
+            attached.unlink()
+        attached.close()
+
+    def test_attach_not_a_map(self):
+        block = shared_memory.SharedMemory(create=True, size=HEADER_SIZE)
+        try:
+            with pytest.raises(ValueError, match="is not a SharedHashMap block"):
+                SharedHashMap.attach(block.name)
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_pickle_attaches(self, hash_map):
+        hash_map[1] = 1
+        attached = pickle.loads(pickle.dumps(hash_map))
+
+        assert attached.name == hash_map.name
+        assert attached.readonly
+        assert attached[1] == 1
+        attached.close()
+
+    def test_process_pool(self, hash_map):
+        for i in range(100):
+            hash_map[i] = i * i
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(_lookup, hash_map, [3, 99]).result()
+
+        assert result == ([9, 9801], 100, True)
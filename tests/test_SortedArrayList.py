@@ -0,0 +1,129 @@
+import pytest
+
+from src.data_structures.SortedArrayList import SortedArrayList
+
+
+class TestSortedArrayList:
+    @pytest.mark.parametrize(
+        "items, expected_items",
+        [
+            (None, []),
+            ([], []),
+            ([3, 1, 2], [1, 2, 3]),
+            ((5, 5, 1), [1, 5, 5]),
+            (iter([9, -1, 4]), [-1, 4, 9]),
+        ],
+    )
+    def test_init(self, items, expected_items):
+        sorted_list = SortedArrayList(items)
+        assert list(sorted_list) == expected_items
+        assert len(sorted_list) == len(expected_items)
+
+    @pytest.mark.parametrize(
+        "items, items_to_add, expected_items",
+        [
+            (None, [5, 1, 3, 2, 4], [1, 2, 3, 4, 5]),
+            ([1, 3, 5], [3, 0, 6], [0, 1, 3, 3, 5, 6]),
+            (list(range(10)), [-1] * 3, [-1, -1, -1] + list(range(10))),
+        ],
+    )
+    def test_add(self, items, items_to_add, expected_items):
+        sorted_list = SortedArrayList(items)
+        for item in items_to_add:
+            sorted_list.add(item)
+
+        assert list(sorted_list) == expected_items
+        assert sorted_list[0] == expected_items[0]
+        assert sorted_list[-1] == expected_items[-1]
+
+    def test_update(self):
+        sorted_list = SortedArrayList([4, 1, 7])
+        sorted_list.update(range(0, 10, 3))
+        assert list(sorted_list) == [0, 1, 3, 4, 6, 7, 9]
+
+    @pytest.mark.parametrize(
+        "item, expected_left, expected_right",
+        [(0, 0, 0), (1, 0, 1), (3, 2, 5), (4, 5, 5), (9, 6, 6)],
+    )
+    def test_bisect(self, item, expected_left, expected_right):
+        sorted_list = SortedArrayList([1, 2, 3, 3, 3, 5])
+        assert sorted_list.bisect_left(item) == expected_left
+        assert sorted_list.bisect_right(item) == expected_right
+
+    def test_bisect_after_deque(self):
+        # the search must stay relative to the head of the underlying ArrayList
+        sorted_list = SortedArrayList(range(10))
+        sorted_list.pop(0)
+        sorted_list.pop(0)
+        assert sorted_list.bisect_left(5) == 3
+        assert sorted_list.index_of(2) == 0
+
+    @pytest.mark.parametrize("item, expected_index", [(1, 0), (3, 2), (5, 5)])
+    def test_index_of(self, item, expected_index):
+        sorted_list = SortedArrayList([1, 2, 3, 3, 3, 5])
+        assert sorted_list.index_of(item) == expected_index
+
+    @pytest.mark.parametrize("item", [0, 4, 6])
+    def test_index_of_value_error(self, item):
+        sorted_list = SortedArrayList([1, 2, 3, 3, 3, 5])
+        with pytest.raises(ValueError):
+            sorted_list.index_of(item)
+
+    @pytest.mark.parametrize("item, expected_count", [(0, 0), (1, 1), (3, 3), (6, 0)])
+    def test_count(self, item, expected_count):
+        sorted_list = SortedArrayList([1, 2, 3, 3, 3, 5])
+        assert sorted_list.count(item) == expected_count
+
+    def test_contains(self):
+        sorted_list = SortedArrayList([1, 2, 3, 5])
+        assert 3 in sorted_list
+        assert 4 not in sorted_list
+        assert 6 not in sorted_list
+
+    def test_remove(self):
+        sorted_list = SortedArrayList([3, 1, 2, 2])
+        assert sorted_list.remove(2) == 2
+        assert list(sorted_list) == [1, 2, 3]
+
+        with pytest.raises(ValueError):
+            sorted_list.remove(7)
+
+    def test_pop(self):
+        sorted_list = SortedArrayList([3, 1, 2])
+        assert sorted_list.pop() == 3
+        assert sorted_list.pop(0) == 1
+        assert list(sorted_list) == [2]
+
+    @pytest.mark.parametrize("items, index", [(None, -1), ([1, 2], 2), ([1, 2], -3)])
+    def test_pop_index_error(self, items, index):
+        sorted_list = SortedArrayList(items)
+        with pytest.raises(IndexError):
+            sorted_list.pop(index)
+
+    @pytest.mark.parametrize(
+        "lo, hi, inclusive, expected_items",
+        [
+            (None, None, (True, True), list(range(0, 20, 2))),
+            (4, 10, (True, True), [4, 6, 8, 10]),
+            (4, 10, (False, False), [6, 8]),
+            (3, 9, (True, True), [4, 6, 8]),
+            (None, 5, (True, True), [0, 2, 4]),
+            (15, None, (True, True), [16, 18]),
+            (10, 4, (True, True), []),
+            (30, 40, (True, True), []),
+        ],
+    )
+    def test_irange(self, lo, hi, inclusive, expected_items):
+        sorted_list = SortedArrayList(range(0, 20, 2))
+        assert list(sorted_list.irange(lo, hi, inclusive)) == expected_items
+
+    def test_typed(self):
+        sorted_list = SortedArrayList([2.5, 1.0, 3.5], typecode="d")
+        sorted_list.add(2.0)
+        assert list(sorted_list) == [1.0, 2.0, 2.5, 3.5]
+        assert list(sorted_list.irange(2.0, 3.0)) == [2.0, 2.5]
+
+    def test_equal(self):
+        assert SortedArrayList([2, 1]) == SortedArrayList([1, 2])
+        with pytest.raises(TypeError):
+            _ = SortedArrayList([1]) == [1]